@@ -7,14 +7,116 @@ Farmore Analytics Module - Backup statistics, reporting, and insights.
 import json
 import os
 import subprocess
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
-@dataclass
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None  # type: ignore
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+# Read-only queries must not take .git/index.lock, start a pager or
+# fsmonitor, or pay for locale setup
+_GIT_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0", "GIT_PAGER": "cat", "LC_ALL": "C"}
+_GIT_BASE_ARGS = ("git", "--no-optional-locks", "-c", "core.fsmonitor=false")
+
+# File extension -> language, used for language statistics
+_LANGUAGE_MAP = {
+    ".py": "Python",
+    ".js": "JavaScript",
+    ".ts": "TypeScript",
+    ".jsx": "React JSX",
+    ".tsx": "React TSX",
+    ".java": "Java",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".c": "C",
+    ".cpp": "C++",
+    ".h": "C/C++ Header",
+    ".cs": "C#",
+    ".rb": "Ruby",
+    ".php": "PHP",
+    ".swift": "Swift",
+    ".kt": "Kotlin",
+    ".scala": "Scala",
+    ".r": "R",
+    ".sql": "SQL",
+    ".html": "HTML",
+    ".css": "CSS",
+    ".scss": "SCSS",
+    ".sass": "Sass",
+    ".less": "Less",
+    ".json": "JSON",
+    ".yaml": "YAML",
+    ".yml": "YAML",
+    ".xml": "XML",
+    ".md": "Markdown",
+    ".sh": "Shell",
+    ".bash": "Bash",
+    ".zsh": "Zsh",
+    ".ps1": "PowerShell",
+    ".dockerfile": "Dockerfile",
+}
+_LANGUAGE_EXTENSIONS = frozenset(_LANGUAGE_MAP)
+
+# Files inside a git directory whose mtimes change whenever a clone, fetch,
+# pull or checkout touches the repository
+_CACHE_KEY_FILES = ("HEAD", "index", "packed-refs", "FETCH_HEAD", "ORIG_HEAD", "logs/HEAD")
+
+# Dependency and build output directories left out of file/language counts
+_VENDORED_DIRS = frozenset({
+    "node_modules", "venv", "target", "dist", "build", "__pycache__", "vendor",
+})
+
+# Backup directory names that mark a repository category, by priority
+_CATEGORIES = ("private", "public", "starred", "watched", "forks", "organizations", "gists")
+_CATEGORY_SET = frozenset(_CATEGORIES)
+
+# Entries that identify a bare repository directory
+_BARE_REPO_MARKERS = frozenset({"HEAD", "objects", "refs"})
+
+
+def _file_contains(path: Path, needle: bytes, chunk_size: int = 65536) -> bool:
+    """Check whether a file contains a byte string, stopping at the first match."""
+    overlap = len(needle) - 1
+    tail = b""
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                window = tail + chunk
+                if needle in window:
+                    return True
+                tail = window[-overlap:] if overlap else b""
+    except OSError:
+        return False
+    return False
+
+
+@dataclass(slots=True)
 class RepositoryStats:
     """Statistics for a single repository."""
     
@@ -30,6 +132,7 @@ class RepositoryStats:
     is_bare: bool = False
     has_lfs: bool = False
     languages: dict[str, int] = field(default_factory=dict)
+    truncated: bool = False
     
     @property
     def size_mb(self) -> float:
@@ -57,10 +160,11 @@ class RepositoryStats:
             "is_bare": self.is_bare,
             "has_lfs": self.has_lfs,
             "languages": self.languages,
+            "truncated": self.truncated,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupStats:
     """Aggregate statistics for a backup directory."""
     
@@ -93,6 +197,12 @@ class BackupStats:
     
     def to_dict(self) -> dict:
         """Convert to dictionary."""
+        data = self.summary_dict()
+        data["repositories"] = [r.to_dict() for r in self.repositories]
+        return data
+
+    def summary_dict(self) -> dict:
+        """Convert everything except the per-repository list to a dictionary."""
         return {
             "path": str(self.path),
             "total_repositories": self.total_repositories,
@@ -105,11 +215,10 @@ class BackupStats:
             "categories": self.categories,
             "languages": self.languages,
             "analyzed_at": self.analyzed_at,
-            "repositories": [r.to_dict() for r in self.repositories],
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupHistory:
     """Historical record of backups."""
     
@@ -147,36 +256,86 @@ class BackupAnalytics:
     "Understanding your backups is the first step to protecting them." — schema.cx
     """
     
-    HISTORY_FILE = ".farmore_history.json"
+    HISTORY_FILE = ".farmore_history.jsonl"
+    LEGACY_HISTORY_FILE = ".farmore_history.json"
+    MAX_HISTORY = 100
+    STATS_CACHE_FILE = ".farmore_stats_cache.json"
+    MAX_WALK_FILES = 200_000
     
-    def __init__(self, backup_dir: Path | None = None):
-        """Initialize the analytics engine."""
+    def __init__(self, backup_dir: Path | None = None, use_cache: bool = True):
+        """
+        Initialize the analytics engine.
+
+        Args:
+            backup_dir: Backup directory holding history and the stats cache
+            use_cache: Reuse repository statistics from previous runs when the
+                repository has not changed since
+        """
         self.backup_dir = backup_dir or Path("backups")
+        self.use_cache = use_cache
         self._history: list[BackupHistory] = []
+        self._history_lines = 0
+        self._stats_cache: dict[str, dict[str, Any]] = {}
+        self._stats_cache_dirty = False
         self._load_history()
+        if use_cache:
+            self._load_stats_cache()
     
     def _load_history(self) -> None:
-        """Load backup history from disk."""
+        """Load backup history from disk (one JSON record per line)."""
         history_path = self.backup_dir / self.HISTORY_FILE
-        if history_path.exists():
+        if not history_path.exists():
+            self._load_legacy_history()
+            return
+
+        recent: deque[BackupHistory] = deque(maxlen=self.MAX_HISTORY)
+        lines = 0
+        with open(history_path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                lines += 1
+                try:
+                    data = _json_loads(line)
+                    recent.append(BackupHistory(**data))
+                except (json.JSONDecodeError, TypeError):
+                    # A torn or foreign line must not hide the rest
+                    continue
+        self._history = list(recent)
+        self._history_lines = lines
+
+    def _load_legacy_history(self) -> None:
+        """Load history written by older versions as a single JSON document."""
+        legacy_path = self.backup_dir / self.LEGACY_HISTORY_FILE
+        if legacy_path.exists():
             try:
-                data = json.loads(history_path.read_text())
+                data = _json_loads(legacy_path.read_bytes())
                 self._history = [
                     BackupHistory(**h) for h in data.get("history", [])
-                ]
+                ][-self.MAX_HISTORY:]
             except (json.JSONDecodeError, TypeError):
                 self._history = []
     
+    @staticmethod
+    def _history_line(history: BackupHistory) -> bytes:
+        """Serialize one history record as a JSON line."""
+        return _json_dumps(history.to_dict()) + b"\n"
+
     def _save_history(self) -> None:
-        """Save backup history to disk."""
+        """Rewrite the history file with the retained entries."""
         history_path = self.backup_dir / self.HISTORY_FILE
         history_path.parent.mkdir(parents=True, exist_ok=True)
-        data = {
-            "version": "1.0",
-            "updated_at": datetime.now().isoformat(),
-            "history": [h.to_dict() for h in self._history],
-        }
-        history_path.write_text(json.dumps(data, indent=2))
+        history_path.write_bytes(b"".join(self._history_line(h) for h in self._history))
+        self._history_lines = len(self._history)
+
+    def _append_history(self, history: BackupHistory) -> None:
+        """Append a single record to the history file."""
+        history_path = self.backup_dir / self.HISTORY_FILE
+        with open(history_path, "ab") as f:
+            f.write(self._history_line(history))
+            f.flush()
+            os.fsync(f.fileno())
+        self._history_lines += 1
     
     def record_backup(
         self,
@@ -207,18 +366,81 @@ class BackupAnalytics:
         self._history.append(history)
         
         # Keep last 100 entries
-        if len(self._history) > 100:
-            self._history = self._history[-100:]
+        if len(self._history) > self.MAX_HISTORY:
+            self._history = self._history[-self.MAX_HISTORY:]
         
-        self._save_history()
+        # Append in O(1); compact only once the file holds twice the cap.
+        # A missing file (first run or legacy JSON) gets a full write.
+        history_path = self.backup_dir / self.HISTORY_FILE
+        if history_path.exists() and self._history_lines < 2 * self.MAX_HISTORY:
+            self._append_history(history)
+        else:
+            self._save_history()
         return history
     
+    def _load_stats_cache(self) -> None:
+        """Load cached repository statistics from disk."""
+        cache_path = self.backup_dir / self.STATS_CACHE_FILE
+        if cache_path.exists():
+            try:
+                data = _json_loads(cache_path.read_bytes())
+                self._stats_cache = data.get("repositories", {})
+            except (json.JSONDecodeError, AttributeError, OSError):
+                self._stats_cache = {}
+
+    def _save_stats_cache(self) -> None:
+        """Save cached repository statistics, dropping vanished repositories."""
+        if not self._stats_cache_dirty or not self.backup_dir.is_dir():
+            return
+        repositories = {
+            path: entry for path, entry in self._stats_cache.items() if os.path.isdir(path)
+        }
+        data = {"version": "1.0", "repositories": repositories}
+        try:
+            (self.backup_dir / self.STATS_CACHE_FILE).write_bytes(_json_dumps(data))
+        except OSError:
+            return
+        self._stats_cache = repositories
+        self._stats_cache_dirty = False
+
+    @staticmethod
+    def _stats_cache_key(repo_path: Path, git_dir: Path) -> list[int] | None:
+        """Fingerprint a repository's state from a handful of mtimes."""
+        if not git_dir.is_dir():
+            # .git file (worktree/submodule): state lives elsewhere
+            return None
+        key = []
+        for target in (repo_path, *(git_dir / name for name in _CACHE_KEY_FILES)):
+            try:
+                key.append(os.stat(target).st_mtime_ns)
+            except OSError:
+                key.append(0)
+        return key
+
+    @staticmethod
+    def _stats_from_dict(data: dict[str, Any]) -> RepositoryStats:
+        """Rebuild repository statistics from their to_dict() form."""
+        fields = {k: v for k, v in data.items() if k != "size_mb"}
+        fields["path"] = Path(fields["path"])
+        return RepositoryStats(**fields)
+
     def get_history(self, limit: int = 20) -> list[BackupHistory]:
         """Get recent backup history."""
         return self._history[-limit:]
     
-    def analyze_repository(self, repo_path: Path) -> RepositoryStats:
-        """Analyze a single repository and return statistics."""
+    def analyze_repository(
+        self,
+        repo_path: Path,
+        max_files: int | None = MAX_WALK_FILES,
+    ) -> RepositoryStats:
+        """
+        Analyze a single repository and return statistics.
+
+        Args:
+            repo_path: Repository (working tree or bare) to analyze
+            max_files: Stop walking the repository after this many files and
+                mark the stats as truncated; None walks everything
+        """
         stats = RepositoryStats(
             name=repo_path.name,
             path=repo_path,
@@ -234,96 +456,187 @@ class BackupAnalytics:
             # Not a git repository
             return stats
         
-        # Calculate size
-        stats.size_bytes = self._get_directory_size(repo_path)
+        cache_key = self._stats_cache_key(repo_path, git_dir) if self.use_cache else None
+        if cache_key is not None:
+            cached = self._stats_cache.get(str(repo_path))
+            # Complete stats answer any max_files; truncated ones only the
+            # limit they were walked with
+            if (
+                cached is not None
+                and cached.get("key") == cache_key
+                and (
+                    not cached.get("stats", {}).get("truncated")
+                    or cached.get("max_files") == max_files
+                )
+            ):
+                try:
+                    return self._stats_from_dict(cached["stats"])
+                except (KeyError, TypeError):
+                    pass
+
+        if stats.is_bare:
+            # Bare repos are all object store: ask git for the pack sizes
+            # instead of stat()ing every file
+            size_bytes = self._git_object_size(repo_path)
+            if size_bytes is None:
+                size_bytes, _, _, stats.truncated = self._walk_repo(
+                    repo_path, max_files=max_files
+                )
+            stats.size_bytes = size_bytes
+        else:
+            # Size, file count and languages in a single directory walk
+            (
+                stats.size_bytes,
+                stats.file_count,
+                stats.languages,
+                stats.truncated,
+            ) = self._walk_repo(repo_path, max_files=max_files)
+
+        # Get git statistics, in-process when pygit2 is available
+        if pygit2 is None or not self._git_stats_pygit2(git_dir, stats):
+            self._git_stats_subprocess(repo_path, stats)
         
-        # Count files (for non-bare repos)
-        if not stats.is_bare:
-            stats.file_count = self._count_files(repo_path)
+        # Check for LFS
+        stats.has_lfs = _file_contains(repo_path / ".gitattributes", b"filter=lfs")
         
-        # Get git statistics
+        # Last backup date (file modification time)
         try:
-            # Commit count
-            result = subprocess.run(
-                ["git", "rev-list", "--count", "HEAD"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode == 0:
-                stats.commit_count = int(result.stdout.strip())
-        except (subprocess.TimeoutExpired, ValueError):
+            mtime = repo_path.stat().st_mtime
+            stats.last_backup_date = datetime.fromtimestamp(mtime).isoformat()
+        except OSError:
             pass
         
-        try:
-            # Branch count
-            result = subprocess.run(
-                ["git", "branch", "-a"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode == 0:
-                stats.branch_count = len([
-                    b for b in result.stdout.strip().split("\n") 
-                    if b.strip() and not b.strip().startswith("->")
-                ])
-        except subprocess.TimeoutExpired:
-            pass
+        if cache_key is not None:
+            self._stats_cache[str(repo_path)] = {
+                "key": cache_key,
+                "max_files": max_files,
+                "stats": stats.to_dict(),
+            }
+            self._stats_cache_dirty = True
         
+        return stats
+
+    def _git_stats_pygit2(self, git_dir: Path, stats: RepositoryStats) -> bool:
+        """Fill in git statistics, reading refs with libgit2; return False to fall back."""
         try:
-            # Tag count
-            result = subprocess.run(
-                ["git", "tag"],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode == 0:
-                stats.tag_count = len([t for t in result.stdout.strip().split("\n") if t.strip()])
-        except subprocess.TimeoutExpired:
-            pass
-        
+            repo = pygit2.Repository(str(git_dir))
+            branch_count = 0
+            tag_count = 0
+            for name in repo.references:
+                if name.startswith("refs/tags/"):
+                    tag_count += 1
+                elif name.startswith(("refs/heads/", "refs/remotes/")):
+                    # Symbolic refs (origin/HEAD) point at a name, not an oid
+                    if not isinstance(repo.lookup_reference(name).target, str):
+                        branch_count += 1
+
+            last_commit_date = None
+            if not repo.head_is_unborn:
+                head = repo.head.peel(pygit2.Commit)
+                offset = timezone(timedelta(minutes=head.commit_time_offset))
+                last_commit_date = datetime.fromtimestamp(head.commit_time, offset).strftime(
+                    "%Y-%m-%d %H:%M:%S %z"
+                )
+        except (pygit2.GitError, KeyError, ValueError):
+            return False
+
+        stats.branch_count = branch_count
+        stats.tag_count = tag_count
+        stats.last_commit_date = last_commit_date
+        if last_commit_date is not None:
+            # Counting means walking all history, which rev-list does far
+            # faster than a Python loop over repo.walk()
+            count = self._run_git(git_dir, "rev-list", "--count", "HEAD")
+            if count is not None:
+                try:
+                    stats.commit_count = int(count.strip())
+                except ValueError:
+                    pass
+        return True
+
+    def _git_stats_subprocess(self, repo_path: Path, stats: RepositoryStats) -> None:
+        """Fill in git statistics with one ref listing and one commit count."""
+        refs = self._run_git(
+            repo_path,
+            "for-each-ref",
+            "--format=%(HEAD)%00%(refname)%00%(symref)%00%(committerdate:iso)",
+            "refs/heads",
+            "refs/remotes",
+            "refs/tags",
+        )
+        if refs is not None:
+            for line in refs.splitlines():
+                fields = line.split("\0")
+                if len(fields) != 4:
+                    continue
+                head, refname, symref, commit_date = fields
+                if refname.startswith("refs/tags/"):
+                    stats.tag_count += 1
+                elif not symref:
+                    stats.branch_count += 1
+                    if head == "*" and commit_date:
+                        stats.last_commit_date = commit_date
+
+        count = self._run_git(repo_path, "rev-list", "--count", "HEAD")
+        if count is not None:
+            try:
+                stats.commit_count = int(count.strip())
+            except ValueError:
+                pass
+
+        if stats.last_commit_date is None and stats.commit_count:
+            # Detached HEAD is not marked in the ref listing
+            last_commit = self._run_git(repo_path, "log", "-1", "--format=%ci")
+            if last_commit and last_commit.strip():
+                stats.last_commit_date = last_commit.strip()
+
+    def _git_object_size(self, repo_path: Path) -> int | None:
+        """Get the on-disk size of a repository's objects from count-objects."""
+        output = self._run_git(repo_path, "count-objects", "-v")
+        if output is None:
+            return None
+
+        size_kib = 0
+        found = False
+        for line in output.splitlines():
+            key, _, value = line.partition(":")
+            if key in ("size", "size-pack", "size-garbage"):
+                try:
+                    size_kib += int(value.strip())
+                    found = True
+                except ValueError:
+                    return None
+        return size_kib * 1024 if found else None
+
+    def _run_git(self, repo_path: Path, *args: str) -> str | None:
+        """Run a read-only git command in a repository and return its output."""
         try:
-            # Last commit date
             result = subprocess.run(
-                ["git", "log", "-1", "--format=%ci"],
-                cwd=repo_path,
+                [*_GIT_BASE_ARGS, "-C", str(repo_path), *args],
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 timeout=30,
+                env=_GIT_ENV,
             )
-            if result.returncode == 0 and result.stdout.strip():
-                stats.last_commit_date = result.stdout.strip()
-        except subprocess.TimeoutExpired:
-            pass
-        
-        # Check for LFS
-        lfs_config = repo_path / ".lfsconfig" if not stats.is_bare else git_dir / "lfs"
-        if lfs_config.exists() or (repo_path / ".gitattributes").exists():
-            gitattributes = repo_path / ".gitattributes"
-            if gitattributes.exists():
-                content = gitattributes.read_text()
-                stats.has_lfs = "filter=lfs" in content
-        
-        # Get language statistics (for non-bare repos)
-        if not stats.is_bare:
-            stats.languages = self._analyze_languages(repo_path)
-        
-        # Last backup date (file modification time)
-        try:
-            mtime = repo_path.stat().st_mtime
-            stats.last_backup_date = datetime.fromtimestamp(mtime).isoformat()
-        except OSError:
-            pass
-        
-        return stats
+        except (subprocess.SubprocessError, FileNotFoundError):
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout
     
-    def analyze_directory(self, path: Path | None = None) -> BackupStats:
-        """Analyze an entire backup directory."""
+    def analyze_directory(
+        self,
+        path: Path | None = None,
+        max_workers: int | None = None,
+        max_files: int | None = MAX_WALK_FILES,
+    ) -> BackupStats:
+        """
+        Analyze an entire backup directory.
+
+        Repositories are analyzed concurrently; the work is dominated by git
+        subprocesses and filesystem calls, which release the GIL.
+        """
         path = path or self.backup_dir
         
         stats = BackupStats(path=path)
@@ -331,19 +644,30 @@ class BackupAnalytics:
         # Find all git repositories
         repos = self._find_repositories(path)
         
-        for repo_path in repos:
-            repo_stats = self.analyze_repository(repo_path)
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = list(executor.map(
+                lambda repo_path: self.analyze_repository(repo_path, max_files=max_files),
+                repos,
+            ))
+
+        languages: Counter[str] = Counter()
+        for repo_stats in results:
             stats.repositories.append(repo_stats)
             stats.total_size_bytes += repo_stats.size_bytes
             stats.total_files += repo_stats.file_count
             stats.total_commits += repo_stats.commit_count
             
-            # Aggregate languages
-            for lang, count in repo_stats.languages.items():
-                stats.languages[lang] = stats.languages.get(lang, 0) + count
+            languages.update(repo_stats.languages)
         
+        stats.languages = dict(languages)
         stats.total_repositories = len(repos)
         
+        if self.use_cache:
+            self._save_stats_cache()
+
         # Categorize repositories
         stats.categories = self._categorize_repositories(repos)
         
@@ -353,128 +677,152 @@ class BackupAnalytics:
         """Find all git repositories in a directory."""
         repos = []
         
-        for root, dirs, files in os.walk(path):
-            root_path = Path(root)
-            
-            # Check for regular git repo
-            if ".git" in dirs:
-                repos.append(root_path)
-                dirs.remove(".git")  # Don't recurse into .git
-                dirs[:] = []  # Don't recurse into subdirectories of a repo
+        stack = [os.fspath(path)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError:
                 continue
             
-            # Check for bare repo
-            if "HEAD" in files and "objects" in dirs and "refs" in dirs:
-                repos.append(root_path)
-                dirs[:] = []  # Don't recurse into subdirectories
+            names = {entry.name for entry in entries}
+
+            # Regular (".git") or bare (HEAD/objects/refs) repository;
+            # either way, don't recurse into it
+            if ".git" in names or _BARE_REPO_MARKERS <= names:
+                repos.append(Path(current))
                 continue
+
+            for entry in reversed(entries):
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                except OSError:
+                    pass
         
         return repos
     
+    def _walk_repo(
+        self,
+        path: Path,
+        max_files: int | None = None,
+    ) -> tuple[int, int, dict[str, int], bool]:
+        """
+        Walk a repository once.
+
+        The size covers every file, git metadata included; file and language
+        counts skip hidden files and anything below a hidden or vendored
+        directory (node_modules, build output, ...). The walk stops after
+        max_files files, in which case the returned truncated flag is True.
+
+        Returns:
+            Tuple of (size_bytes, file_count, languages, truncated)
+        """
+        total_size = 0
+        file_count = 0
+        files_seen = 0
+        languages: defaultdict[str, int] = defaultdict(int)
+
+        stack = [(os.fspath(path), False)]
+        while stack:
+            current, excluded = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        name = entry.name
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append((
+                                    entry.path,
+                                    excluded or name.startswith(".") or name in _VENDORED_DIRS,
+                                ))
+                                continue
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                            if max_files is not None and files_seen >= max_files:
+                                return total_size, file_count, dict(languages), True
+                            files_seen += 1
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+
+                        if excluded or name.startswith("."):
+                            continue
+                        file_count += 1
+                        dot = name.rfind(".")
+                        if dot <= 0:
+                            continue
+                        ext = name[dot:].lower()
+                        if ext in _LANGUAGE_EXTENSIONS:
+                            languages[_LANGUAGE_MAP[ext]] += 1
+            except OSError:
+                pass
+
+        return total_size, file_count, dict(languages), False
+
     def _get_directory_size(self, path: Path) -> int:
         """Calculate total size of a directory in bytes."""
-        total = 0
-        try:
-            for entry in path.rglob("*"):
-                if entry.is_file():
-                    try:
-                        total += entry.stat().st_size
-                    except OSError:
-                        pass
-        except OSError:
-            pass
-        return total
+        return self._walk_repo(path)[0]
     
     def _count_files(self, path: Path) -> int:
         """Count non-hidden files in a directory."""
-        count = 0
-        try:
-            for entry in path.rglob("*"):
-                if entry.is_file() and not any(p.startswith(".") for p in entry.parts):
-                    count += 1
-        except OSError:
-            pass
-        return count
+        return self._walk_repo(path)[1]
     
     def _analyze_languages(self, path: Path) -> dict[str, int]:
         """Analyze language distribution in a repository."""
-        extensions: defaultdict[str, int] = defaultdict(int)
-        
-        language_map = {
-            ".py": "Python",
-            ".js": "JavaScript",
-            ".ts": "TypeScript",
-            ".jsx": "React JSX",
-            ".tsx": "React TSX",
-            ".java": "Java",
-            ".go": "Go",
-            ".rs": "Rust",
-            ".c": "C",
-            ".cpp": "C++",
-            ".h": "C/C++ Header",
-            ".cs": "C#",
-            ".rb": "Ruby",
-            ".php": "PHP",
-            ".swift": "Swift",
-            ".kt": "Kotlin",
-            ".scala": "Scala",
-            ".r": "R",
-            ".sql": "SQL",
-            ".html": "HTML",
-            ".css": "CSS",
-            ".scss": "SCSS",
-            ".sass": "Sass",
-            ".less": "Less",
-            ".json": "JSON",
-            ".yaml": "YAML",
-            ".yml": "YAML",
-            ".xml": "XML",
-            ".md": "Markdown",
-            ".sh": "Shell",
-            ".bash": "Bash",
-            ".zsh": "Zsh",
-            ".ps1": "PowerShell",
-            ".dockerfile": "Dockerfile",
-        }
-        
-        try:
-            for entry in path.rglob("*"):
-                if entry.is_file() and not any(p.startswith(".") for p in entry.parts):
-                    ext = entry.suffix.lower()
-                    if ext in language_map:
-                        extensions[language_map[ext]] += 1
-        except OSError:
-            pass
-        
-        return dict(extensions)
+        return self._walk_repo(path)[2]
     
     def _categorize_repositories(self, repos: list[Path]) -> dict[str, int]:
         """Categorize repositories by directory structure."""
         categories: dict[str, int] = defaultdict(int)
         
         for repo_path in repos:
-            # Look for category indicators in path
-            parts = repo_path.parts
-            
-            if "private" in parts:
-                categories["private"] += 1
-            elif "public" in parts:
-                categories["public"] += 1
-            elif "starred" in parts:
-                categories["starred"] += 1
-            elif "watched" in parts:
-                categories["watched"] += 1
-            elif "forks" in parts:
-                categories["forks"] += 1
-            elif "organizations" in parts:
-                categories["organizations"] += 1
-            elif "gists" in parts:
-                categories["gists"] += 1
-            else:
-                categories["other"] += 1
+            # Look for category indicators in path; earlier categories win
+            hits = _CATEGORY_SET.intersection(repo_path.parts)
+            category = next((c for c in _CATEGORIES if c in hits), "other") if hits else "other"
+            categories[category] += 1
         
         return dict(categories)
     
+    def _iter_json_report(self, stats: BackupStats) -> Iterator[bytes]:
+        """
+        Yield a JSON report in chunks, one repository per line.
+
+        Repositories are serialized one at a time instead of first building
+        the full to_dict() list.
+        """
+        if orjson is not None:
+            summary = orjson.dumps(stats.summary_dict(), option=orjson.OPT_INDENT_2)
+        else:
+            summary = json.dumps(stats.summary_dict(), indent=2).encode()
+
+        # Reopen the summary object to append the repository list
+        yield summary[: summary.rindex(b"}")].rstrip()
+        yield b',\n  "repositories": ['
+        separator = b"\n    "
+        for repo in stats.repositories:
+            yield separator
+            yield _json_dumps(repo.to_dict())
+            separator = b",\n    "
+        yield b"\n  ]\n}" if stats.repositories else b"]\n}"
+
+    def write_report(
+        self,
+        output: Path,
+        path: Path | None = None,
+        format: str = "text",
+    ) -> None:
+        """Generate a backup report and write it to a file."""
+        if format != "json":
+            output.write_text(self.generate_report(path, format=format))
+            return
+
+        stats = self.analyze_directory(path)
+        with open(output, "wb") as f:
+            for chunk in self._iter_json_report(stats):
+                f.write(chunk)
+
     def generate_report(
         self,
         path: Path | None = None,
@@ -484,7 +832,7 @@ class BackupAnalytics:
         stats = self.analyze_directory(path)
         
         if format == "json":
-            return json.dumps(stats.to_dict(), indent=2)
+            return b"".join(self._iter_json_report(stats)).decode()
         
         if format == "yaml":
             import yaml
@@ -535,7 +883,8 @@ class BackupAnalytics:
             ])
             top_repos = sorted(stats.repositories, key=lambda x: -x.size_bytes)[:10]
             for repo in top_repos:
-                lines.append(f"  {repo.name}: {repo.size_mb:.2f} MB")
+                suffix = " (partial scan)" if repo.truncated else ""
+                lines.append(f"  {repo.name}: {repo.size_mb:.2f} MB{suffix}")
         
         lines.extend(["", "=" * 60])
         
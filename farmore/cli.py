@@ -5,11 +5,22 @@ Farmore CLI interface.
 """
 
 import json
+import os
+import random
+import re
+import shutil
 import subprocess
 import sys
+import threading
+import time
 import traceback
-from datetime import datetime
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO
 
 import requests
 import typer
@@ -18,9 +29,10 @@ from dotenv import load_dotenv
 from rich.table import Table
 
 from .git_utils import GitOperations
-from .github_api import GitHubAPIClient
+from .github_api import GitHubAPIClient, GitHubAPIError
 from .mirror import MirrorOrchestrator
-from .models import Config, RepositoryCategory, TargetType, Visibility
+from .models import Config, Repository, RepositoryCategory, TargetType, Visibility
+from .response_cache import ResponseCache
 from .rich_utils import (
     console,
     print_error,
@@ -30,6 +42,16 @@ from .rich_utils import (
 )
 from .validation import validate_repository_format as _validate_repo_format
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None  # type: ignore
+
 # Load environment variables from .env file if it exists
 # "Configuration is just organized secrets." — schema.cx
 load_dotenv()
@@ -68,6 +90,9 @@ def get_default_secrets_dest(owner: str, repo: str, format: str = "json") -> Pat
     return Path("backups") / owner / "data" / "secrets" / f"{owner}_{repo}_secrets.{format}"
 
 
+# The per-repository export paths are requested several times per repository
+# on large runs; Path objects are immutable, so they are safe to share
+@lru_cache(maxsize=4096)
 def get_default_issues_dest(owner: str, repo: str, format: str = "json") -> Path:
     """
     Get the default destination path for issues export.
@@ -77,6 +102,7 @@ def get_default_issues_dest(owner: str, repo: str, format: str = "json") -> Path
     return Path("backups") / owner / "data" / "issues" / f"{owner}_{repo}_issues.{format}"
 
 
+@lru_cache(maxsize=4096)
 def get_default_pulls_dest(owner: str, repo: str, format: str = "json") -> Path:
     """
     Get the default destination path for pull requests export.
@@ -86,6 +112,7 @@ def get_default_pulls_dest(owner: str, repo: str, format: str = "json") -> Path:
     return Path("backups") / owner / "data" / "pulls" / f"{owner}_{repo}_pulls.{format}"
 
 
+@lru_cache(maxsize=4096)
 def get_default_workflows_dest(owner: str, repo: str) -> Path:
     """
     Get the default destination path for workflows backup.
@@ -95,6 +122,7 @@ def get_default_workflows_dest(owner: str, repo: str) -> Path:
     return Path("backups") / owner / "data" / "workflows" / f"{owner}_{repo}"
 
 
+@lru_cache(maxsize=4096)
 def get_default_releases_dest(owner: str, repo: str) -> Path:
     """
     Get the default destination path for releases backup.
@@ -104,6 +132,7 @@ def get_default_releases_dest(owner: str, repo: str) -> Path:
     return Path("backups") / owner / "data" / "releases" / f"{owner}_{repo}"
 
 
+@lru_cache(maxsize=4096)
 def get_default_wiki_dest(owner: str, repo: str) -> Path:
     """
     Get the default destination path for wiki backup.
@@ -113,6 +142,31 @@ def get_default_wiki_dest(owner: str, repo: str) -> Path:
     return Path("backups") / owner / "data" / "wikis" / f"{owner}_{repo}.wiki"
 
 
+def get_failed_exports_path(dest: Path) -> Path:
+    """
+    Get the path of the record of export steps that failed under a backup root.
+
+    Returns: <dest>/.cache/failed_exports.json
+    """
+    return dest / ".cache" / "failed_exports.json"
+
+
+def _load_failed_exports(path: Path) -> list[dict[str, str]]:
+    """Read a failed-exports record, treating a missing or corrupt one as empty."""
+    try:
+        entries = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return []
+    if not isinstance(entries, list):
+        return []
+    return [e for e in entries if isinstance(e, dict) and "repository" in e and "stage" in e]
+
+
+# Patterns for sanitize_query_for_dirname(), compiled once at import
+_DIRNAME_UNSAFE_RE = re.compile(r"[^a-z0-9\-_]")
+_DIRNAME_DASHES_RE = re.compile(r"-+")
+
+
 def sanitize_query_for_dirname(query: str, max_length: int = 50) -> str:
     """
     Sanitize a search query string for use as a directory name.
@@ -129,8 +183,6 @@ def sanitize_query_for_dirname(query: str, max_length: int = 50) -> str:
         "Python CLI tools!" -> "python-cli-tools"
         "awesome-python" -> "awesome-python"
     """
-    import re
-
     # Convert to lowercase
     sanitized = query.lower()
 
@@ -138,10 +190,10 @@ def sanitize_query_for_dirname(query: str, max_length: int = 50) -> str:
     sanitized = sanitized.replace(" ", "-")
 
     # Remove special characters (keep only alphanumeric, hyphens, and underscores)
-    sanitized = re.sub(r"[^a-z0-9\-_]", "", sanitized)
+    sanitized = _DIRNAME_UNSAFE_RE.sub("", sanitized)
 
     # Replace multiple consecutive hyphens with a single hyphen
-    sanitized = re.sub(r"-+", "-", sanitized)
+    sanitized = _DIRNAME_DASHES_RE.sub("-", sanitized)
 
     # Remove leading/trailing hyphens
     sanitized = sanitized.strip("-")
@@ -181,6 +233,108 @@ def validate_repository_format(repository: str) -> tuple[str, str]:
         raise ValueError(str(e)) from e
 
 
+# libyaml's emitter when PyYAML was built with it; output is the same
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Export stages in the order _export_single_repository_data runs them
+_EXPORT_STAGES = ("issues", "pull_requests", "workflows", "releases")
+
+# Exports are written through a 1 MiB buffer so large documents reach the
+# disk in a few big writes instead of many 8 KiB ones
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+@contextmanager
+def _open_export(dest: Path) -> Iterator[BinaryIO]:
+    """
+    Open a buffered binary file that replaces dest only once fully written.
+
+    Output goes to a sibling ``.tmp`` file that is renamed over dest on
+    success and removed on error, so an interrupted export never leaves a
+    truncated document behind.
+    """
+    tmp = dest.with_name(dest.name + ".tmp")
+    try:
+        with open(tmp, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            yield f
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _json_bytes(obj: object, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        # Non-str keys are accepted so output matches what json.dumps allows
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode()
+
+
+def _write_json(dest: Path, obj: object) -> None:
+    """Write obj to dest as indented UTF-8 JSON."""
+    with _open_export(dest) as f:
+        f.write(_json_bytes(obj, indent=True))
+
+
+def _write_yaml(dest: Path, obj: object, **options: object) -> None:
+    """Write obj to dest as block-style UTF-8 YAML; options go to yaml.dump."""
+    with _open_export(dest) as f:
+        yaml.dump(obj, f, Dumper=_YAML_DUMPER, default_flow_style=False, encoding="utf-8", **options)
+
+
+def _write_json_export(dest: Path, header: dict, key: str, items: Iterable[dict]) -> None:
+    """
+    Write ``{**header, key: items}`` to dest without building the document.
+
+    The header is pretty-printed and each item is written compactly on its own
+    line as it is serialized, so peak memory stays at one item. ``items`` may
+    be a generator.
+    """
+    head = _json_bytes(header, indent=True)
+    with _open_export(dest) as f:
+        # Reopen the header object to append the item list
+        f.write(head[: head.rindex(b"}")].rstrip())
+        f.write(b",\n  " + _json_bytes(key) + b": [")
+        separator = b"\n    "
+        for item in items:
+            f.write(separator)
+            f.write(_json_bytes(item))
+            separator = b",\n    "
+        f.write(b"]\n}" if separator == b"\n    " else b"\n  ]\n}")
+
+
+def _write_yaml_export(
+    dest: Path, header: dict, key: str, items: Iterable[dict], **options: object
+) -> None:
+    """
+    Write ``{**header, key: items}`` to dest as YAML, one item at a time.
+
+    The output matches yaml.dump of the whole mapping with sort_keys=False:
+    block sequences under a mapping key are not indented, so each item can be
+    emitted as its own one-element list.
+    """
+    dump_options = {
+        "Dumper": _YAML_DUMPER,
+        "default_flow_style": False,
+        "encoding": "utf-8",
+        "sort_keys": False,
+        **options,
+    }
+    with _open_export(dest) as f:
+        yaml.dump(header, f, **dump_options)
+        f.write(yaml.dump(key, **dump_options).split(b"\n", 1)[0] + b":")
+        empty = True
+        for item in items:
+            if empty:
+                f.write(b"\n")
+                empty = False
+            yaml.dump([item], f, **dump_options)
+        if empty:
+            f.write(b" []\n")
+
+
 def export_repository_data(
     client: GitHubAPIClient,
     repos: list,
@@ -191,160 +345,541 @@ def export_repository_data(
     include_releases: bool,
     include_wikis: bool,
     token: str | None,
+    max_workers: int = 1,
+    max_concurrent_exports: int | None = None,
+    failures_path: Path | None = None,
+    only: dict[str, set[str]] | None = None,
 ) -> None:
     """
     Export additional repository data (issues, PRs, workflows, releases, wikis).
 
     "Data without backups is just temporary data." — schema.cx
+
+    Repositories are exported concurrently when max_workers is above one.
+    Each in-flight export holds a repository's issues, PRs and workflow files
+    in memory, so max_concurrent_exports (never more than max_workers) caps
+    how many run at once. GraphQL prefetching goes batch by batch with
+    batches of that same size, so prefetched data for at most that many
+    repositories is held at a time. Wiki syncs are plain git and use
+    max_workers. In dry-run mode nothing is fetched; the planned exports are
+    only listed.
+
+    Steps that still fail are recorded in ``failures_path`` (default:
+    get_failed_exports_path(Path("backups"))), replacing earlier entries for
+    the repositories in this run and keeping those for any others. ``only``
+    maps a repository's full name to the stages to run for it, as
+    _retry_failed_exports() does from that record; stages are "issues",
+    "pull_requests", "workflows", "releases" and "wiki".
     """
-    if not any([include_issues, include_pulls, include_workflows, include_releases, include_wikis]):
+    kinds = [
+        kind
+        for kind, wanted in (
+            ("issues", include_issues),
+            ("pull requests", include_pulls),
+            ("workflows", include_workflows),
+            ("releases", include_releases),
+            ("wiki", include_wikis),
+        )
+        if wanted
+    ]
+    if not kinds:
+        return
+
+    if client.config.dry_run:
+        console.print(f"\n📊 Would export additional repository data ({', '.join(kinds)}) for:")
+        for repo in repos:
+            console.print(f"   [yellow]EXPORT[/yellow]   {repo.full_name}")
         return
 
     console.print(f"\n📊 Exporting additional repository data...")
 
-    for repo in repos:
-        owner = repo.owner
-        repo_name = repo.name
+    # Category directories are shared by all of an owner's repositories, so
+    # create them once here rather than once per repository
+    category_dests = [
+        dest_for
+        for wanted, dest_for in (
+            (include_issues, get_default_issues_dest),
+            (include_pulls, get_default_pulls_dest),
+            (include_workflows, get_default_workflows_dest),
+            (include_releases, get_default_releases_dest),
+            (include_wikis, get_default_wiki_dest),
+        )
+        if wanted
+    ]
+    for owner, repo_name in {repo.owner: repo.name for repo in repos}.items():
+        for dest_for in category_dests:
+            dest_for(owner, repo_name).parent.mkdir(parents=True, exist_ok=True)
+
+    # One timestamp for the whole run, so every file agrees on when it happened
+    exported_at = datetime.now(tz=timezone.utc).isoformat()
+    failures: list[dict[str, str]] = []
+
+    # Each repository is independent network/subprocess work; Rich's console
+    # serializes the progress lines printed from worker threads
+    export_workers = max(1, min(max_workers, max_concurrent_exports or max_workers))
+
+    # With a token, issues, PRs and releases come from batched GraphQL queries
+    # instead of several REST calls per repository. A batch is only fetched
+    # once the previous one is written, and is no larger than the number of
+    # concurrent exports, so prefetched data stays within that memory bound.
+    use_graphql = bool(client.config.token) and any([include_issues, include_pulls, include_releases])
+    batch_size = min(export_workers, 20) if use_graphql else max(1, len(repos))
+
+    # Wiki syncs use git against github.com while exports wait on the API, so
+    # each repository's wiki starts in its own pool before that repository's
+    # API export, and the two overlap; all wikis are joined at the end
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as wiki_pool:
+        wiki_futures: dict[Future[str | None], tuple[str, str]] = {}
+        wiki_lock = threading.Lock()
+
+        def export_one(repo: Repository, prefetched: dict[str, list[dict]] | None) -> None:
+            stages = None if only is None else only.get(repo.full_name, set())
+
+            def wanted(stage: str, included: bool) -> bool:
+                return included and (stages is None or stage in stages)
+
+            if wanted("wiki", include_wikis) and client.check_wiki_exists(repo.owner, repo.name):
+                future = wiki_pool.submit(_sync_wiki, repo.owner, repo.name, token)
+                with wiki_lock:
+                    wiki_futures[future] = (repo.owner, repo.name)
+            _export_single_repository_data(
+                client,
+                repo,
+                prefetched=prefetched,
+                exported_at=exported_at,
+                failures=failures,
+                include_issues=wanted("issues", include_issues),
+                include_pulls=wanted("pull_requests", include_pulls),
+                include_workflows=wanted("workflows", include_workflows),
+                include_releases=wanted("releases", include_releases),
+            )
 
-        try:
-            # Export issues
-            if include_issues:
-                dest = get_default_issues_dest(owner, repo_name, "json")
-                dest.parent.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=export_workers) as executor:
+            for offset in range(0, len(repos), batch_size):
+                batch = repos[offset : offset + batch_size]
+                prefetched: dict[str, dict[str, list[dict]]] = {}
+                if use_graphql:
+                    try:
+                        prefetched = client.graphql_bulk_export(
+                            batch,
+                            include_issues=include_issues,
+                            include_pulls=include_pulls,
+                            include_releases=include_releases,
+                            batch_size=batch_size,
+                        )
+                    except GitHubAPIError as e:
+                        console.print(
+                            f"   [yellow]⚠️  GraphQL export unavailable, falling back to REST: {e}[/yellow]"
+                        )
+                        use_graphql = False
+
+                if export_workers <= 1 or len(batch) <= 1:
+                    for repo in batch:
+                        export_one(repo, prefetched.pop(repo.full_name, None))
+                    continue
+                futures = [
+                    executor.submit(export_one, repo, prefetched.pop(repo.full_name, None))
+                    for repo in batch
+                ]
+                del prefetched
+                for future in as_completed(futures):
+                    future.result()
+
+        wiki_errors = [(wiki, future.result()) for future, wiki in wiki_futures.items()]
+
+    for (owner, repo_name), error in wiki_errors:
+        if error is not None:
+            failures.append({"repository": f"{owner}/{repo_name}", "stage": "wiki", "error": error})
+
+    # Record what still failed after retries, so --retry-failed can rerun it.
+    # Entries for repositories outside this run are left for their own runs.
+    if failures_path is None:
+        failures_path = get_failed_exports_path(Path("backups"))
+    exported = {repo.full_name for repo in repos}
+    recorded = [
+        e for e in _load_failed_exports(failures_path) if e["repository"] not in exported
+    ]
+    if failures:
+        console.print(
+            f"\n[yellow]⚠️  {len(failures)} export step(s) failed; "
+            f"see {failures_path} or rerun with --retry-failed[/yellow]"
+        )
+    if failures or recorded:
+        failures_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_json(failures_path, recorded + failures)
+    else:
+        failures_path.unlink(missing_ok=True)
 
-                issues_list = client.get_issues(owner, repo_name, state="all", include_comments=False)
-                issues_data = {
-                    "repository": f"{owner}/{repo_name}",
-                    "total_issues": len(issues_list),
-                    "exported_at": datetime.now().isoformat(),
-                    "issues": [
-                        {
-                            "number": issue.number,
-                            "title": issue.title,
-                            "state": issue.state,
-                            "user": issue.user,
-                            "created_at": issue.created_at,
-                            "html_url": issue.html_url,
-                        }
-                        for issue in issues_list
-                    ],
-                }
-                with open(dest, "w") as f:
-                    json.dump(issues_data, f, indent=2)
-                console.print(f"   [green]✓ Issues exported: {owner}/{repo_name} ({len(issues_list)} issues)[/green]")
 
-            # Export pull requests
-            if include_pulls:
-                dest = get_default_pulls_dest(owner, repo_name, "json")
-                dest.parent.mkdir(parents=True, exist_ok=True)
+def _retry_failed_exports(
+    client: GitHubAPIClient,
+    dest: Path,
+    username: str,
+    token: str | None,
+    max_workers: int,
+    max_concurrent_exports: int | None,
+) -> None:
+    """
+    Rerun only the export steps recorded as failed under a backup root.
 
-                prs_list = client.get_pull_requests(owner, repo_name, state="all", include_comments=False)
-                prs_data = {
+    Each repository in the record is looked up again and exported for just
+    its failed stages; the record is then rewritten with whatever still fails.
+    """
+    failures_path = get_failed_exports_path(dest)
+    entries = _load_failed_exports(failures_path)
+    only: dict[str, set[str]] = {}
+    for entry in entries:
+        only.setdefault(entry["repository"], set()).add(entry["stage"])
+    if not only:
+        console.print(f"\n[green]✅ No failed exports recorded in {failures_path}[/green]")
+        return
+
+    console.print(f"\n🔁 Retrying failed exports for {len(only)} repositories...")
+    repos: list[Repository] = []
+    # Names whose entries the export below will not replace: deleted
+    # repositories, and renamed ones that are recorded under their new name
+    stale: set[str] = set()
+    for full_name in list(only):
+        owner, _, name = full_name.partition("/")
+        repo = client.get_repository(owner, name)
+        stages = only.pop(full_name)
+        if repo is None:
+            console.print(f"   [yellow]⚠️  Repository no longer exists: {full_name}[/yellow]")
+            stale.add(full_name)
+            continue
+        if repo.full_name != full_name:
+            stale.add(full_name)
+        only[repo.full_name] = stages
+        repos.append(repo)
+
+    if stale:
+        _write_json(failures_path, [e for e in entries if e["repository"] not in stale])
+
+    stages = set().union(*only.values())
+    export_repository_data(
+        client=client,
+        repos=repos,
+        username=username,
+        include_issues="issues" in stages,
+        include_pulls="pull_requests" in stages,
+        include_workflows="workflows" in stages,
+        include_releases="releases" in stages,
+        include_wikis="wiki" in stages,
+        token=token,
+        max_workers=max_workers,
+        max_concurrent_exports=max_concurrent_exports,
+        failures_path=failures_path,
+        only=only,
+    )
+
+
+def _export_single_repository_data(
+    client: GitHubAPIClient,
+    repo: Repository,
+    include_issues: bool,
+    include_pulls: bool,
+    include_workflows: bool,
+    include_releases: bool,
+    prefetched: dict[str, list[dict]] | None = None,
+    exported_at: str | None = None,
+    failures: list[dict[str, str]] | None = None,
+) -> None:
+    """
+    Export issues, PRs, workflows and releases for one repository.
+
+    Errors are reported and swallowed so one repository cannot stop the rest;
+    the failing stage, and each later one it skipped, is appended to
+    ``failures`` when a list is given.
+    The per-owner category directories must already exist. Kinds present in
+    ``prefetched`` (from graphql_bulk_export) are written as-is; anything
+    missing is fetched over REST. ``exported_at`` is the run-wide timestamp
+    stamped on every export file. Wikis are synced by the caller.
+    """
+    owner = repo.owner
+    repo_name = repo.name
+    prefetched = prefetched or {}
+    exported_at = exported_at or datetime.now(tz=timezone.utc).isoformat()
+    stage = "issues"
+
+    try:
+        # Export issues
+        if include_issues:
+            dest = get_default_issues_dest(owner, repo_name, "json")
+
+            issues = prefetched.get("issues")
+            if issues is None:
+                issues = list(client.iter_export_items(owner, repo_name, "issues"))
+            header = {
+                "repository": f"{owner}/{repo_name}",
+                "total_issues": len(issues),
+                "exported_at": exported_at,
+            }
+            _write_json_export(dest, header, "issues", issues)
+            console.print(f"   [green]✓ Issues exported: {owner}/{repo_name} ({len(issues)} issues)[/green]")
+
+        # Export pull requests
+        stage = "pull_requests"
+        if include_pulls:
+            dest = get_default_pulls_dest(owner, repo_name, "json")
+
+            prs = prefetched.get("pull_requests")
+            if prs is None:
+                prs = list(client.iter_export_items(owner, repo_name, "pull_requests"))
+            header = {
+                "repository": f"{owner}/{repo_name}",
+                "total_pull_requests": len(prs),
+                "exported_at": exported_at,
+            }
+            _write_json_export(dest, header, "pull_requests", prs)
+            console.print(f"   [green]✓ Pull requests exported: {owner}/{repo_name} ({len(prs)} PRs)[/green]")
+
+        # Export workflows
+        stage = "workflows"
+        if include_workflows:
+            workflows_list, workflow_files = client.get_workflows(owner, repo_name)
+            if workflows_list:
+                # Only repositories with something to write get a directory
+                dest = get_default_workflows_dest(owner, repo_name)
+                dest.mkdir(exist_ok=True)
+                for wf_file in workflow_files:
+                    with _open_export(dest / Path(wf_file["path"]).name) as f:
+                        f.write(wf_file["content"].encode("utf-8"))
+
+                header = {
                     "repository": f"{owner}/{repo_name}",
-                    "total_pull_requests": len(prs_list),
-                    "exported_at": datetime.now().isoformat(),
-                    "pull_requests": [
+                    "total_workflows": len(workflows_list),
+                    "exported_at": exported_at,
+                }
+                _write_json_export(
+                    dest / "metadata.json",
+                    header,
+                    "workflows",
+                    [{"name": wf.name, "path": wf.path} for wf in workflows_list],
+                )
+                console.print(f"   [green]✓ Workflows exported: {owner}/{repo_name} ({len(workflows_list)} workflows)[/green]")
+
+        # Export releases
+        stage = "releases"
+        if include_releases:
+            releases = prefetched.get("releases")
+            if releases is None:
+                releases = list(client.iter_export_items(owner, repo_name, "releases"))
+            if releases:
+                dest = get_default_releases_dest(owner, repo_name)
+                dest.mkdir(exist_ok=True)
+                header = {
+                    "repository": f"{owner}/{repo_name}",
+                    "total_releases": len(releases),
+                    "exported_at": exported_at,
+                }
+                _write_json_export(dest / "metadata.json", header, "releases", releases)
+                console.print(f"   [green]✓ Releases exported: {owner}/{repo_name} ({len(releases)} releases)[/green]")
+
+    except Exception as e:
+        console.print(f"   ⚠️  Error exporting {stage} for {owner}/{repo_name}: {e}")
+        if failures is not None:
+            failures.append({"repository": f"{owner}/{repo_name}", "stage": stage, "error": str(e)})
+            # Later stages never ran; record them too so a retry covers them
+            included = (include_issues, include_pulls, include_workflows, include_releases)
+            for later, wanted in list(zip(_EXPORT_STAGES, included))[
+                _EXPORT_STAGES.index(stage) + 1 :
+            ]:
+                if wanted:
+                    failures.append(
                         {
-                            "number": pr.number,
-                            "title": pr.title,
-                            "state": pr.state,
-                            "user": pr.user,
-                            "merged": pr.merged,
-                            "created_at": pr.created_at,
-                            "html_url": pr.html_url,
+                            "repository": f"{owner}/{repo_name}",
+                            "stage": later,
+                            "error": f"skipped after {stage} failed",
                         }
-                        for pr in prs_list
-                    ],
-                }
-                with open(dest, "w") as f:
-                    json.dump(prs_data, f, indent=2)
-                console.print(f"   [green]✓ Pull requests exported: {owner}/{repo_name} ({len(prs_list)} PRs)[/green]")
+                    )
 
-            # Export workflows
-            if include_workflows:
-                dest = get_default_workflows_dest(owner, repo_name)
-                dest.mkdir(parents=True, exist_ok=True)
-
-                workflows_list, workflow_files = client.get_workflows(owner, repo_name)
-                if workflows_list:
-                    for wf_file in workflow_files:
-                        file_path = dest / Path(wf_file["path"]).name
-                        with open(file_path, "w") as f:
-                            f.write(wf_file["content"])
-
-                    metadata = {
-                        "repository": f"{owner}/{repo_name}",
-                        "total_workflows": len(workflows_list),
-                        "exported_at": datetime.now().isoformat(),
-                        "workflows": [{"name": wf.name, "path": wf.path} for wf in workflows_list],
-                    }
-                    with open(dest / "metadata.json", "w") as f:
-                        json.dump(metadata, f, indent=2)
-                    console.print(f"   [green]✓ Workflows exported: {owner}/{repo_name} ({len(workflows_list)} workflows)[/green]")
 
-            # Export releases
-            if include_releases:
-                dest = get_default_releases_dest(owner, repo_name)
-                dest.mkdir(parents=True, exist_ok=True)
-
-                releases_list = client.get_releases(owner, repo_name)
-                if releases_list:
-                    metadata = {
-                        "repository": f"{owner}/{repo_name}",
-                        "total_releases": len(releases_list),
-                        "exported_at": datetime.now().isoformat(),
-                        "releases": [
-                            {
-                                "tag_name": release.tag_name,
-                                "name": release.name,
-                                "created_at": release.created_at,
-                                "html_url": release.html_url,
-                            }
-                            for release in releases_list
-                        ],
-                    }
-                    with open(dest / "metadata.json", "w") as f:
-                        json.dump(metadata, f, indent=2)
-                    console.print(f"   [green]✓ Releases exported: {owner}/{repo_name} ({len(releases_list)} releases)[/green]")
-
-            # Backup wikis
-            if include_wikis:
-                has_wiki = client.check_wiki_exists(owner, repo_name)
-                if has_wiki:
-                    dest = get_default_wiki_dest(owner, repo_name)
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-
-                    wiki_url = f"https://github.com/{owner}/{repo_name}.wiki.git"
-
-                    if not dest.exists():
-                        try:
-                            subprocess.run(
-                                ["git", "clone", wiki_url, str(dest)],
-                                capture_output=True,
-                                text=True,
-                                check=True,
-                                timeout=300,
-                            )
-                            console.print(f"   [green]✓ Wiki cloned: {owner}/{repo_name}[/green]")
-                        except subprocess.CalledProcessError:
-                            pass  # Silently skip if clone fails
-                    else:
-                        try:
-                            subprocess.run(
-                                ["git", "pull"],
-                                cwd=dest,
-                                capture_output=True,
-                                text=True,
-                                check=True,
-                                timeout=120,
-                            )
-                            console.print(f"   [green]✓ Wiki updated: {owner}/{repo_name}[/green]")
-                        except subprocess.CalledProcessError:
-                            pass  # Silently skip if pull fails
+# Errors from an in-process wiki sync; empty when pygit2 is not installed
+_PYGIT2_ERRORS: tuple[type[Exception], ...] = (
+    (pygit2.GitError, KeyError) if pygit2 is not None else ()
+)
+
+
+def _sync_wiki_in_process(
+    wiki_url: str, dest: Path, cloning: bool, token: str | None = None
+) -> None:
+    """Clone or update a wiki with libgit2, without spawning git processes."""
+    # libgit2 has no per-call deadline; bound connects and stalled reads (ms)
+    pygit2.settings.server_connect_timeout = 10_000
+    pygit2.settings.server_timeout = 60_000
+    # libgit2 does not consult git's credential helpers, so hand it the token
+    callbacks = (
+        pygit2.RemoteCallbacks(credentials=pygit2.UserPass("x-access-token", token))
+        if token
+        else None
+    )
+
+    if cloning:
+        pygit2.clone_repository(wiki_url, str(dest), callbacks=callbacks)
+        return
+
+    repo = pygit2.Repository(str(dest))
+    repo.remotes["origin"].fetch(callbacks=callbacks, prune=pygit2.enums.FetchPrune.PRUNE)
+    upstream = repo.branches.local[repo.head.shorthand].upstream
+    if upstream is None:
+        raise pygit2.GitError(f"branch '{repo.head.shorthand}' has no upstream")
+    if upstream.target != repo.head.target:
+        repo.reset(upstream.target, pygit2.enums.ResetMode.HARD)
+
 
+def _wiki_checkout_usable(dest: Path) -> bool:
+    """Check that dest is a checkout with a commit, not a half-finished clone."""
+    if pygit2 is not None:
+        try:
+            return not pygit2.Repository(str(dest)).head_is_unborn
+        except pygit2.GitError:
+            return False
+    result = subprocess.run(
+        ["git", "-C", str(dest), "rev-parse", "--verify", "--quiet", "HEAD"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        timeout=10,
+    )
+    return result.returncode == 0
+
+
+def _sync_wiki(
+    owner: str, repo_name: str, token: str | None = None, attempts: int = 3
+) -> str | None:
+    """
+    Clone a repository's wiki, or bring an earlier backup of it up to date.
+
+    The backup is a mirror, so updates fetch and hard-reset to the remote
+    branch instead of pulling: no merge work, and no stuck merge if the wiki
+    history was rewritten. With pygit2 installed this happens in-process;
+    otherwise, or when libgit2 cannot authenticate, git is run so its
+    credential helpers and url.insteadOf rules apply. A backup left unusable
+    by an interrupted clone is cloned again. Failed attempts are retried with
+    exponential backoff, since most are dropped connections.
+
+    Returns:
+        None on success or if the wiki has no pages yet, else the last error
+        of any kind, so a failed wiki never aborts the other exports
+    """
+    dest = get_default_wiki_dest(owner, repo_name)
+    wiki_url = f"https://github.com/{owner}/{repo_name}.wiki.git"
+
+    cloning = not dest.exists()
+    in_process = pygit2 is not None
+    # Never stop for a credential prompt from a worker thread
+    env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+    error = ""
+    for attempt in range(attempts):
+        if attempt:
+            time.sleep(2 ** (attempt - 1) + random.random())
+            if cloning:
+                # A clone killed by the timeout can leave a partial checkout
+                shutil.rmtree(dest, ignore_errors=True)
+        timeout = 300 if cloning else 120
+        try:
+            if not cloning and not _wiki_checkout_usable(dest):
+                shutil.rmtree(dest)
+                cloning, timeout = True, 300
+
+            if in_process:
+                _sync_wiki_in_process(wiki_url, dest, cloning, token)
+            elif cloning:
+                _run_wiki_git(["git", "clone", wiki_url, str(dest)], env, timeout)
+            elif not GitOperations.remote_head_matches(dest, env):
+                # An in-process fetch of an unchanged wiki is already one cheap
+                # round-trip, but two git runs are not
+                _run_wiki_git(["git", "-C", str(dest), "fetch", "--prune", "origin"], env, timeout)
+                _run_wiki_git(["git", "-C", str(dest), "reset", "--hard", "@{upstream}"], env, timeout)
+            console.print(
+                f"   [green]✓ Wiki {'cloned' if cloning else 'updated'}: {owner}/{repo_name}[/green]"
+            )
+            return None
+        except _PYGIT2_ERRORS as e:
+            message = str(e)
+            # Only the remote's 404 means there is no wiki; local errors such
+            # as an unreadable checkout must not be mistaken for one
+            if "status code: 404" in message:
+                return None
+            if "authenticat" in message.lower() or "credential" in message.lower():
+                in_process = False
+            error = message
+        except subprocess.CalledProcessError as e:
+            stderr = (e.stderr or "").strip()
+            # Many repositories enable the wiki without ever creating a page,
+            # and such wikis have no git repository behind them
+            if "not found" in stderr.lower():
+                return None
+            error = stderr.splitlines()[-1] if stderr else str(e)
+        except subprocess.TimeoutExpired:
+            error = f"git timed out after {timeout}s"
         except Exception as e:
-            console.print(f"   ⚠️  Error exporting data for {owner}/{repo_name}: {e}")
-            continue
+            # A missing git binary, an unwritable destination or an unexpected
+            # libgit2 error is reported for this wiki rather than raised out of
+            # the worker pool
+            error = f"{type(e).__name__}: {e}"
+
+    return error
+
+
+def _run_wiki_git(command: list[str], env: dict[str, str], timeout: int) -> None:
+    """Run one git command for a wiki sync, keeping only stderr."""
+    subprocess.run(
+        command,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+        timeout=timeout,
+    )
+
+
+def _download_release_asset(session: requests.Session, url: str, dest: Path, size: int) -> None:
+    """
+    Stream one release asset to dest, resuming a partial download.
+
+    Bytes land in ``<name>.part`` and are renamed over dest only once all
+    ``size`` bytes have arrived. The first response's ETag (or Last-Modified)
+    is kept in ``<name>.part.validator`` and sent back as If-Range, so a
+    partial file is only continued when the asset has not been re-uploaded
+    since; otherwise the server answers 200 and the download starts over.
+    """
+    if dest.exists() and dest.stat().st_size == size:
+        return
+
+    part = dest.with_name(dest.name + ".part")
+    validator_path = dest.with_name(dest.name + ".part.validator")
+    have = part.stat().st_size if part.exists() else 0
+    validator = validator_path.read_text().strip() if validator_path.exists() else ""
+
+    headers = {}
+    if 0 < have < size and validator:
+        headers = {"Range": f"bytes={have}-", "If-Range": validator}
+    with session.get(url, headers=headers, stream=True, timeout=(10, 60)) as response:
+        response.raise_for_status()
+        # 206 continues the partial file; a plain 200 starts over
+        if response.status_code == 206 and headers:
+            mode = "ab"
+        else:
+            mode = "wb"
+            validator = response.headers.get("ETag") or response.headers.get("Last-Modified") or ""
+            if validator:
+                validator_path.write_text(validator)
+            else:
+                validator_path.unlink(missing_ok=True)
+        # Copy the raw stream in 1 MiB blocks instead of a Python loop over
+        # 8 KiB chunks; urllib3 still undoes any Content-Encoding
+        response.raw.decode_content = True
+        with open(part, mode) as f:
+            shutil.copyfileobj(response.raw, f, length=_WRITE_BUFFER_SIZE)
+
+    received = part.stat().st_size
+    if received != size:
+        raise OSError(f"Incomplete download of {dest.name}: {received} of {size} bytes")
+    os.replace(part, dest)
+    validator_path.unlink(missing_ok=True)
 
 
 def version_callback(value: bool) -> None:
@@ -489,6 +1024,31 @@ def user(
         help="GitHub API base URL (e.g., https://api.orgname.ghe.com for Enterprise)",
         envvar="GITHUB_API_URL",
     ),
+    rate_limit_rps: float | None = typer.Option(
+        None,
+        "--rate-limit-rps",
+        help="Maximum GitHub API requests per second (default: adapt to rate-limit headers)",
+        min=0.1,
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Refetch every API response instead of revalidating cached ones",
+    ),
+    max_concurrent_exports: int = typer.Option(
+        4,
+        "--max-concurrent-exports",
+        help="Repositories whose issues/PRs/workflows are held in memory at once, "
+        "never more than --max-workers (lower on small machines)",
+        min=1,
+        max=20,
+    ),
+    retry_failed: bool = typer.Option(
+        False,
+        "--retry-failed",
+        help="Only rerun the export steps that failed last time under this destination "
+        "(recorded in <dest>/.cache/failed_exports.json); repositories are not mirrored",
+    ),
     token: str | None = typer.Option(
         None,
         "--token",
@@ -510,6 +1070,7 @@ def user(
         farmore user miztizm --exclude repo1 --exclude repo2  # Exclude specific repos
         farmore user miztizm --name-regex '^my-prefix-.*'  # Only repos matching pattern
         farmore user miztizm --incremental  # Only repos changed since last backup
+        farmore user miztizm --retry-failed  # Rerun only the export steps that failed
     """
     # Use default destination if not provided
     if dest is None:
@@ -541,15 +1102,26 @@ def user(
         max_workers=max_workers,
         github_host=github_host,
         github_api_url=api_url or "https://api.github.com",
+        rate_limit_rps=rate_limit_rps,
+        response_cache_path=None if no_cache or dry_run else ResponseCache.DEFAULT_PATH,
     )
 
-    orchestrator = MirrorOrchestrator(config)
+    # One client lists the repositories and exports their data, sharing its
+    # pooled connections and response cache
+    client = GitHubAPIClient(config)
+
+    if retry_failed:
+        _retry_failed_exports(
+            client, config.dest, username, token, max_workers, max_concurrent_exports
+        )
+        sys.exit(0)
+
+    orchestrator = MirrorOrchestrator(config, client=client)
     summary = orchestrator.run()
 
     # Export additional data if requested
     if any([include_issues, include_pulls, include_workflows, include_releases, include_wikis]):
-        client = GitHubAPIClient(config)
-        repos = client.get_repositories()
+        repos = orchestrator.repos
 
         export_repository_data(
             client=client,
@@ -561,6 +1133,9 @@ def user(
             include_releases=include_releases,
             include_wikis=include_wikis,
             token=token,
+            max_workers=max_workers,
+            max_concurrent_exports=max_concurrent_exports,
+            failures_path=get_failed_exports_path(config.dest),
         )
 
     # Exit with appropriate code
@@ -680,6 +1255,31 @@ def org(
         help="GitHub API base URL (e.g., https://api.orgname.ghe.com for Enterprise)",
         envvar="GITHUB_API_URL",
     ),
+    rate_limit_rps: float | None = typer.Option(
+        None,
+        "--rate-limit-rps",
+        help="Maximum GitHub API requests per second (default: adapt to rate-limit headers)",
+        min=0.1,
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Refetch every API response instead of revalidating cached ones",
+    ),
+    max_concurrent_exports: int = typer.Option(
+        4,
+        "--max-concurrent-exports",
+        help="Repositories whose issues/PRs/workflows are held in memory at once, "
+        "never more than --max-workers (lower on small machines)",
+        min=1,
+        max=20,
+    ),
+    retry_failed: bool = typer.Option(
+        False,
+        "--retry-failed",
+        help="Only rerun the export steps that failed last time under this destination "
+        "(recorded in <dest>/.cache/failed_exports.json); repositories are not mirrored",
+    ),
     token: str | None = typer.Option(
         None,
         "--token",
@@ -700,6 +1300,7 @@ def org(
         farmore org myorg --bare --lfs  # Mirror clone with LFS support
         farmore org myorg --name-regex '^project-.*'  # Only repos matching pattern
         farmore org myorg --incremental  # Only repos changed since last backup
+        farmore org myorg --retry-failed  # Rerun only the export steps that failed
     """
     # Use default destination if not provided
     if dest is None:
@@ -729,15 +1330,26 @@ def org(
         max_workers=max_workers,
         github_host=github_host,
         github_api_url=api_url or "https://api.github.com",
+        rate_limit_rps=rate_limit_rps,
+        response_cache_path=None if no_cache or dry_run else ResponseCache.DEFAULT_PATH,
     )
 
-    orchestrator = MirrorOrchestrator(config)
+    # One client lists the repositories and exports their data, sharing its
+    # pooled connections and response cache
+    client = GitHubAPIClient(config)
+
+    if retry_failed:
+        _retry_failed_exports(
+            client, config.dest, orgname, token, max_workers, max_concurrent_exports
+        )
+        sys.exit(0)
+
+    orchestrator = MirrorOrchestrator(config, client=client)
     summary = orchestrator.run()
 
     # Export additional data if requested
     if any([include_issues, include_pulls, include_workflows, include_releases, include_wikis]):
-        client = GitHubAPIClient(config)
-        repos = client.get_repositories()
+        repos = orchestrator.repos
 
         export_repository_data(
             client=client,
@@ -749,6 +1361,9 @@ def org(
             include_releases=include_releases,
             include_wikis=include_wikis,
             token=token,
+            max_workers=max_workers,
+            max_concurrent_exports=max_concurrent_exports,
+            failures_path=get_failed_exports_path(config.dest),
         )
 
     # Exit with appropriate code
@@ -792,7 +1407,8 @@ def profile(
         farmore profile miztizm
         farmore profile miztizm --dest ./custom_profile.yaml --format yaml
     """
-    if format.lower() not in ["json", "yaml"]:
+    format = format.lower()
+    if format not in ["json", "yaml"]:
         console.print("[red]❌ Error: Format must be 'json' or 'yaml'[/red]")
         sys.exit(1)
 
@@ -810,7 +1426,7 @@ def profile(
 
         # Use default destination if not provided
         if dest is None:
-            dest = get_default_profile_dest(user_profile.login, format.lower())
+            dest = get_default_profile_dest(user_profile.login, format)
 
         # Convert to dict
         profile_dict = {
@@ -835,12 +1451,10 @@ def profile(
 
         # Save to file
         dest.parent.mkdir(parents=True, exist_ok=True)
-        if format.lower() == "json":
-            with open(dest, "w", encoding="utf-8") as f:
-                json.dump(profile_dict, f, indent=2, ensure_ascii=False)
+        if format == "json":
+            _write_json(dest, profile_dict)
         else:
-            with open(dest, "w", encoding="utf-8") as f:
-                yaml.dump(profile_dict, f, default_flow_style=False, allow_unicode=True)
+            _write_yaml(dest, profile_dict, allow_unicode=True)
 
         # Create profile summary table
         table = Table(title=f"👤 GitHub Profile: {user_profile.login}", border_style="cyan", show_header=False)
@@ -918,11 +1532,16 @@ def starred(
     """
     # Need to get the actual username first to determine default dest
     # Create a temporary config to fetch the username
+    # It also carries the filter and worker settings, so the same client can
+    # filter the listing without being re-targeted
     temp_config = Config(
         target_type=TargetType.USER,
         target_name=username or "me",
         dest=Path("."),
         token=token,
+        include_forks=include_forks,
+        include_archived=include_archived,
+        max_workers=max_workers,
     )
 
     try:
@@ -959,8 +1578,8 @@ def starred(
     )
 
     try:
-        # Apply filters (repos already fetched above)
-        client = GitHubAPIClient(config)
+        # Apply filters (repos already fetched above) with the listing client,
+        # whose config has the same filter settings, so its connection is reused
         repos = client._filter_repositories(repos)
 
         if not repos:
@@ -1035,11 +1654,16 @@ def watched(
         farmore watched miztizm --dest ./custom_watched
     """
     # Need to get the actual username first to determine default dest
+    # It also carries the filter and worker settings, so the same client can
+    # filter the listing without being re-targeted
     temp_config = Config(
         target_type=TargetType.USER,
         target_name=username or "me",
         dest=Path("."),
         token=token,
+        include_forks=include_forks,
+        include_archived=include_archived,
+        max_workers=max_workers,
     )
 
     try:
@@ -1075,8 +1699,8 @@ def watched(
     )
 
     try:
-        # Apply filters (repos already fetched above)
-        client = GitHubAPIClient(config)
+        # Apply filters (repos already fetched above) with the listing client,
+        # whose config has the same filter settings, so its connection is reused
         repos = client._filter_repositories(repos)
 
         if not repos:
@@ -1115,6 +1739,11 @@ def secrets(
         "-f",
         help="Output format: json or yaml",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Refetch every API response instead of revalidating cached ones",
+    ),
     token: str | None = typer.Option(
         None,
         "--token",
@@ -1135,21 +1764,21 @@ def secrets(
         farmore secrets miztizm/hello-world --format yaml
         farmore secrets miztizm/farmore --dest ./custom_secrets.json
     """
-    if format.lower() not in ["json", "yaml"]:
+    format = format.lower()
+    if format not in ["json", "yaml"]:
         console.print("[red]❌ Error: Format must be 'json' or 'yaml'[/red]")
         sys.exit(1)
 
     # Parse owner/repo
-    parts = repository.split("/")
-    if len(parts) != 2:
-        console.print("[red]❌ Error: Repository must be in format 'owner/repo'[/red]")
+    try:
+        owner, repo = validate_repository_format(repository)
+    except ValueError as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
         sys.exit(1)
 
-    owner, repo = parts
-
     # Use default destination if not provided
     if dest is None:
-        dest = get_default_secrets_dest(owner, repo, format.lower())
+        dest = get_default_secrets_dest(owner, repo, format)
 
     # Create a minimal config just for API client
     config = Config(
@@ -1157,45 +1786,45 @@ def secrets(
         target_name=owner,
         dest=Path("."),
         token=token,
+        response_cache_path=None if no_cache else ResponseCache.DEFAULT_PATH,
     )
 
     try:
         client = GitHubAPIClient(config)
         repo_secrets = client.get_repository_secrets(owner, repo)
 
+        # Build the export entries and the table rows in one pass
+        table = Table(title=f"🔐 Repository Secrets: {repository}", border_style="cyan")
+        table.add_column("Secret Name", style="bold yellow", no_wrap=True)
+        table.add_column("Created", style="dim")
+        table.add_column("Updated", style="dim")
+        entries = []
+        for secret in repo_secrets:
+            entries.append(
+                {
+                    "name": secret.name,
+                    "created_at": secret.created_at,
+                    "updated_at": secret.updated_at,
+                }
+            )
+            table.add_row(secret.name, secret.created_at[:10], secret.updated_at[:10])
+
         # Convert to dict
         secrets_dict = {
             "repository": repository,
             "total_secrets": len(repo_secrets),
-            "secrets": [
-                {
-                    "name": s.name,
-                    "created_at": s.created_at,
-                    "updated_at": s.updated_at,
-                }
-                for s in repo_secrets
-            ],
+            "secrets": entries,
         }
 
         # Save to file
         dest.parent.mkdir(parents=True, exist_ok=True)
-        if format.lower() == "json":
-            with open(dest, "w", encoding="utf-8") as f:
-                json.dump(secrets_dict, f, indent=2, ensure_ascii=False)
+        if format == "json":
+            _write_json(dest, secrets_dict)
         else:
-            with open(dest, "w", encoding="utf-8") as f:
-                yaml.dump(secrets_dict, f, default_flow_style=False, allow_unicode=True)
+            _write_yaml(dest, secrets_dict, allow_unicode=True)
 
-        # Create secrets table
+        # Show secrets table
         if repo_secrets:
-            table = Table(title=f"🔐 Repository Secrets: {repository}", border_style="cyan")
-            table.add_column("Secret Name", style="bold yellow", no_wrap=True)
-            table.add_column("Created", style="dim")
-            table.add_column("Updated", style="dim")
-
-            for secret in repo_secrets:
-                table.add_row(secret.name, secret.created_at[:10], secret.updated_at[:10])
-
             console.print()
             console.print(table)
         else:
@@ -1238,13 +1867,12 @@ def delete(
         farmore delete miztizm/testdelete --force
     """
     # Parse owner/repo
-    parts = repository.split("/")
-    if len(parts) != 2:
-        console.print("[red]❌ Error: Repository must be in format 'owner/repo'[/red]")
+    try:
+        owner, repo = validate_repository_format(repository)
+    except ValueError as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
         sys.exit(1)
 
-    owner, repo = parts
-
     # Safety check: Confirm deletion unless --force is used
     if not force:
         console.print(f"\n[red]⚠️  WARNING: You are about to DELETE the repository '{repository}'[/red]")
@@ -1332,6 +1960,16 @@ def repo(
         "--use-ssh/--no-use-ssh",
         help="Use SSH for cloning (default: True)",
     ),
+    shallow: bool = typer.Option(
+        False,
+        "--shallow",
+        help="Clone only the latest commit (smaller and faster, but no history)",
+    ),
+    filter_spec: str | None = typer.Option(
+        None,
+        "--filter",
+        help="Partial-clone filter, e.g. 'blob:none' (file contents are fetched on demand)",
+    ),
     token: str | None = typer.Option(
         None,
         "--token",
@@ -1352,13 +1990,12 @@ def repo(
         farmore repo python/cpython --dest ./my-backups --include-wikis
     """
     # Parse owner/repo
-    parts = repository.split("/")
-    if len(parts) != 2:
-        console.print("[red]❌ Error: Repository must be in format 'owner/repo'[/red]")
+    try:
+        owner, repo_name = validate_repository_format(repository)
+    except ValueError as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
         sys.exit(1)
 
-    owner, repo_name = parts
-
     # If --all flag is set, enable all data exports
     if all:
         include_issues = True
@@ -1396,7 +2033,9 @@ def repo(
         # Clone or update the repository
         dest.parent.mkdir(parents=True, exist_ok=True)
 
-        if dest.exists() and GitOperations.is_git_repository(dest):
+        if dest.exists() and GitOperations.remote_head_matches(dest):
+            console.print(f"[green]✅ Repository already up to date: {dest}[/green]")
+        elif dest.exists() and GitOperations.is_git_repository(dest):
             console.print(f"   Repository already exists, updating...")
             result = GitOperations.pull(dest)
             if result[0]:
@@ -1405,7 +2044,14 @@ def repo(
                 console.print(f"[yellow]⚠️  Update failed: {result[1]}[/yellow]")
         else:
             console.print(f"   Cloning repository...")
-            result = GitOperations.clone(repo_info, dest, use_ssh=use_ssh, github_url=config.get_github_url())
+            result = GitOperations.clone(
+                repo_info,
+                dest,
+                use_ssh=use_ssh,
+                github_url=config.get_github_url(),
+                depth=1 if shallow else None,
+                filter_spec=filter_spec,
+            )
             if result[0]:
                 console.print(f"[green]✅ Repository cloned: {dest}[/green]")
             else:
@@ -1462,6 +2108,16 @@ def issues(
         "--include-comments",
         help="Include issue comments in export",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Refetch every API response instead of revalidating cached ones",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Rewrite the export even if nothing changed since the last run",
+    ),
     token: str | None = typer.Option(
         None,
         "--token",
@@ -1481,13 +2137,12 @@ def issues(
         farmore issues miztizm/farmore --dest ./my-issues.json --format yaml
     """
     # Parse owner/repo
-    parts = repository.split("/")
-    if len(parts) != 2:
-        console.print("[red]❌ Error: Repository must be in format 'owner/repo'[/red]")
+    try:
+        owner, repo = validate_repository_format(repository)
+    except ValueError as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
         sys.exit(1)
 
-    owner, repo = parts
-
     # Determine destination
     if dest is None:
         dest = get_default_issues_dest(owner, repo, format)
@@ -1501,45 +2156,51 @@ def issues(
         target_name=owner,
         dest=Path("."),
         token=token,
+        response_cache_path=None if no_cache else ResponseCache.DEFAULT_PATH,
     )
 
     try:
         client = GitHubAPIClient(config)
         issues_list = client.get_issues(owner, repo, state=state, include_comments=include_comments)
 
-        # Convert to dict for export
-        issues_data = {
+        # Every page came back 304 and dest was written with these options
+        export_options = {"state": state, "include_comments": include_comments, "format": format}
+        if not force and client.export_is_current(dest, export_options):
+            print_info(f"No changes since the last export: {dest}")
+            return
+
+        header = {
             "repository": repository,
             "total_issues": len(issues_list),
             "state_filter": state,
             "exported_at": datetime.now().isoformat(),
-            "issues": [
-                {
-                    "number": issue.number,
-                    "title": issue.title,
-                    "state": issue.state,
-                    "user": issue.user,
-                    "body": issue.body,
-                    "labels": issue.labels,
-                    "assignees": issue.assignees,
-                    "created_at": issue.created_at,
-                    "updated_at": issue.updated_at,
-                    "closed_at": issue.closed_at,
-                    "comments_count": issue.comments_count,
-                    "html_url": issue.html_url,
-                    "comments": issue.comments if include_comments else [],
-                }
-                for issue in issues_list
-            ],
         }
+        # Generated one at a time as they are written, never held as a list
+        issues_data = (
+            {
+                "number": issue.number,
+                "title": issue.title,
+                "state": issue.state,
+                "user": issue.user,
+                "body": issue.body,
+                "labels": issue.labels,
+                "assignees": issue.assignees,
+                "created_at": issue.created_at,
+                "updated_at": issue.updated_at,
+                "closed_at": issue.closed_at,
+                "comments_count": issue.comments_count,
+                "html_url": issue.html_url,
+                "comments": issue.comments if include_comments else [],
+            }
+            for issue in issues_list
+        )
 
         # Export to file
         if format == "yaml":
-            with open(dest, "w") as f:
-                yaml.dump(issues_data, f, default_flow_style=False, sort_keys=False)
+            _write_yaml_export(dest, header, "issues", issues_data)
         else:
-            with open(dest, "w") as f:
-                json.dump(issues_data, f, indent=2)
+            _write_json_export(dest, header, "issues", issues_data)
+        client.record_export(dest, export_options)
 
         # Create summary table
         table = Table(title=f"📋 Issues Export Summary: {repository}", border_style="cyan")
@@ -1587,6 +2248,16 @@ def pulls(
         "--include-comments",
         help="Include PR comments in export",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Refetch every API response instead of revalidating cached ones",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Rewrite the export even if nothing changed since the last run",
+    ),
     token: str | None = typer.Option(
         None,
         "--token",
@@ -1606,13 +2277,12 @@ def pulls(
         farmore pulls miztizm/farmore --dest ./my-prs.json --format yaml
     """
     # Parse owner/repo
-    parts = repository.split("/")
-    if len(parts) != 2:
-        console.print("[red]❌ Error: Repository must be in format 'owner/repo'[/red]")
+    try:
+        owner, repo = validate_repository_format(repository)
+    except ValueError as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
         sys.exit(1)
 
-    owner, repo = parts
-
     # Determine destination
     if dest is None:
         dest = get_default_pulls_dest(owner, repo, format)
@@ -1626,54 +2296,60 @@ def pulls(
         target_name=owner,
         dest=Path("."),
         token=token,
+        response_cache_path=None if no_cache else ResponseCache.DEFAULT_PATH,
     )
 
     try:
         client = GitHubAPIClient(config)
         prs_list = client.get_pull_requests(owner, repo, state=state, include_comments=include_comments)
 
-        # Convert to dict for export
-        prs_data = {
+        # Every page came back 304 and dest was written with these options
+        export_options = {"state": state, "include_comments": include_comments, "format": format}
+        if not force and client.export_is_current(dest, export_options):
+            print_info(f"No changes since the last export: {dest}")
+            return
+
+        header = {
             "repository": repository,
             "total_pull_requests": len(prs_list),
             "state_filter": state,
             "exported_at": datetime.now().isoformat(),
-            "pull_requests": [
-                {
-                    "number": pr.number,
-                    "title": pr.title,
-                    "state": pr.state,
-                    "user": pr.user,
-                    "body": pr.body,
-                    "labels": pr.labels,
-                    "assignees": pr.assignees,
-                    "created_at": pr.created_at,
-                    "updated_at": pr.updated_at,
-                    "closed_at": pr.closed_at,
-                    "merged_at": pr.merged_at,
-                    "merged": pr.merged,
-                    "draft": pr.draft,
-                    "head_ref": pr.head_ref,
-                    "base_ref": pr.base_ref,
-                    "commits_count": pr.commits_count,
-                    "comments_count": pr.comments_count,
-                    "review_comments_count": pr.review_comments_count,
-                    "html_url": pr.html_url,
-                    "diff_url": pr.diff_url,
-                    "patch_url": pr.patch_url,
-                    "comments": pr.comments if include_comments else [],
-                }
-                for pr in prs_list
-            ],
         }
+        # Generated one at a time as they are written, never held as a list
+        prs_data = (
+            {
+                "number": pr.number,
+                "title": pr.title,
+                "state": pr.state,
+                "user": pr.user,
+                "body": pr.body,
+                "labels": pr.labels,
+                "assignees": pr.assignees,
+                "created_at": pr.created_at,
+                "updated_at": pr.updated_at,
+                "closed_at": pr.closed_at,
+                "merged_at": pr.merged_at,
+                "merged": pr.merged,
+                "draft": pr.draft,
+                "head_ref": pr.head_ref,
+                "base_ref": pr.base_ref,
+                "commits_count": pr.commits_count,
+                "comments_count": pr.comments_count,
+                "review_comments_count": pr.review_comments_count,
+                "html_url": pr.html_url,
+                "diff_url": pr.diff_url,
+                "patch_url": pr.patch_url,
+                "comments": pr.comments if include_comments else [],
+            }
+            for pr in prs_list
+        )
 
         # Export to file
         if format == "yaml":
-            with open(dest, "w") as f:
-                yaml.dump(prs_data, f, default_flow_style=False, sort_keys=False)
+            _write_yaml_export(dest, header, "pull_requests", prs_data)
         else:
-            with open(dest, "w") as f:
-                json.dump(prs_data, f, indent=2)
+            _write_json_export(dest, header, "pull_requests", prs_data)
+        client.record_export(dest, export_options)
 
         # Create summary table
         table = Table(title=f"🔀 Pull Requests Export Summary: {repository}", border_style="cyan")
@@ -1708,6 +2384,16 @@ def workflows(
         "--include-runs",
         help="Include workflow runs history",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Refetch every API response instead of revalidating cached ones",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Rewrite the export even if nothing changed since the last run",
+    ),
     token: str | None = typer.Option(
         None,
         "--token",
@@ -1727,13 +2413,12 @@ def workflows(
         farmore workflows miztizm/farmore --dest ./my-workflows/
     """
     # Parse owner/repo
-    parts = repository.split("/")
-    if len(parts) != 2:
-        console.print("[red]❌ Error: Repository must be in format 'owner/repo'[/red]")
+    try:
+        owner, repo = validate_repository_format(repository)
+    except ValueError as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
         sys.exit(1)
 
-    owner, repo = parts
-
     # Determine destination
     if dest is None:
         dest = get_default_workflows_dest(owner, repo)
@@ -1747,6 +2432,7 @@ def workflows(
         target_name=owner,
         dest=Path("."),
         token=token,
+        response_cache_path=None if no_cache else ResponseCache.DEFAULT_PATH,
     )
 
     try:
@@ -1757,11 +2443,19 @@ def workflows(
             console.print(f"\n[yellow]⚠️  No workflows found for {repository}[/yellow]")
             sys.exit(0)
 
+        runs = client.get_workflow_runs(owner, repo, limit=100) if include_runs else []
+
+        # Every request came back 304 and the export has these options
+        metadata_path = dest / "metadata.json"
+        export_options = {"include_runs": include_runs}
+        if not force and client.export_is_current(metadata_path, export_options):
+            print_info(f"No changes since the last export: {dest}")
+            return
+
         # Save workflow files
         for wf_file in workflow_files:
-            file_path = dest / Path(wf_file["path"]).name
-            with open(file_path, "w") as f:
-                f.write(wf_file["content"])
+            with _open_export(dest / Path(wf_file["path"]).name) as f:
+                f.write(wf_file["content"].encode("utf-8"))
 
         # Save metadata
         metadata = {
@@ -1784,7 +2478,6 @@ def workflows(
 
         # Include workflow runs if requested
         if include_runs:
-            runs = client.get_workflow_runs(owner, repo, limit=100)
             metadata["workflow_runs"] = [
                 {
                     "id": run.id,
@@ -1800,9 +2493,8 @@ def workflows(
             ]
 
         # Save metadata
-        metadata_path = dest / "metadata.json"
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        _write_json(metadata_path, metadata)
+        client.record_export(metadata_path, export_options)
 
         console.print(f"\n[green]✅ Workflows backed up to: {dest}[/green]")
         console.print(f"   Repository: {repository}")
@@ -1828,6 +2520,24 @@ def releases(
         "--download-assets",
         help="Download release assets (binaries, archives, etc.)",
     ),
+    max_workers: int = typer.Option(
+        4,
+        "--max-workers",
+        "-w",
+        help="Maximum number of parallel asset downloads",
+        min=1,
+        max=20,
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Refetch every API response instead of revalidating cached ones",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Rewrite the export even if nothing changed since the last run",
+    ),
     token: str | None = typer.Option(
         None,
         "--token",
@@ -1847,13 +2557,12 @@ def releases(
         farmore releases miztizm/farmore --dest ./my-releases/
     """
     # Parse owner/repo
-    parts = repository.split("/")
-    if len(parts) != 2:
-        console.print("[red]❌ Error: Repository must be in format 'owner/repo'[/red]")
+    try:
+        owner, repo = validate_repository_format(repository)
+    except ValueError as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
         sys.exit(1)
 
-    owner, repo = parts
-
     # Determine destination
     if dest is None:
         dest = get_default_releases_dest(owner, repo)
@@ -1867,6 +2576,8 @@ def releases(
         target_name=owner,
         dest=Path("."),
         token=token,
+        response_cache_path=None if no_cache else ResponseCache.DEFAULT_PATH,
+        max_workers=max_workers,
     )
 
     try:
@@ -1877,6 +2588,12 @@ def releases(
             console.print(f"\n[yellow]⚠️  No releases found for {repository}[/yellow]")
             sys.exit(0)
 
+        # Every page came back 304; asset downloads check each file themselves
+        metadata_path = dest / "metadata.json"
+        if not (force or download_assets) and client.export_is_current(metadata_path, {}):
+            print_info(f"No changes since the last export: {dest}")
+            return
+
         # Save metadata for all releases
         metadata = {
             "repository": repository,
@@ -1900,14 +2617,14 @@ def releases(
             ],
         }
 
-        metadata_path = dest / "metadata.json"
-        with open(metadata_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        _write_json(metadata_path, metadata)
+        client.record_export(metadata_path, {})
 
         # Download assets if requested
         if download_assets:
             console.print(f"\n📦 Downloading release assets...")
 
+            downloads: list[tuple[str, Path, int]] = []
             for release in releases_list:
                 if not release.assets:
                     continue
@@ -1926,28 +2643,32 @@ def releases(
                     "author": release.author,
                     "html_url": release.html_url,
                 }
-                with open(release_dir / "release.json", "w") as f:
-                    json.dump(release_metadata, f, indent=2)
+                _write_json(release_dir / "release.json", release_metadata)
 
-                # Download each asset
                 for asset in release.assets:
                     asset_path = release_dir / asset["name"]
+                    if asset_path.exists() and asset_path.stat().st_size == asset["size"]:
+                        console.print(f"   [dim]Up to date: {asset['name']}[/dim]")
+                        continue
                     console.print(f"   Downloading: {asset['name']} ({asset['size']} bytes)")
-
-                    # Download with progress
-                    response = requests.get(asset["browser_download_url"], stream=True)
-                    response.raise_for_status()
-
-                    with open(asset_path, "wb") as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            f.write(chunk)
+                    downloads.append((asset["browser_download_url"], asset_path, asset["size"]))
+
+            # Assets are independent, so keep several transfers in flight over
+            # the client's pooled keep-alive session
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_download_release_asset, client.session, url, path, size): path
+                    for url, path, size in downloads
+                }
+                for future in as_completed(futures):
+                    future.result()
+                    console.print(f"   [green]✓ {futures[future].name}[/green]")
 
         console.print(f"\n[green]✅ Releases backed up to: {dest}[/green]")
         console.print(f"   Repository: {repository}")
         console.print(f"   Total releases: {len(releases_list)}")
         if download_assets:
-            total_assets = sum(len(r.assets) for r in releases_list)
-            console.print(f"   Assets downloaded: {total_assets}")
+            console.print(f"   Assets downloaded: {len(downloads)}")
 
     except Exception as e:
         console.print(f"[red]❌ Error: {e}[/red]")
@@ -1963,6 +2684,21 @@ def wiki(
         "-d",
         help="Destination directory for wiki backup (default: backups/<owner>/data/wikis/<owner>_<repo>.wiki/)",
     ),
+    shallow: bool = typer.Option(
+        False,
+        "--shallow",
+        help="Clone only the latest commit (smaller and faster, but no history)",
+    ),
+    filter_spec: str | None = typer.Option(
+        None,
+        "--filter",
+        help="Partial-clone filter, e.g. 'blob:none' (file contents are fetched on demand)",
+    ),
+    verify_first: bool = typer.Option(
+        False,
+        "--verify-first",
+        help="Ask the API whether the wiki is enabled before cloning (one extra request)",
+    ),
     token: str | None = typer.Option(
         None,
         "--token",
@@ -1981,34 +2717,32 @@ def wiki(
         farmore wiki miztizm/farmore --dest ./my-wiki/
     """
     # Parse owner/repo
-    parts = repository.split("/")
-    if len(parts) != 2:
-        console.print("[red]❌ Error: Repository must be in format 'owner/repo'[/red]")
+    try:
+        owner, repo = validate_repository_format(repository)
+    except ValueError as e:
+        console.print(f"[red]❌ Error: {e}[/red]")
         sys.exit(1)
 
-    owner, repo = parts
-
     # Determine destination
     if dest is None:
         dest = get_default_wiki_dest(owner, repo)
 
-    # Create config
-    config = Config(
-        target_type=TargetType.USER,
-        target_name=owner,
-        dest=Path("."),
-        token=token,
-    )
+    no_wiki = f"\n[yellow]⚠️  Repository {repository} does not have a wiki enabled[/yellow]"
 
     try:
-        client = GitHubAPIClient(config)
-
-        # Check if wiki exists
-        has_wiki = client.check_wiki_exists(owner, repo)
-
-        if not has_wiki:
-            console.print(f"\n[yellow]⚠️  Repository {repository} does not have a wiki enabled[/yellow]")
-            sys.exit(0)
+        # The clone itself reports a missing wiki, so the API pre-check is opt-in
+        if verify_first:
+            config = Config(
+                target_type=TargetType.USER,
+                target_name=owner,
+                dest=Path("."),
+                token=token,
+            )
+            with GitHubAPIClient(config) as client:
+                has_wiki = client.check_wiki_exists(owner, repo)
+            if not has_wiki:
+                console.print(no_wiki)
+                sys.exit(0)
 
         console.print(f"\n📚 Cloning wiki for repository: {repository}")
 
@@ -2019,13 +2753,17 @@ def wiki(
         dest.parent.mkdir(parents=True, exist_ok=True)
 
         # Clone or update wiki using git directly
-        if dest.exists():
+        if dest.exists() and GitOperations.remote_head_matches(dest):
+            console.print(f"[green]✅ Wiki already up to date: {dest}[/green]")
+        elif dest.exists():
             console.print(f"   Wiki already exists, updating...")
             try:
-                result = subprocess.run(
+                subprocess.run(
                     ["git", "pull"],
                     cwd=dest,
-                    capture_output=True,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
                     check=True,
                     timeout=120,
@@ -2037,15 +2775,26 @@ def wiki(
         else:
             console.print(f"   Cloning wiki...")
             try:
-                result = subprocess.run(
-                    ["git", "clone", wiki_url, str(dest)],
-                    capture_output=True,
+                options = ["--depth=1"] if shallow else []
+                if filter_spec:
+                    options.append(f"--filter={filter_spec}")
+                subprocess.run(
+                    ["git", "clone", *options, wiki_url, str(dest)],
+                    # Fail instead of prompting if the wiki is private or missing
+                    env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
                     check=True,
                     timeout=300,
                 )
                 console.print(f"[green]✅ Wiki cloned to: {dest}[/green]")
             except subprocess.CalledProcessError as e:
+                # GitHub answers "Repository not found" for disabled or empty wikis
+                if "not found" in (e.stderr or "").lower():
+                    console.print(no_wiki)
+                    sys.exit(0)
                 console.print(f"[red]❌ Failed to clone wiki: {e.stderr}[/red]")
                 sys.exit(1)
 
@@ -2410,6 +3159,19 @@ def attachments(
         "--skip-existing/--no-skip-existing",
         help="Skip attachments that already exist locally",
     ),
+    max_workers: int = typer.Option(
+        8,
+        "--max-workers",
+        "-w",
+        help="Maximum number of parallel downloads",
+        min=1,
+        max=32,
+    ),
+    verbose: bool = typer.Option(
+        False,
+        "--verbose",
+        help="Print a line for every downloaded or skipped attachment",
+    ),
     token: str | None = typer.Option(
         None,
         "--token",
@@ -2467,7 +3229,9 @@ def attachments(
         total_failed = 0
         total_skipped = 0
 
-        with AttachmentDownloader(token=token, dest=dest) as downloader:
+        with AttachmentDownloader(
+            token=token, dest=dest, max_workers=max_workers, verbose=verbose
+        ) as downloader:
             # Download from issues
             if source.lower() in ["issues", "all"]:
                 issues_list = client.get_issues(owner, repo, state="all", include_comments=True)
@@ -2578,7 +3342,8 @@ def labels(
         farmore labels myorg/myrepo --format yaml
         farmore labels myorg/myrepo --dest ./my-labels.json
     """
-    if format.lower() not in ["json", "yaml"]:
+    format = format.lower()
+    if format not in ["json", "yaml"]:
         console.print("[red]❌ Error: Format must be 'json' or 'yaml'[/red]")
         sys.exit(1)
 
@@ -2591,7 +3356,7 @@ def labels(
 
     # Determine destination
     if dest is None:
-        dest = Path("backups") / owner / "data" / "labels" / f"{owner}_{repo}_labels.{format.lower()}"
+        dest = Path("backups") / owner / "data" / "labels" / f"{owner}_{repo}_labels.{format}"
 
     # Create parent directory
     dest.parent.mkdir(parents=True, exist_ok=True)
@@ -2625,12 +3390,10 @@ def labels(
         }
 
         # Export to file
-        if format.lower() == "yaml":
-            with open(dest, "w") as f:
-                yaml.dump(labels_data, f, default_flow_style=False, sort_keys=False)
+        if format == "yaml":
+            _write_yaml(dest, labels_data, sort_keys=False)
         else:
-            with open(dest, "w") as f:
-                json.dump(labels_data, f, indent=2)
+            _write_json(dest, labels_data)
 
         # Create summary table
         if labels_list:
@@ -2697,7 +3460,8 @@ def milestones(
         farmore milestones myorg/myrepo --state open
         farmore milestones myorg/myrepo --format yaml
     """
-    if format.lower() not in ["json", "yaml"]:
+    format = format.lower()
+    if format not in ["json", "yaml"]:
         console.print("[red]❌ Error: Format must be 'json' or 'yaml'[/red]")
         sys.exit(1)
 
@@ -2710,7 +3474,7 @@ def milestones(
 
     # Determine destination
     if dest is None:
-        dest = Path("backups") / owner / "data" / "milestones" / f"{owner}_{repo}_milestones.{format.lower()}"
+        dest = Path("backups") / owner / "data" / "milestones" / f"{owner}_{repo}_milestones.{format}"
 
     # Create parent directory
     dest.parent.mkdir(parents=True, exist_ok=True)
@@ -2753,12 +3517,10 @@ def milestones(
         }
 
         # Export to file
-        if format.lower() == "yaml":
-            with open(dest, "w") as f:
-                yaml.dump(milestones_data, f, default_flow_style=False, sort_keys=False)
+        if format == "yaml":
+            _write_yaml(dest, milestones_data, sort_keys=False)
         else:
-            with open(dest, "w") as f:
-                json.dump(milestones_data, f, indent=2)
+            _write_json(dest, milestones_data)
 
         # Create summary table
         if milestones_list:
@@ -2827,7 +3589,8 @@ def webhooks(
         farmore webhooks miztizm/farmore
         farmore webhooks myorg/myrepo --format yaml
     """
-    if format.lower() not in ["json", "yaml"]:
+    format = format.lower()
+    if format not in ["json", "yaml"]:
         console.print("[red]❌ Error: Format must be 'json' or 'yaml'[/red]")
         sys.exit(1)
 
@@ -2840,7 +3603,7 @@ def webhooks(
 
     # Determine destination
     if dest is None:
-        dest = Path("backups") / owner / "data" / "webhooks" / f"{owner}_{repo}_webhooks.{format.lower()}"
+        dest = Path("backups") / owner / "data" / "webhooks" / f"{owner}_{repo}_webhooks.{format}"
 
     # Create parent directory
     dest.parent.mkdir(parents=True, exist_ok=True)
@@ -2878,12 +3641,10 @@ def webhooks(
         }
 
         # Export to file
-        if format.lower() == "yaml":
-            with open(dest, "w") as f:
-                yaml.dump(webhooks_data, f, default_flow_style=False, sort_keys=False)
+        if format == "yaml":
+            _write_yaml(dest, webhooks_data, sort_keys=False)
         else:
-            with open(dest, "w") as f:
-                json.dump(webhooks_data, f, indent=2)
+            _write_json(dest, webhooks_data)
 
         # Create summary table
         if webhooks_list:
@@ -2957,7 +3718,8 @@ def followers(
         farmore followers miztizm --include-following
         farmore followers --format yaml
     """
-    if format.lower() not in ["json", "yaml"]:
+    format = format.lower()
+    if format not in ["json", "yaml"]:
         console.print("[red]❌ Error: Format must be 'json' or 'yaml'[/red]")
         sys.exit(1)
 
@@ -2981,7 +3743,7 @@ def followers(
 
         # Determine destination
         if dest is None:
-            dest = Path("backups") / actual_username / f"followers.{format.lower()}"
+            dest = Path("backups") / actual_username / f"followers.{format}"
 
         # Create parent directory
         dest.parent.mkdir(parents=True, exist_ok=True)
@@ -3025,12 +3787,10 @@ def followers(
             ]
 
         # Export to file
-        if format.lower() == "yaml":
-            with open(dest, "w") as f:
-                yaml.dump(export_data, f, default_flow_style=False, sort_keys=False)
+        if format == "yaml":
+            _write_yaml(dest, export_data, sort_keys=False)
         else:
-            with open(dest, "w") as f:
-                json.dump(export_data, f, indent=2)
+            _write_json(dest, export_data)
 
         # Create summary table
         table = Table(title=f"👥 Social Graph: {actual_username}", border_style="cyan")
@@ -3086,7 +3846,8 @@ def discussions(
         farmore discussions miztizm/farmore
         farmore discussions myorg/myrepo --format yaml
     """
-    if format.lower() not in ["json", "yaml"]:
+    format = format.lower()
+    if format not in ["json", "yaml"]:
         console.print("[red]❌ Error: Format must be 'json' or 'yaml'[/red]")
         sys.exit(1)
 
@@ -3099,7 +3860,7 @@ def discussions(
 
     # Determine destination
     if dest is None:
-        dest = Path("backups") / owner / "data" / "discussions" / f"{owner}_{repo}_discussions.{format.lower()}"
+        dest = Path("backups") / owner / "data" / "discussions" / f"{owner}_{repo}_discussions.{format}"
 
     # Create parent directory
     dest.parent.mkdir(parents=True, exist_ok=True)
@@ -3142,12 +3903,10 @@ def discussions(
         }
 
         # Export to file
-        if format.lower() == "yaml":
-            with open(dest, "w") as f:
-                yaml.dump(discussions_data, f, default_flow_style=False, sort_keys=False)
+        if format == "yaml":
+            _write_yaml(dest, discussions_data, sort_keys=False)
         else:
-            with open(dest, "w") as f:
-                json.dump(discussions_data, f, indent=2)
+            _write_json(dest, discussions_data)
 
         # Create summary table
         if discussions_list:
@@ -3979,7 +4738,8 @@ def projects(
         farmore projects miztizm/farmore  # Repository projects
         farmore projects myorg/myrepo --format yaml
     """
-    if format.lower() not in ["json", "yaml"]:
+    format = format.lower()
+    if format not in ["json", "yaml"]:
         console.print("[red]❌ Error: Format must be 'json' or 'yaml'[/red]")
         sys.exit(1)
 
@@ -3995,9 +4755,9 @@ def projects(
     # Determine destination
     if dest is None:
         if is_repo:
-            dest = Path("backups") / owner / "data" / "projects" / f"{owner}_{repo}_projects.{format.lower()}"
+            dest = Path("backups") / owner / "data" / "projects" / f"{owner}_{repo}_projects.{format}"
         else:
-            dest = Path("backups") / owner / f"projects.{format.lower()}"
+            dest = Path("backups") / owner / f"projects.{format}"
 
     # Create parent directory
     dest.parent.mkdir(parents=True, exist_ok=True)
@@ -4039,12 +4799,10 @@ def projects(
         }
 
         # Export to file
-        if format.lower() == "yaml":
-            with open(dest, "w") as f:
-                yaml.dump(projects_data, f, default_flow_style=False, sort_keys=False)
+        if format == "yaml":
+            _write_yaml(dest, projects_data, sort_keys=False)
         else:
-            with open(dest, "w") as f:
-                json.dump(projects_data, f, indent=2)
+            _write_json(dest, projects_data)
 
         # Create summary table
         if projects_list:
@@ -4091,6 +4849,9 @@ def analytics_report(
     path: Path = typer.Argument(None, help="Path to backup directory (default: backups/)"),
     format: str = typer.Option("text", "--format", "-f", help="Output format: text, json, or yaml"),
     output: Path | None = typer.Option(None, "--output", "-o", help="Save report to file"),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Re-analyze every repository instead of reusing cached stats"
+    ),
 ) -> None:
     """
     Analyze backup directory and generate statistics report.
@@ -4112,14 +4873,13 @@ def analytics_report(
 
     console.print(f"\n[cyan]📊 Analyzing backup directory: {backup_path}[/cyan]")
 
-    analytics = BackupAnalytics(backup_path)
-    report = analytics.generate_report(format=format.lower())
+    analytics = BackupAnalytics(backup_path, use_cache=not no_cache)
 
     if output:
-        output.write_text(report)
+        analytics.write_report(output, format=format.lower())
         print_success(f"Report saved to: {output}")
     else:
-        console.print(report)
+        console.print(analytics.generate_report(format=format.lower()))
 
 
 @app.command("analytics-history")
@@ -4406,6 +5166,14 @@ def use_template(
     target: str = typer.Argument(..., help="GitHub username or organization"),
     dest: Path | None = typer.Option(None, "--dest", "-d", help="Destination directory"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Preview without executing"),
+    max_concurrent_exports: int = typer.Option(
+        4,
+        "--max-concurrent-exports",
+        help="Repositories whose issues/PRs/workflows are held in memory at once, "
+        "never more than the template's parallel workers (lower on small machines)",
+        min=1,
+        max=20,
+    ),
     token: str | None = typer.Option(None, "--token", "-t", envvar="GITHUB_TOKEN", help="GitHub token"),
 ) -> None:
     """
@@ -4465,15 +5233,16 @@ def use_template(
         max_workers=args["parallel_workers"],
     )
 
-    orchestrator = MirrorOrchestrator(config)
+    # One client lists the repositories and exports their data
+    client = GitHubAPIClient(config)
+    orchestrator = MirrorOrchestrator(config, client=client)
     summary = orchestrator.run()
 
     # Export additional data if requested
     if any([args.get("include_issues"), args.get("include_pulls"),
             args.get("include_workflows"), args.get("include_releases"),
             args.get("include_wikis")]):
-        client = GitHubAPIClient(config)
-        repos = client.get_repositories()
+        repos = orchestrator.repos
 
         export_repository_data(
             client=client,
@@ -4485,6 +5254,9 @@ def use_template(
             include_releases=args.get("include_releases", False),
             include_wikis=args.get("include_wikis", False),
             token=token,
+            max_workers=args["parallel_workers"],
+            max_concurrent_exports=max_concurrent_exports,
+            failures_path=get_failed_exports_path(config.dest),
         )
 
     if summary.has_failures and summary.success_count == 0:
@@ -4504,7 +5276,7 @@ def create_template(
     Example:
         farmore template-create my-template --name "My Template" --from-profile daily-backup
     """
-    from .templates import TemplateManager, BackupTemplate
+    from .templates import BackupTemplate, TemplateManager
 
     manager = TemplateManager()
 
@@ -4713,6 +5485,8 @@ def transfer(
         farmore transfer my-repo --org my-org --new-name new-repo-name
         farmore transfer my-repo --org my-org --dry-run
     """
+    from rich.panel import Panel
+
     from .transfer import (
         TransferClient,
         TransferError,
@@ -4722,7 +5496,6 @@ def transfer(
         validate_org_name,
         validate_repo_name,
     )
-    from rich.panel import Panel
 
     # Validate token
     if not token:
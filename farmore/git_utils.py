@@ -4,6 +4,7 @@ Git operations wrapper using subprocess.
 "Git is just a time machine for code. Use it wisely." — schema.cx
 """
 
+import os
 import subprocess
 from pathlib import Path
 
@@ -76,6 +77,8 @@ class GitOperations:
         bare: bool = False,
         lfs: bool = False,
         github_url: str = "https://github.com",
+        depth: int | None = None,
+        filter_spec: str | None = None,
     ) -> tuple[bool, str]:
         """
         Clone a repository.
@@ -89,6 +92,9 @@ class GitOperations:
             bare: Whether to create a bare/mirror clone (preserves all refs)
             lfs: Whether to use Git LFS for cloning (for repos with large files)
             github_url: Base GitHub URL for composing clone URLs (default: https://github.com)
+            depth: Fetch only this many recent commits (shallow clone)
+            filter_spec: Partial-clone filter such as "blob:none"; objects are
+                fetched from the remote on demand
 
         Returns:
             Tuple of (success, message)
@@ -123,21 +129,29 @@ class GitOperations:
         if lfs and not GitOperations.is_lfs_available():
             return False, "Git LFS not installed. Install with: git lfs install"
 
+        # History-trimming options trade backup completeness for transfer size
+        options = []
+        if depth is not None:
+            options.append(f"--depth={depth}")
+        if filter_spec:
+            options.append(f"--filter={filter_spec}")
+
         try:
             # Build the clone command based on options
             if lfs:
                 # Use git lfs clone for LFS-enabled repos
-                cmd = ["git", "lfs", "clone", url, str(dest_path)]
+                cmd = ["git", "lfs", "clone", *options, url, str(dest_path)]
             elif bare:
                 # Use --mirror for true 1:1 backup (all refs, branches, tags)
-                cmd = ["git", "clone", "--mirror", url, str(dest_path)]
+                cmd = ["git", "clone", "--mirror", *options, url, str(dest_path)]
             else:
                 # Standard clone
-                cmd = ["git", "clone", url, str(dest_path)]
+                cmd = ["git", "clone", *options, url, str(dest_path)]
 
             subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True,
                 timeout=1800 if lfs else 900,  # 30 min for LFS, 15 min for regular clones
@@ -185,7 +199,8 @@ class GitOperations:
             subprocess.run(
                 cmd,
                 cwd=path,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True,
                 timeout=120,
@@ -218,7 +233,8 @@ class GitOperations:
             subprocess.run(
                 ["git", "lfs", "fetch", "--all"],
                 cwd=path,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True,
                 timeout=600,  # LFS can take longer
@@ -248,7 +264,8 @@ class GitOperations:
             subprocess.run(
                 ["git", "remote", "update", "--prune"],
                 cwd=path,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True,
                 timeout=300,
@@ -260,6 +277,50 @@ class GitOperations:
             error_msg = e.stderr.strip() if e.stderr else str(e)
             return False, f"Mirror update failed: {error_msg}"
 
+    @staticmethod
+    def remote_head_matches(path: Path, env: dict[str, str] | None = None) -> bool:
+        """
+        Check whether origin's HEAD points at the commit checked out locally.
+
+        "If nothing moved, don't go anywhere." — schema.cx
+
+        One ls-remote round-trip is far cheaper than a fetch, so callers can
+        skip an update entirely when this returns True. Any failure returns
+        False so the caller falls back to a normal update.
+
+        The probe never prompts for credentials, whatever ``env`` (default:
+        the current environment) says; a remote that needs them just fails.
+        """
+        if not GitOperations.is_git_repository(path):
+            return False
+
+        env = {**(os.environ if env is None else env), "GIT_TERMINAL_PROMPT": "0"}
+
+        try:
+            remote = subprocess.run(
+                ["git", "ls-remote", "origin", "HEAD"],
+                cwd=path,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=30,
+            )
+            local = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=path,
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=10,
+            )
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            return False
+
+        remote_fields = remote.stdout.split()
+        return bool(remote_fields) and remote_fields[0] == local.stdout.strip()
+
     @staticmethod
     def pull(path: Path, branch: str = "main") -> tuple[bool, str]:
         """
@@ -282,8 +343,8 @@ class GitOperations:
             subprocess.run(
                 ["git", "checkout", branch],
                 cwd=path,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=30,
                 # Don't check return code - branch might not exist
             )
@@ -4,13 +4,21 @@ GitHub API client with pagination support.
 "The API is just a door. Your token is the key. Don't lose it." — schema.cx
 """
 
+import hashlib
+import json
 import re
+import threading
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import wraps
-from typing import Any, Callable, TypeVar, cast
+from pathlib import Path
+from typing import Any, TypeVar, cast
+from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .models import (
     Config,
@@ -32,6 +40,7 @@ from .models import (
     Workflow,
     WorkflowRun,
 )
+from .response_cache import ResponseCache
 from .rich_utils import console, print_panel, print_warning
 
 
@@ -113,6 +122,175 @@ def retry_on_failure(
     return decorator
 
 
+class RequestThrottle:
+    """
+    Paces API requests and backs off before GitHub's rate limit runs out.
+
+    "The fastest way to get blocked is to never slow down." — schema.cx
+
+    wait() is called before each request and observe() after it. Requests
+    are spaced at most ``rate`` per second when a rate is given. Once fewer
+    than ``reserve_fraction`` of the hourly budget remains, they are spread
+    so the rest lasts until the reset. A ``Retry-After`` header or an
+    exhausted budget pauses every caller until that time. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        reserve_fraction: float = 0.2,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate if rate and rate > 0 else None
+        self.reserve_fraction = reserve_fraction
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._resume_at = 0.0
+        self._budget_interval = 0.0
+
+    def wait(self) -> None:
+        """Block until the next request may be sent."""
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next_slot, self._resume_at)
+            interval = max(1.0 / self.rate if self.rate else 0.0, self._budget_interval)
+            self._next_slot = start + interval
+        if start > now:
+            if start - now >= 5:
+                console.print(
+                    f"[yellow]⏳ Pausing {start - now:.0f}s to stay within the GitHub rate limit...[/yellow]"
+                )
+            self._sleep(start - now)
+
+    def observe(self, response: requests.Response) -> None:
+        """Update pacing from a response's rate-limit headers."""
+        headers = response.headers
+        with self._lock:
+            now = self._clock()
+            retry_after = headers.get("Retry-After")
+            if retry_after is not None:
+                try:
+                    self._resume_at = max(self._resume_at, now + float(retry_after))
+                except ValueError:
+                    pass
+
+            try:
+                limit = int(headers["X-RateLimit-Limit"])
+                remaining = int(headers["X-RateLimit-Remaining"])
+                reset = float(headers["X-RateLimit-Reset"])
+            except (KeyError, ValueError):
+                return
+
+            if remaining <= 0:
+                self._resume_at = max(self._resume_at, reset)
+                self._budget_interval = 0.0
+            elif remaining < limit * self.reserve_fraction:
+                self._budget_interval = max(0.0, reset - now) / remaining
+            else:
+                self._budget_interval = 0.0
+
+
+class _ThrottledAdapter(HTTPAdapter):
+    """Transport adapter that routes every request through a RequestThrottle."""
+
+    def __init__(self, throttle: RequestThrottle, **kwargs: Any) -> None:
+        self.throttle = throttle
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        self.throttle.wait()
+        response = super().send(request, **kwargs)
+        self.throttle.observe(response)
+        return response
+
+
+# Per-connection selections for graphql_bulk_export(). Field aliases make the
+# server return each node with the export's key names, in the export's order,
+# so nodes are written as received after a small in-place fix-up.
+_BULK_EXPORT_CONNECTIONS = {
+    "issues": (
+        "issues(first: 100, after: {cursor}, orderBy: {{field: CREATED_AT, direction: DESC}}) "
+        "{{ pageInfo {{ hasNextPage endCursor }} "
+        "nodes {{ number title state user: author {{ __typename login }} "
+        "created_at: createdAt html_url: url }} }}"
+    ),
+    "pull_requests": (
+        "pullRequests(first: 100, after: {cursor}, orderBy: {{field: CREATED_AT, direction: DESC}}) "
+        "{{ pageInfo {{ hasNextPage endCursor }} "
+        "nodes {{ number title state user: author {{ __typename login }} merged "
+        "created_at: createdAt html_url: url }} }}"
+    ),
+    "releases": (
+        "releases(first: 100, after: {cursor}, orderBy: {{field: CREATED_AT, direction: DESC}}) "
+        "{{ pageInfo {{ hasNextPage endCursor }} "
+        "nodes {{ tag_name: tagName name created_at: createdAt html_url: url }} }}"
+    ),
+}
+
+# GraphQL field name for each key in _BULK_EXPORT_CONNECTIONS
+_BULK_EXPORT_FIELDS = {"issues": "issues", "pull_requests": "pullRequests", "releases": "releases"}
+
+
+def _bulk_export_node(kind: str, node: dict[str, Any]) -> dict[str, Any]:
+    """Finish an aliased GraphQL node in place as the export dict for the REST path."""
+    if kind != "releases":
+        # GraphQL reports merged PRs as MERGED; REST reports them as closed
+        state = node["state"]
+        node["state"] = "closed" if state == "MERGED" else state.lower()
+        author = node["user"]
+        if not author:
+            node["user"] = "ghost"
+        elif author.get("__typename") == "Bot":
+            # GraphQL drops the suffix REST puts on app accounts
+            node["user"] = f"{author['login']}[bot]"
+        else:
+            node["user"] = author["login"]
+    return node
+
+
+def _page_number(url: str | None) -> int | None:
+    """Return the ``page`` query parameter of a pagination link, if any."""
+    if not url:
+        return None
+    pages = parse_qs(urlparse(url).query).get("page")
+    return int(pages[0]) if pages and pages[0].isdigit() else None
+
+
+# REST endpoint and query parameters for each iter_export_items() kind
+_REST_EXPORT_ENDPOINTS = {
+    "issues": ("issues", {"state": "all"}),
+    "pull_requests": ("pulls", {"state": "all"}),
+    "releases": ("releases", {}),
+}
+
+
+def _rest_export_item(kind: str, item: dict[str, Any]) -> dict[str, Any]:
+    """Project a REST list item onto the export dict written by the CLI."""
+    if kind == "releases":
+        return {
+            "tag_name": item["tag_name"],
+            "name": item.get("name"),
+            "created_at": item["created_at"],
+            "html_url": item["html_url"],
+        }
+
+    exported: dict[str, Any] = {
+        "number": item["number"],
+        "title": item["title"],
+        "state": item["state"],
+        "user": item["user"]["login"] if item.get("user") else "ghost",
+    }
+    if kind == "pull_requests":
+        # The list endpoint has no "merged" flag, only merged_at
+        exported["merged"] = item.get("merged_at") is not None
+    exported["created_at"] = item["created_at"]
+    exported["html_url"] = item["html_url"]
+    return exported
+
+
 class GitHubAPIClient:
     """
     GitHub REST API v3 client.
@@ -127,6 +305,27 @@ class GitHubAPIClient:
         self.config = config
         self.session = requests.Session()
 
+        # Every call, REST or GraphQL, is paced against the rate limit; the
+        # pool is sized for the worker threads that share this client
+        self.throttle = RequestThrottle(rate=config.rate_limit_rps)
+        adapter = _ThrottledAdapter(
+            self.throttle,
+            pool_maxsize=max(10, config.max_workers * 2),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Revalidate GETs with stored ETags; 304s are free of rate-limit cost
+        self.response_cache: ResponseCache | None = None
+        if config.response_cache_path is not None:
+            self.response_cache = ResponseCache(config.response_cache_path)
+        # Responses differ by token, so entries are scoped to a hash of it
+        self._cache_scope = (
+            hashlib.sha256(config.token.encode()).hexdigest()[:16] if config.token else "anonymous"
+        )
+        # Set once any GET returns a new body rather than a cached replay
+        self.fetched_fresh = False
+
         # Support GitHub Enterprise with custom API URL or hostname
         if config.github_api_url and config.github_api_url != "https://api.github.com":
             self.BASE_URL = config.github_api_url.rstrip('/')
@@ -164,6 +363,11 @@ class GitHubAPIClient:
         """Close the HTTP session and release resources."""
         if self.session:
             self.session.close()
+        # __del__ may run on an instance whose __init__ failed early
+        cache = getattr(self, "response_cache", None)
+        if cache is not None:
+            cache.close()
+            self.response_cache = None
 
     def __del__(self) -> None:
         """Cleanup when object is garbage collected."""
@@ -302,9 +506,26 @@ class GitHubAPIClient:
                 params.update(initial_params)
         max_retries = 3
 
+        cache = self.response_cache
+        cache_key = ""
+        conditional: dict[str, str] = {}
+        if cache is not None:
+            full_url = requests.Request("GET", url, params=params).prepare().url or url
+            cache_key = f"{self._cache_scope} {full_url}"
+            conditional = cache.conditional_headers(cache_key)
+
         try:
-            response = self.session.get(url, params=params, timeout=30)
+            response = self._get(url, params, conditional)
+            if response.status_code == 304 and cache is not None:
+                cached = cache.load(cache_key, response)
+                if cached is not None:
+                    return cached
+                # Entry vanished between lookup and load; ask again in full
+                response = self._get(url, params, {})
             response.raise_for_status()
+            self.fetched_fresh = True
+            if cache is not None:
+                cache.store(cache_key, response)
             return response
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
@@ -312,9 +533,9 @@ class GitHubAPIClient:
                     f"Target '{self.config.target_name}' not found. "
                     f"Check the {self.config.target_type.value} name."
                 ) from e
-            elif e.response.status_code == 403:
-                # Check if it's a rate limit issue
-                if "X-RateLimit-Remaining" in e.response.headers:
+            elif e.response.status_code in (403, 429):
+                # Check if it's a rate limit issue (primary or secondary)
+                if "X-RateLimit-Remaining" in e.response.headers or "Retry-After" in e.response.headers:
                     remaining = e.response.headers.get("X-RateLimit-Remaining", "0")
                     reset_timestamp = e.response.headers.get("X-RateLimit-Reset", "0")
 
@@ -349,11 +570,23 @@ class GitHubAPIClient:
 
                     # Retry with exponential backoff if we have retries left
                     if retry_count < max_retries:
-                        wait_time = 2**retry_count  # Exponential backoff: 1s, 2s, 4s
+                        # The throttle already honours a numeric Retry-After
+                        # before the next send; otherwise (no header, or an
+                        # HTTP date it cannot parse) back off: 1s, 2s, 4s
+                        wait_time: float = 2**retry_count
+                        throttled = False
+                        retry_after = response.headers.get("Retry-After")
+                        if retry_after is not None:
+                            try:
+                                wait_time = float(retry_after)
+                                throttled = True
+                            except ValueError:
+                                pass
                         console.print(
-                            f"\n[yellow]⏳ Rate limit hit. Retrying in {wait_time} seconds... (attempt {retry_count + 1}/{max_retries})[/yellow]"
+                            f"\n[yellow]⏳ Rate limit hit. Retrying in {wait_time:g} seconds... (attempt {retry_count + 1}/{max_retries})[/yellow]"
                         )
-                        time.sleep(wait_time)
+                        if not throttled:
+                            time.sleep(wait_time)
                         return self._make_request(url, retry_count + 1, initial_params)
 
                     raise RateLimitError(f"GitHub API rate limit exceeded.{limit_info}") from e
@@ -365,6 +598,60 @@ class GitHubAPIClient:
         except requests.exceptions.RequestException as e:
             raise GitHubAPIError(f"Network error: {e}") from e
 
+    @retry_on_failure(max_retries=3, delay=1.0)
+    def _get(self, url: str, params: dict | None, headers: dict[str, str]) -> requests.Response:
+        """
+        Send one GET, retrying dropped connections, timeouts and 502/503/504.
+
+        Other error statuses are returned for _make_request to interpret.
+        """
+        response = self.session.get(url, params=params, timeout=30, headers=headers)
+        if response.status_code in (502, 503, 504):
+            response.raise_for_status()
+        return response
+
+    def _iter_pages(self, url: str, params: dict[str, Any]) -> Iterator[Any]:
+        """
+        Yield the JSON of each page of a page-numbered list endpoint, in order.
+
+        "Why wait for page two to ask for page three?" — schema.cx
+
+        The first page's Link rel="last" gives the page count, so the rest
+        are fetched concurrently, up to config.max_workers at a time. An
+        endpoint that does not advertise its last page is followed one
+        rel="next" at a time. Iteration stops at the first empty page.
+        """
+        params = {**params, "page": 1}
+        response = self._make_request(url, initial_params=params)
+        data = response.json()
+        if not data:
+            return
+        yield data
+
+        last_page = _page_number(response.links.get("last", {}).get("url"))
+        if last_page is None:
+            while "next" in response.links:
+                params["page"] += 1
+                response = self._make_request(url, initial_params=dict(params))
+                data = response.json()
+                if not data:
+                    return
+                yield data
+            return
+
+        def fetch(page: int) -> Any:
+            return self._make_request(url, initial_params={**params, "page": page}).json()
+
+        executor = ThreadPoolExecutor(max_workers=max(1, self.config.max_workers))
+        try:
+            for data in executor.map(fetch, range(2, last_page + 1)):
+                if not data:
+                    return
+                yield data
+        finally:
+            # Drop queued pages if the caller stops early or a page fails
+            executor.shutdown(cancel_futures=True)
+
     def _display_rate_limit_info(self, response: requests.Response) -> None:
         """
         Display rate limit information from response headers.
@@ -729,7 +1016,9 @@ class GitHubAPIClient:
         print_warning("Note: GitHub API only returns secret names, not values", prefix="⚠️")
 
         try:
-            response = self._make_request(f"{self.BASE_URL}{endpoint}")
+            response = self._make_request(
+                f"{self.BASE_URL}{endpoint}", initial_params={"per_page": self.PER_PAGE}
+            )
             data = response.json()
 
             secrets = []
@@ -788,15 +1077,9 @@ class GitHubAPIClient:
         console.print(f"   [dim]State filter: {state}[/dim]")
 
         all_issues: list[Issue] = []
-        params: dict[str, str | int] = {"state": state, "per_page": self.PER_PAGE, "page": 1}
-
-        while True:
-            response = self._make_request(f"{self.BASE_URL}{endpoint}", initial_params=params)
-            data = response.json()
-
-            if not data:
-                break
+        params: dict[str, str | int] = {"state": state, "per_page": self.PER_PAGE}
 
+        for data in self._iter_pages(f"{self.BASE_URL}{endpoint}", params):
             for item in data:
                 # Skip pull requests (they appear in issues API but have 'pull_request' key)
                 if "pull_request" in item:
@@ -828,11 +1111,6 @@ class GitHubAPIClient:
                     print_warning(f"Skipping issue #{item.get('number', '?')}: {e}", prefix="⚠️")
                     continue
 
-            # Check for next page
-            if "next" not in response.links:
-                break
-
-            params["page"] = int(params["page"]) + 1
 
         console.print(f"   [green]✓ Found {len(all_issues)} issues[/green]")
         return all_issues
@@ -840,8 +1118,7 @@ class GitHubAPIClient:
     def _get_issue_comments(self, owner: str, repo: str, issue_number: int) -> list[dict]:
         """Fetch comments for a specific issue."""
         endpoint = f"/repos/{owner}/{repo}/issues/{issue_number}/comments"
-        response = self._make_request(f"{self.BASE_URL}{endpoint}")
-        data = response.json()
+        params = {"per_page": self.PER_PAGE}
 
         return [
             {
@@ -850,6 +1127,7 @@ class GitHubAPIClient:
                 "created_at": comment["created_at"],
                 "updated_at": comment["updated_at"],
             }
+            for data in self._iter_pages(f"{self.BASE_URL}{endpoint}", params)
             for comment in data
         ]
 
@@ -866,15 +1144,9 @@ class GitHubAPIClient:
         console.print(f"   [dim]State filter: {state}[/dim]")
 
         all_prs: list[PullRequest] = []
-        params: dict[str, str | int] = {"state": state, "per_page": self.PER_PAGE, "page": 1}
-
-        while True:
-            response = self._make_request(f"{self.BASE_URL}{endpoint}", initial_params=params)
-            data = response.json()
-
-            if not data:
-                break
+        params: dict[str, str | int] = {"state": state, "per_page": self.PER_PAGE}
 
+        for data in self._iter_pages(f"{self.BASE_URL}{endpoint}", params):
             for item in data:
                 pr = PullRequest(
                     number=item["number"],
@@ -907,20 +1179,13 @@ class GitHubAPIClient:
 
                 all_prs.append(pr)
 
-            # Check for next page
-            if "next" not in response.links:
-                break
-
-            params["page"] = int(params["page"]) + 1
-
         console.print(f"   [green]✓ Found {len(all_prs)} pull requests[/green]")
         return all_prs
 
     def _get_pr_comments(self, owner: str, repo: str, pr_number: int) -> list[dict]:
         """Fetch comments for a specific pull request."""
         endpoint = f"/repos/{owner}/{repo}/issues/{pr_number}/comments"
-        response = self._make_request(f"{self.BASE_URL}{endpoint}")
-        data = response.json()
+        params = {"per_page": self.PER_PAGE}
 
         return [
             {
@@ -929,6 +1194,7 @@ class GitHubAPIClient:
                 "created_at": comment["created_at"],
                 "updated_at": comment["updated_at"],
             }
+            for data in self._iter_pages(f"{self.BASE_URL}{endpoint}", params)
             for comment in data
         ]
 
@@ -944,14 +1210,14 @@ class GitHubAPIClient:
         console.print(f"\n[cyan]⚙️  Fetching GitHub Actions workflows for: {owner}/{repo}[/cyan]")
 
         try:
-            response = self._make_request(f"{self.BASE_URL}{endpoint}")
+            response = self._make_request(
+                f"{self.BASE_URL}{endpoint}", initial_params={"per_page": self.PER_PAGE}
+            )
             data = response.json()
 
-            workflows = []
-            workflow_files = []
-
-            for item in data.get("workflows", []):
-                workflow = Workflow(
+            items = data.get("workflows", [])
+            workflows = [
+                Workflow(
                     name=item["name"],
                     path=item["path"],
                     state=item["state"],
@@ -960,14 +1226,19 @@ class GitHubAPIClient:
                     html_url=item["html_url"],
                     badge_url=item["badge_url"],
                 )
-                workflows.append(workflow)
+                for item in items
+            ]
 
-                # Fetch workflow file content
-                file_content = self._get_workflow_file(owner, repo, item["path"])
-                if file_content:
-                    workflow_files.append(
-                        {"path": item["path"], "name": item["name"], "content": file_content}
-                    )
+            # Each file is its own contents request, so fetch them concurrently
+            with ThreadPoolExecutor(max_workers=max(1, self.config.max_workers)) as executor:
+                contents = executor.map(
+                    lambda item: self._get_workflow_file(owner, repo, item["path"]), items
+                )
+                workflow_files = [
+                    {"path": item["path"], "name": item["name"], "content": file_content}
+                    for item, file_content in zip(items, contents)
+                    if file_content
+                ]
 
             console.print(f"   [green]✓ Found {len(workflows)} workflows[/green]")
             return workflows, workflow_files
@@ -1105,6 +1376,32 @@ class GitHubAPIClient:
                 return []
             raise
 
+    def _export_signature(self, options: dict[str, Any]) -> str:
+        """Identify an export by its options and the token that fetched it."""
+        return json.dumps({**options, "scope": self._cache_scope}, sort_keys=True)
+
+    def export_is_current(self, dest: Path, options: dict[str, Any]) -> bool:
+        """
+        Check whether dest already holds this export and nothing changed upstream.
+
+        "Rewriting the same bytes is still work." — schema.cx
+
+        True only when the response cache is enabled, every request so far
+        was answered 304, and dest was last written with the same options
+        and token (see record_export).
+        """
+        if self.response_cache is None or self.fetched_fresh or not dest.exists():
+            return False
+        recorded = self.response_cache.export_signature(str(dest.resolve()))
+        return recorded == self._export_signature(options)
+
+    def record_export(self, dest: Path, options: dict[str, Any]) -> None:
+        """Record the options dest was just written with, for export_is_current."""
+        if self.response_cache is not None:
+            self.response_cache.record_export(
+                str(dest.resolve()), self._export_signature(options)
+            )
+
     def check_wiki_exists(self, owner: str, repo: str) -> bool:
         """
         Check if a repository has a wiki enabled.
@@ -1480,6 +1777,182 @@ class GitHubAPIClient:
             print_warning(f"Failed to fetch discussions: {e}", prefix="⚠️")
             return []
 
+    def iter_export_items(self, owner: str, repo: str, kind: str) -> Iterator[dict[str, Any]]:
+        """
+        Yield a repository's issues, pull requests or releases as export dicts.
+
+        "Take only what you need. Leave the rest on the wire." — schema.cx
+
+        Unlike get_issues() and friends, items are projected straight from
+        each page of JSON onto the few fields the export writes, without
+        building model objects or printing progress.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            kind: "issues", "pull_requests" or "releases"
+
+        Yields:
+            Dicts shaped like those from graphql_bulk_export()
+        """
+        path, filters = _REST_EXPORT_ENDPOINTS[kind]
+        pages = self._iter_pages(
+            f"{self.BASE_URL}/repos/{owner}/{repo}/{path}",
+            {**filters, "per_page": self.PER_PAGE},
+        )
+
+        try:
+            for data in pages:
+                for item in data:
+                    # The issues endpoint also lists pull requests
+                    if kind == "issues" and "pull_request" in item:
+                        continue
+                    yield _rest_export_item(kind, item)
+        except GitHubAPIError as e:
+            # As in get_releases(), a repository without releases may 404
+            cause = e.__cause__
+            if (
+                kind == "releases"
+                and isinstance(cause, requests.HTTPError)
+                and cause.response is not None
+                and cause.response.status_code == 404
+            ):
+                return
+            raise
+
+    def _graphql_url(self) -> str:
+        """Return the GraphQL endpoint that matches BASE_URL."""
+        # GitHub Enterprise serves REST at /api/v3 and GraphQL at /api/graphql
+        if self.BASE_URL.endswith("/api/v3"):
+            return f"{self.BASE_URL[: -len('/v3')]}/graphql"
+        return f"{self.BASE_URL}/graphql"
+
+    def _graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """
+        Run a GraphQL query and return its data.
+
+        Raises:
+            GitHubAPIError: On HTTP failure or any error other than NOT_FOUND
+        """
+        try:
+            response = self.session.post(
+                self._graphql_url(),
+                json={"query": query, "variables": variables},
+                timeout=60,
+            )
+            response.raise_for_status()
+            payload = response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise GitHubAPIError(f"GraphQL request failed: {e}") from e
+
+        # Unresolvable repositories come back as null aliases plus a
+        # NOT_FOUND error; anything else fails the whole query
+        errors = [e for e in payload.get("errors") or [] if e.get("type") != "NOT_FOUND"]
+        if errors:
+            error_msg = errors[0].get("message", "Unknown GraphQL error")
+            raise GitHubAPIError(f"GraphQL error: {error_msg}")
+        return cast(dict[str, Any], payload.get("data") or {})
+
+    def graphql_bulk_export(
+        self,
+        repos: list[Repository],
+        include_issues: bool = True,
+        include_pulls: bool = True,
+        include_releases: bool = True,
+        batch_size: int = 20,
+    ) -> dict[str, dict[str, list[dict[str, Any]]]]:
+        """
+        Fetch issues, pull requests and releases for many repositories at once.
+
+        "Why knock on a hundred doors when one will do?" — schema.cx
+
+        Repositories are queried in batches of ``batch_size`` using GraphQL
+        aliases, so the first 100 items of every connection for a whole batch
+        cost one request. Connections with more items are then paginated per
+        repository with their cursors.
+
+        Args:
+            repos: Repositories to export
+            include_issues: Fetch issues
+            include_pulls: Fetch pull requests
+            include_releases: Fetch releases
+            batch_size: Repositories per aliased query
+
+        Returns:
+            Mapping of "owner/name" to {kind: [export dicts]}, where kind is
+            "issues", "pull_requests" or "releases". Repositories GitHub could
+            not resolve are left out.
+
+        Raises:
+            GitHubAPIError: If a query fails
+        """
+        kinds = [
+            kind
+            for kind, wanted in (
+                ("issues", include_issues),
+                ("pull_requests", include_pulls),
+                ("releases", include_releases),
+            )
+            if wanted
+        ]
+        results: dict[str, dict[str, list[dict[str, Any]]]] = {}
+        if not kinds or not repos:
+            return results
+
+        first_page = " ".join(
+            _BULK_EXPORT_CONNECTIONS[kind].format(cursor="null") for kind in kinds
+        )
+        pending: list[tuple[Repository, str, str]] = []
+
+        for offset in range(0, len(repos), batch_size):
+            batch = repos[offset : offset + batch_size]
+            params = ", ".join(f"$o{i}: String!, $n{i}: String!" for i in range(len(batch)))
+            aliases = " ".join(
+                f"r{i}: repository(owner: $o{i}, name: $n{i}) {{ {first_page} }}"
+                for i in range(len(batch))
+            )
+            variables: dict[str, Any] = {}
+            for i, repo in enumerate(batch):
+                variables[f"o{i}"] = repo.owner
+                variables[f"n{i}"] = repo.name
+
+            data = self._graphql(f"query({params}) {{ {aliases} }}", variables)
+
+            for i, repo in enumerate(batch):
+                repo_data = data.get(f"r{i}")
+                if not repo_data:
+                    continue
+                exported = results.setdefault(repo.full_name, {})
+                for kind in kinds:
+                    connection = repo_data[_BULK_EXPORT_FIELDS[kind]]
+                    exported[kind] = [_bulk_export_node(kind, node) for node in connection["nodes"]]
+                    if connection["pageInfo"]["hasNextPage"]:
+                        pending.append((repo, kind, connection["pageInfo"]["endCursor"]))
+
+        # Follow the cursors of connections longer than one page
+        for repo, kind, end_cursor in pending:
+            cursor: str | None = end_cursor
+            selection = _BULK_EXPORT_CONNECTIONS[kind].format(cursor="$cursor")
+            query = (
+                "query($owner: String!, $name: String!, $cursor: String) "
+                f"{{ repository(owner: $owner, name: $name) {{ {selection} }} }}"
+            )
+            items = results[repo.full_name][kind]
+            while cursor:
+                data = self._graphql(
+                    query, {"owner": repo.owner, "name": repo.name, "cursor": cursor}
+                )
+                if not data.get("repository"):
+                    raise GitHubAPIError(
+                        f"GraphQL error: {repo.full_name} disappeared while paging {kind}"
+                    )
+                connection = data["repository"][_BULK_EXPORT_FIELDS[kind]]
+                items.extend(_bulk_export_node(kind, node) for node in connection["nodes"])
+                page_info = connection["pageInfo"]
+                cursor = page_info["endCursor"] if page_info["hasNextPage"] else None
+
+        return results
+
     def get_projects(self, owner: str, repo: str | None = None) -> list[Project]:
         """
         Fetch all projects for a user/org or repository using GraphQL API.
@@ -28,10 +28,21 @@ class MirrorOrchestrator:
     "Orchestration is just delegation with a fancy name." — schema.cx
     """
 
-    def __init__(self, config: Config) -> None:
-        """Initialize the mirror orchestrator."""
+    def __init__(self, config: Config, client: GitHubAPIClient | None = None) -> None:
+        """
+        Initialize the mirror orchestrator.
+
+        Args:
+            config: Mirror configuration
+            client: API client to list repositories with, so callers that make
+                further API calls can share its session (default: a new
+                client for each run)
+        """
         self.config = config
+        self.client = client
         self.git_ops = GitOperations()
+        # Repositories handled by the last run(), for callers that export more data
+        self.repos: list[Repository] = []
 
     def run(self, repos: list[Repository] | None = None) -> MirrorSummary:
         """
@@ -58,8 +69,13 @@ class MirrorOrchestrator:
                         "will be mirrored.[/yellow]"
                     )
 
-                with GitHubAPIClient(self.config) as api_client:
-                    repos = api_client.get_repositories()
+                if self.client is not None:
+                    repos = self.client.get_repositories()
+                else:
+                    with GitHubAPIClient(self.config) as api_client:
+                        repos = api_client.get_repositories()
+
+            self.repos = repos
 
             if not repos:
                 console.print(
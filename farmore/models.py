@@ -103,6 +103,8 @@ class Config:
     dry_run: bool = False
     max_workers: int = 4
     skip_existing: bool = False  # Skip repos that already exist locally
+    rate_limit_rps: float | None = None  # Cap on GitHub API requests per second
+    response_cache_path: Path | None = None  # SQLite ETag cache for API GETs (None disables)
 
     # Git clone options
     use_ssh: bool = True  # Prefer SSH, fallback to HTTPS
@@ -0,0 +1,148 @@
+"""
+Conditional-request cache for GitHub API responses.
+
+"The cheapest request is the one the server answers with 'nothing changed'." — schema.cx
+
+GitHub answers a GET carrying a matching ``If-None-Match`` or
+``If-Modified-Since`` with ``304 Not Modified`` and no body, and such
+responses do not count against the rate limit. This module keeps the
+validators and last body of each GET in a small SQLite database so
+repeated backups of quiet repositories cost almost nothing.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# Response headers replayed on a cache hit; Link drives pagination
+_REPLAYED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link")
+
+
+class ResponseCache:
+    """
+    ETag/Last-Modified store for GET responses, keyed by full request URL.
+
+    "Remember what they told you. Ask only if it changed." — schema.cx
+    """
+
+    DEFAULT_PATH = Path("backups") / ".cache" / "etags.db"
+
+    def __init__(self, path: Path | None = None) -> None:
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file to use (default: backups/.cache/etags.db)
+        """
+        self.path = path or self.DEFAULT_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, "
+                "content_type TEXT, link TEXT, body BLOB)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS exports (dest TEXT PRIMARY KEY, signature TEXT)"
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """
+        Return the If-None-Match / If-Modified-Since headers for a URL.
+
+        Returns an empty dict when nothing is cached for it.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return {}
+
+        etag, last_modified = row
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def load(self, url: str, not_modified: requests.Response) -> requests.Response | None:
+        """
+        Rebuild the cached 200 response for a URL after a 304.
+
+        Args:
+            url: Cache key the request was made with
+            not_modified: The 304 response, used for its request metadata
+
+        Returns:
+            A response carrying the cached body and headers, or None if the
+            entry has disappeared
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, content_type, link, body FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = row[4]
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict(
+            {
+                name: value
+                for name, value in zip(_REPLAYED_HEADERS, (row[2], row[0], row[1], row[3]))
+                if value is not None
+            }
+        )
+        return response
+
+    def store(self, url: str, response: requests.Response) -> None:
+        """Cache a 200 response if it carries a validator."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != 200 or not (etag or last_modified):
+            return
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    etag,
+                    last_modified,
+                    response.headers.get("Content-Type"),
+                    response.headers.get("Link"),
+                    response.content,
+                ),
+            )
+
+    def export_signature(self, dest: str) -> str | None:
+        """Return the signature recorded for the last export written to dest."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT signature FROM exports WHERE dest = ?", (dest,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def record_export(self, dest: str, signature: str) -> None:
+        """Remember which request options produced the export at dest."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO exports VALUES (?, ?)", (dest, signature)
+            )
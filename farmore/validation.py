@@ -7,6 +7,10 @@ Input validation utilities for Farmore.
 import re
 from pathlib import Path
 
+# GitHub owner and repository names: alphanumerics, '.', '-' and '_'
+_GITHUB_NAME_RE = re.compile(r'^[a-zA-Z0-9._-]+$')
+_FILENAME_UNSAFE_RE = re.compile(r'[^a-zA-Z0-9._-]')
+
 
 class ValidationError(Exception):
     """Raised when input validation fails."""
@@ -41,16 +45,13 @@ def validate_repository_format(repository: str) -> tuple[str, str]:
     owner, repo = parts
     
     # Validate owner and repo names (GitHub's allowed characters)
-    # Pattern: alphanumeric, hyphens, underscores, periods (no spaces or special chars)
-    github_name_pattern = r'^[a-zA-Z0-9._-]+$'
-    
-    if not re.match(github_name_pattern, owner):
+    if not _GITHUB_NAME_RE.match(owner):
         raise ValidationError(
             f"Invalid owner name '{owner}'. "
             "Only alphanumeric characters, '.', '-', and '_' are allowed."
         )
     
-    if not re.match(github_name_pattern, repo):
+    if not _GITHUB_NAME_RE.match(repo):
         raise ValidationError(
             f"Invalid repository name '{repo}'. "
             "Only alphanumeric characters, '.', '-', and '_' are allowed."
@@ -204,7 +205,7 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
     """
     # Remove or replace unsafe characters
     # Keep alphanumeric, hyphens, underscores, and periods
-    sanitized = re.sub(r'[^a-zA-Z0-9._-]', '_', filename)
+    sanitized = _FILENAME_UNSAFE_RE.sub('_', filename)
     
     # Remove leading/trailing periods and underscores
     sanitized = sanitized.strip('._')
@@ -1,6 +1,7 @@
 """Tests for the analytics module."""
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -12,9 +13,30 @@ from farmore.analytics import (
     BackupHistory,
     BackupStats,
     RepositoryStats,
+    _file_contains,
 )
 
 
+class TestFileContains:
+    """Tests for the chunked substring search helper."""
+
+    def test_match_across_chunk_boundary(self, tmp_path):
+        """Test that a needle split between two chunks is found."""
+        path = tmp_path / ".gitattributes"
+        path.write_bytes(b"x" * 10 + b"filter=lfs")
+        assert _file_contains(path, b"filter=lfs", chunk_size=14)
+
+    def test_no_match(self, tmp_path):
+        """Test a file without the needle."""
+        path = tmp_path / ".gitattributes"
+        path.write_bytes(b"*.txt text\n" * 100)
+        assert not _file_contains(path, b"filter=lfs", chunk_size=16)
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing file is treated as no match."""
+        assert not _file_contains(tmp_path / "missing", b"filter=lfs")
+
+
 class TestRepositoryStats:
     """Tests for the RepositoryStats dataclass."""
 
@@ -190,6 +212,22 @@ class TestBackupAnalytics:
         stats = analytics.analyze_directory()
         assert stats.total_repositories >= 1
 
+    def test_analyze_directory_aggregates_in_parallel(self, tmp_path):
+        """Test that concurrent analysis aggregates every repository."""
+        for i in range(5):
+            repo = tmp_path / f"repo{i}"
+            (repo / ".git").mkdir(parents=True)
+            (repo / "main.py").write_text("x = 1\n")
+
+        analytics = BackupAnalytics(backup_dir=tmp_path)
+        stats = analytics.analyze_directory(max_workers=3)
+
+        assert stats.total_repositories == 5
+        assert len(stats.repositories) == 5
+        assert stats.total_files == 5
+        assert stats.languages["Python"] == 5
+
+    @patch("farmore.analytics.pygit2", None)
     @patch("subprocess.run")
     def test_analyze_repository(self, mock_run, analytics, mock_repo_dir):
         """Test analyzing a single repository."""
@@ -203,6 +241,127 @@ class TestBackupAnalytics:
         assert stats is not None
         assert stats.name == "test-repo"
 
+    @patch("farmore.analytics.pygit2", None)
+    @patch("subprocess.run")
+    def test_analyze_repository_parses_refs(self, mock_run, analytics, mock_repo_dir):
+        """Test branch, tag and date parsing from a single ref listing."""
+        refs = "\n".join([
+            "*\0refs/heads/main\0\0" + "2024-06-01 10:00:00 +0000",
+            " \0refs/heads/dev\0\0" + "2024-05-01 10:00:00 +0000",
+            " \0refs/remotes/origin/HEAD\0refs/remotes/origin/main\0" + "2024-06-01 10:00:00 +0000",
+            " \0refs/remotes/origin/main\0\0" + "2024-06-01 10:00:00 +0000",
+            " \0refs/tags/v1.0\0\0",
+        ])
+
+        def fake_run(cmd, **kwargs):
+            if "for-each-ref" in cmd:
+                return MagicMock(returncode=0, stdout=refs + "\n")
+            return MagicMock(returncode=0, stdout="42\n")
+
+        mock_run.side_effect = fake_run
+
+        stats = analytics.analyze_repository(mock_repo_dir)
+        assert stats.branch_count == 3
+        assert stats.tag_count == 1
+        assert stats.commit_count == 42
+        assert stats.last_commit_date == "2024-06-01 10:00:00 +0000"
+        assert mock_run.call_count == 2
+
+    @patch("farmore.analytics.pygit2", None)
+    def test_analyze_repository_uses_stats_cache(self, tmp_path, mock_repo_dir):
+        """Test that unchanged repositories are served from the stats cache."""
+        (mock_repo_dir / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        BackupAnalytics(backup_dir=tmp_path).analyze_directory()
+        assert (tmp_path / BackupAnalytics.STATS_CACHE_FILE).exists()
+
+        with patch("subprocess.run") as mock_run:
+            analytics = BackupAnalytics(backup_dir=tmp_path)
+            stats = analytics.analyze_repository(mock_repo_dir)
+            mock_run.assert_not_called()
+        assert stats.name == "test-repo"
+        assert stats.path == mock_repo_dir
+        assert stats.file_count == 2
+
+        # Moving HEAD invalidates the entry
+        head = mock_repo_dir / ".git" / "HEAD"
+        mtime = head.stat().st_mtime_ns + 1_000_000_000
+        os.utime(head, ns=(mtime, mtime))
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="7\n")
+            stats = BackupAnalytics(backup_dir=tmp_path).analyze_repository(mock_repo_dir)
+            assert mock_run.called
+        assert stats.commit_count == 7
+
+    @patch("farmore.analytics.pygit2", None)
+    def test_truncated_stats_cache_is_per_max_files(self, tmp_path, mock_repo_dir):
+        """Test that stats cut short by max_files are not reused for a full walk."""
+        (mock_repo_dir / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="1\n")
+            analytics = BackupAnalytics(backup_dir=tmp_path)
+            truncated = analytics.analyze_repository(mock_repo_dir, max_files=1)
+            assert truncated.truncated
+            assert analytics.analyze_repository(mock_repo_dir, max_files=1).file_count == 1
+
+            full = analytics.analyze_repository(mock_repo_dir, max_files=None)
+            assert not full.truncated
+            assert full.file_count == 2
+            # A complete walk answers any limit
+            assert analytics.analyze_repository(mock_repo_dir, max_files=1).file_count == 2
+
+    def test_analyze_repository_without_cache(self, tmp_path, mock_repo_dir):
+        """Test that use_cache=False neither reads nor writes the cache."""
+        analytics = BackupAnalytics(backup_dir=tmp_path, use_cache=False)
+        analytics.analyze_directory()
+        assert not (tmp_path / BackupAnalytics.STATS_CACHE_FILE).exists()
+
+    def test_pygit2_matches_subprocess(self, analytics, tmp_path):
+        """Test that the libgit2 backend reports the same stats as git."""
+        pytest.importorskip("pygit2")
+        import subprocess
+
+        repo = tmp_path / "real-repo"
+        repo.mkdir()
+        git = ["git", "-C", str(repo), "-c", "user.name=t", "-c", "user.email=t@t"]
+        subprocess.run([*git, "init", "-q"], check=True)
+        for message in ("one", "two"):
+            subprocess.run([*git, "commit", "-q", "--allow-empty", "-m", message], check=True)
+        subprocess.run([*git, "tag", "v1"], check=True)
+        subprocess.run([*git, "branch", "feature"], check=True)
+
+        fast = analytics.analyze_repository(repo)
+        with patch("farmore.analytics.pygit2", None):
+            slow = BackupAnalytics(backup_dir=tmp_path, use_cache=False).analyze_repository(repo)
+
+        assert fast.commit_count == slow.commit_count == 2
+        assert fast.branch_count == slow.branch_count == 2
+        assert fast.tag_count == slow.tag_count == 1
+        assert fast.last_commit_date == slow.last_commit_date
+
+    @patch("farmore.analytics.pygit2", None)
+    @patch("subprocess.run")
+    def test_analyze_bare_repository_size(self, mock_run, analytics, tmp_path):
+        """Test that bare repository size comes from git count-objects."""
+        bare = tmp_path / "mirror.git"
+        (bare / "objects").mkdir(parents=True)
+        (bare / "refs").mkdir()
+        (bare / "HEAD").write_text("ref: refs/heads/main\n")
+
+        def fake_run(cmd, **kwargs):
+            if "count-objects" in cmd:
+                return MagicMock(
+                    returncode=0,
+                    stdout="count: 3\nsize: 12\nin-pack: 40\npacks: 1\nsize-pack: 100\nsize-garbage: 0\n",
+                )
+            return MagicMock(returncode=1, stdout="")
+
+        mock_run.side_effect = fake_run
+
+        stats = analytics.analyze_repository(bare)
+        assert stats.is_bare is True
+        assert stats.size_bytes == 112 * 1024
+        assert stats.file_count == 0
+
     def test_record_backup(self, analytics):
         """Test recording backup history."""
         history = analytics.record_backup(
@@ -230,6 +389,81 @@ class TestBackupAnalytics:
         history = analytics.get_history(limit=3)
         assert len(history) == 3
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_history_round_trip(self, tmp_path, use_orjson):
+        """Test that history survives a reload with and without orjson."""
+        import farmore.analytics as analytics_module
+
+        backend = analytics_module.orjson if use_orjson else None
+        if use_orjson and backend is None:
+            pytest.skip("orjson not installed")
+
+        with patch.object(analytics_module, "orjson", backend):
+            analytics = BackupAnalytics(backup_dir=tmp_path)
+            analytics.record_backup(
+                repos_cloned=2,
+                repos_updated=3,
+                repos_failed=1,
+                duration_seconds=42.5,
+                error_message="Network error",
+            )
+            reloaded = BackupAnalytics(backup_dir=tmp_path).get_history()
+
+        assert len(reloaded) == 1
+        assert reloaded[0].repos_updated == 3
+        assert reloaded[0].error_message == "Network error"
+
+    def test_record_backup_appends_lines(self, analytics, tmp_path):
+        """Test that each record is appended as one JSON line."""
+        for i in range(3):
+            analytics.record_backup(
+                repos_cloned=i,
+                repos_updated=0,
+                repos_failed=0,
+                duration_seconds=10,
+            )
+
+        lines = (tmp_path / BackupAnalytics.HISTORY_FILE).read_text().splitlines()
+        assert len(lines) == 3
+        assert [json.loads(line)["repos_cloned"] for line in lines] == [0, 1, 2]
+
+    def test_history_compaction(self, analytics, tmp_path):
+        """Test that the history file is compacted once it doubles the cap."""
+        for i in range(2 * BackupAnalytics.MAX_HISTORY + 1):
+            analytics.record_backup(
+                repos_cloned=i,
+                repos_updated=0,
+                repos_failed=0,
+                duration_seconds=1,
+            )
+
+        lines = (tmp_path / BackupAnalytics.HISTORY_FILE).read_text().splitlines()
+        assert len(lines) == BackupAnalytics.MAX_HISTORY
+
+        reloaded = BackupAnalytics(backup_dir=tmp_path).get_history(limit=1000)
+        assert len(reloaded) == BackupAnalytics.MAX_HISTORY
+        assert reloaded[-1].repos_cloned == 2 * BackupAnalytics.MAX_HISTORY
+
+    def test_legacy_history_is_migrated(self, tmp_path):
+        """Test that the old single-document history is still read."""
+        legacy = {
+            "version": "1.0",
+            "history": [
+                {"backup_id": "old1", "started_at": "2024-01-01T00:00:00"},
+            ],
+        }
+        (tmp_path / BackupAnalytics.LEGACY_HISTORY_FILE).write_text(json.dumps(legacy))
+
+        analytics = BackupAnalytics(backup_dir=tmp_path)
+        assert [h.backup_id for h in analytics.get_history()] == ["old1"]
+
+        analytics.record_backup(
+            repos_cloned=1, repos_updated=0, repos_failed=0, duration_seconds=1
+        )
+        lines = (tmp_path / BackupAnalytics.HISTORY_FILE).read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["backup_id"] == "old1"
+
     def test_generate_report_text(self, analytics, tmp_path):
         """Test generating text report."""
         report = analytics.generate_report(format="text")
@@ -241,6 +475,33 @@ class TestBackupAnalytics:
         data = json.loads(report)
         assert "total_repositories" in data
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_report_matches_to_dict(self, tmp_path, mock_repo_dir, use_orjson):
+        """Test that the streamed JSON report equals the stats dictionary."""
+        import farmore.analytics as analytics_module
+
+        backend = analytics_module.orjson if use_orjson else None
+        if use_orjson and backend is None:
+            pytest.skip("orjson not installed")
+
+        analytics = BackupAnalytics(backup_dir=tmp_path, use_cache=False)
+        stats = analytics.analyze_directory()
+        with patch.object(analytics_module, "orjson", backend):
+            streamed = b"".join(analytics._iter_json_report(stats))
+            empty = b"".join(analytics._iter_json_report(BackupStats(path=tmp_path)))
+
+        assert json.loads(streamed) == stats.to_dict()
+        assert json.loads(empty)["repositories"] == []
+
+    def test_write_report_json(self, tmp_path, mock_repo_dir):
+        """Test writing a JSON report straight to a file."""
+        output = tmp_path / "report.json"
+        BackupAnalytics(backup_dir=tmp_path).write_report(output, format="json")
+
+        data = json.loads(output.read_text())
+        assert data["total_repositories"] == 1
+        assert data["repositories"][0]["name"] == "test-repo"
+
     def test_get_growth_stats_no_history(self, analytics):
         """Test getting growth stats with no history."""
         stats = analytics.get_growth_stats()
@@ -261,6 +522,61 @@ class TestBackupAnalytics:
         assert stats["has_data"] is True
         assert stats["backup_count"] == 3
 
+    def test_walk_repo_single_pass(self, analytics, mock_repo_dir):
+        """Test that one walk yields size, file count and languages."""
+        (mock_repo_dir / ".git" / "config").write_text("[core]\n")
+        size, file_count, languages, truncated = analytics._walk_repo(mock_repo_dir)
+
+        # Git metadata counts towards size but not towards files
+        assert size == sum(
+            p.stat().st_size for p in mock_repo_dir.rglob("*") if p.is_file()
+        )
+        assert file_count == 2
+        assert languages == {"Markdown": 1, "Python": 1}
+        assert truncated is False
+
+    def test_walk_repo_hidden_paths(self, tmp_path):
+        """Test that hidden files and hidden subtrees are not counted."""
+        # Hidden-ness is relative to the repository, not its parent dirs
+        repo = tmp_path / ".backups" / "repo"
+        (repo / ".git").mkdir(parents=True)
+        (repo / ".github" / "workflows").mkdir(parents=True)
+        (repo / ".github" / "workflows" / "ci.yml").write_text("on: push\n")
+        (repo / ".env").write_text("KEY=value\n")
+        (repo / "app.py").write_text("x = 1\n")
+
+        analytics = BackupAnalytics(backup_dir=tmp_path)
+        size, file_count, languages, truncated = analytics._walk_repo(repo)
+
+        assert file_count == 1
+        assert languages == {"Python": 1}
+        assert size > len("x = 1\n")
+
+    def test_walk_repo_skips_vendored_dirs(self, analytics, mock_repo_dir):
+        """Test that dependency directories count for size but not languages."""
+        vendored = mock_repo_dir / "node_modules" / "pkg"
+        vendored.mkdir(parents=True)
+        (vendored / "index.js").write_text("module.exports = 1;\n")
+
+        size, file_count, languages, _ = analytics._walk_repo(mock_repo_dir)
+
+        assert file_count == 2
+        assert "JavaScript" not in languages
+        assert size >= len("module.exports = 1;\n")
+
+    def test_walk_repo_max_files(self, analytics, tmp_path):
+        """Test that the walk stops and flags truncation at max_files."""
+        repo = tmp_path / "big"
+        repo.mkdir()
+        for i in range(10):
+            (repo / f"f{i}.py").write_text("x\n")
+
+        _, file_count, _, truncated = analytics._walk_repo(repo, max_files=4)
+        assert (file_count, truncated) == (4, True)
+
+        _, file_count, _, truncated = analytics._walk_repo(repo, max_files=10)
+        assert (file_count, truncated) == (10, False)
+
     def test_categorize_repositories(self, analytics, tmp_path):
         """Test repository categorization."""
         # Create repos in different categories
@@ -275,6 +591,37 @@ class TestBackupAnalytics:
         
         assert "private" in categories or "public" in categories or "other" in categories
 
+    def test_find_repositories_stops_at_repo_boundaries(self, analytics, tmp_path):
+        """Test detection of regular and bare repos without descending into them."""
+        (tmp_path / "public" / "app" / ".git").mkdir(parents=True)
+        # A nested directory that looks like a repo inside a working tree
+        (tmp_path / "public" / "app" / "vendor" / "lib" / ".git").mkdir(parents=True)
+        bare = tmp_path / "mirrors" / "lib.git"
+        (bare / "objects").mkdir(parents=True)
+        (bare / "refs").mkdir()
+        (bare / "HEAD").write_text("ref: refs/heads/main\n")
+        (tmp_path / "notes").mkdir()
+
+        repos = analytics._find_repositories(tmp_path)
+
+        assert sorted(repos) == sorted([tmp_path / "public" / "app", bare])
+
+    def test_categorize_repositories_priority(self, analytics):
+        """Test that the highest-priority category in the path wins."""
+        repos = [
+            Path("/b/user/private/repo1"),
+            Path("/b/user/public/repo2"),
+            Path("/b/organizations/acme/private/repo3"),
+            Path("/b/user/starred/owner/repo4"),
+            Path("/b/misc/repo5"),
+        ]
+        assert analytics._categorize_repositories(repos) == {
+            "private": 2,
+            "public": 1,
+            "starred": 1,
+            "other": 1,
+        }
+
     def test_analyze_languages(self, analytics, mock_repo_dir):
         """Test language analysis."""
         languages = analytics._analyze_languages(mock_repo_dir)
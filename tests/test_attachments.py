@@ -4,13 +4,20 @@ Tests for the attachments module.
 "Attachments are the files we forget to backup. Tests help us remember." — schema.cx
 """
 
+import hashlib
+import json
+import re
+
 import pytest
+import responses
 from pathlib import Path
 import tempfile
 from urllib.parse import urlparse
 
 from farmore.attachments import (
+    AdaptiveLimiter,
     Attachment,
+    AttachmentDownloader,
     AttachmentManifest,
     AttachmentExtractor,
     ATTACHMENT_PATTERNS,
@@ -131,6 +138,69 @@ class TestAttachmentExtractor:
         assert len(urls) == 1
         assert urlparse(urls[0]).hostname == "user-images.githubusercontent.com"
 
+    def test_extract_urls_mixed_sources_in_order(self):
+        """Test one scan finds every pattern kind, deduplicated, in order."""
+        extractor = AttachmentExtractor()
+        markdown = (
+            "![a](https://user-images.githubusercontent.com/1/a.png)\n"
+            "[log](https://github.com/owner/repo/files/99/build.log)\n"
+            "![b](https://camo.githubusercontent.com/abc/def)\n"
+            "again ![a](https://user-images.githubusercontent.com/1/a.png)\n"
+        )
+
+        assert extractor.extract_urls(markdown) == [
+            "https://user-images.githubusercontent.com/1/a.png",
+            "https://github.com/owner/repo/files/99/build.log",
+            "https://camo.githubusercontent.com/abc/def",
+        ]
+
+    def test_re2_and_stdlib_agree(self, monkeypatch):
+        """Test that the RE2 and stdlib engines extract the same URLs."""
+        pytest.importorskip("re2")
+        import farmore.attachments as attachments_module
+
+        markdown = (
+            "![a](https://USER-IMAGES.githubusercontent.com/1/a.png) "
+            "<img src=\"https://github.com/user-attachments/assets/1234abcd-ef\"> "
+            "https://private-user-images.githubusercontent.com/7/x.png?jwt=abc`"
+        )
+        fast = attachments_module._compile_attachment_regex()
+        monkeypatch.setattr(attachments_module, "re2", None)
+        slow = attachments_module._compile_attachment_regex()
+
+        assert [m.group(0) for m in fast.finditer(markdown)] == [
+            m.group(0) for m in slow.finditer(markdown)
+        ]
+
+    def test_scanner_matches_plain_regex(self):
+        """Test that the host-dispatching scanner agrees with the full regex."""
+        import farmore.attachments as attachments_module
+
+        combined = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in ATTACHMENT_PATTERNS), re.IGNORECASE
+        )
+        scanner = attachments_module._AttachmentScanner(ATTACHMENT_PATTERNS, combined)
+        bodies = [
+            "see https://example.com/x and HTTPS://USER-IMAGES.githubusercontent.com/1/a.png",
+            "https://github.com/o/r/pull/1 https://github.com/o/r/assets/12/shot.png)",
+            "https://github.com/user-attachments/assets/abc-1https://camo.githubusercontent.com/z",
+            "naïve ![x](https://private-user-images.githubusercontent.com/7/x.png?jwt=a) ok",
+            "https://",
+            "",
+        ]
+
+        for body in bodies:
+            assert [m.group(0) for m in scanner.finditer(body)] == [
+                m.group(0) for m in combined.finditer(body)
+            ]
+
+    def test_extract_urls_pathological_body(self):
+        """Test that a huge URL-like run without a match is rejected quickly."""
+        extractor = AttachmentExtractor()
+        body = "https://github.com/" + "a" * 200_000 + " https://user-images.githubusercontent.com/1/x.png"
+
+        assert extractor.extract_urls(body) == ["https://user-images.githubusercontent.com/1/x.png"]
+
     def test_extract_urls_empty_markdown(self):
         """Test extracting from empty markdown."""
         extractor = AttachmentExtractor()
@@ -166,6 +236,42 @@ class TestAttachmentExtractor:
         # Code blocks should be removed
         assert "```" not in result or "code block" not in result
 
+    def test_extract_urls_ignores_code_blocks(self):
+        """Test that URLs inside fenced or indented code are not extracted."""
+        extractor = AttachmentExtractor()
+        markdown = (
+            "Real: https://user-images.githubusercontent.com/1/real.png\n"
+            "```\n"
+            "https://user-images.githubusercontent.com/2/fenced.png `tick`\n"
+            "```\n"
+            "    https://user-images.githubusercontent.com/3/indented.png\n"
+            "\thttps://user-images.githubusercontent.com/4/tabbed.png\n"
+            "After: https://user-images.githubusercontent.com/5/after.png\n"
+        )
+
+        assert extractor.extract_urls(markdown) == [
+            "https://user-images.githubusercontent.com/1/real.png",
+            "https://user-images.githubusercontent.com/5/after.png",
+        ]
+
+    def test_extract_urls_matches_strip_then_scan(self):
+        """Test the in-place scan against stripping code blocks first."""
+        extractor = AttachmentExtractor()
+        markdown = (
+            "    https://user-images.githubusercontent.com/0/indented-first.png\n"
+            "```py\n    https://user-images.githubusercontent.com/1/both.png\n```\n"
+            "```\nunterminated https://user-images.githubusercontent.com/2/open.png\n"
+            "text https://user-images.githubusercontent.com/3/kept.png\n"
+        )
+        # Reference: the original strip, fenced blocks first, then indented lines
+        stripped = re.sub(r"```.*?```", "", markdown, flags=re.DOTALL)
+        stripped = re.sub(r"^(    |\t).+$", "", stripped, flags=re.MULTILINE)
+        expected = list(dict.fromkeys(m.group(0) for m in extractor.pattern.finditer(stripped)))
+
+        assert extractor.extract_urls(markdown) == expected
+        assert len(expected) == 2
+        assert extractor._remove_code_blocks(markdown).strip() == stripped.strip()
+
     def test_extract_from_issue(self):
         """Test extracting URLs from issue data."""
         extractor = AttachmentExtractor()
@@ -197,6 +303,35 @@ class TestAttachmentExtractor:
         assert isinstance(results, list)
 
 
+    def test_thread_scan_matches_per_body_scan(self):
+        """Test that one scan over a thread equals scanning each body alone."""
+        extractor = AttachmentExtractor()
+        shot = "https://user-images.githubusercontent.com/1/shot.png"
+        other = "https://user-images.githubusercontent.com/2/other.png"
+        issue_data = {
+            "number": 7,
+            "body": f"![a]({shot})\n```\nunclosed fence",
+            "comments": [
+                {"body": f"![b]({other}) and again ![a]({shot}) ![a]({shot})"},
+                {"body": None},
+                {"body": f"```\n{other}\n```\n    {shot}"},
+            ],
+        }
+
+        expected = [(url, "issue", 7) for url in extractor.extract_urls(issue_data["body"])]
+        for comment in issue_data["comments"]:
+            expected.extend(
+                (url, "issue_comment", 7) for url in extractor.extract_urls(comment["body"] or "")
+            )
+
+        assert extractor.extract_from_issue(issue_data) == expected
+        assert expected == [
+            (shot, "issue", 7),
+            (other, "issue_comment", 7),
+            (shot, "issue_comment", 7),
+        ]
+
+
 class TestAttachmentPatterns:
     """Test the attachment URL patterns."""
 
@@ -208,3 +343,249 @@ class TestAttachmentPatterns:
         """Test that patterns are strings (regex patterns)."""
         for pattern in ATTACHMENT_PATTERNS:
             assert isinstance(pattern, str)
+
+
+class TestAttachmentDownloader:
+    """Test AttachmentDownloader against mocked HTTP responses."""
+
+    @responses.activate
+    def test_download_from_issues_concurrently(self, tmp_path):
+        """Test parallel downloads keep order, dedupe and avoid name clashes."""
+        urls = [
+            "https://user-images.githubusercontent.com/1/shot.png",
+            "https://user-images.githubusercontent.com/2/shot.png",
+            "https://user-images.githubusercontent.com/3/other.png",
+        ]
+        for i, url in enumerate(urls):
+            responses.add(responses.GET, url, body=f"data-{i}".encode())
+
+        issues = [
+            {"number": 1, "body": f"![a]({urls[0]}) ![b]({urls[1]})", "comments": []},
+            {"number": 2, "body": f"![c]({urls[2]}) again ![a]({urls[0]})", "comments": []},
+        ]
+
+        with AttachmentDownloader(dest=tmp_path, max_workers=4) as downloader:
+            manifest = downloader.download_from_issues("owner", "repo", issues)
+
+        assert manifest.total_downloaded == 3
+        assert manifest.total_failed == 0
+        assert sorted(a.url for a in manifest.attachments) == sorted(urls)
+
+        filenames = [a.local_path.name for a in manifest.attachments]
+        assert len(set(filenames)) == 3
+        for attachment in manifest.attachments:
+            index = urls.index(attachment.url)
+            assert attachment.local_path.read_bytes() == f"data-{index}".encode()
+
+        manifest_path = tmp_path / "owner" / "repo" / "attachments" / "issues" / "manifest.json"
+        assert json.loads(manifest_path.read_text())["total_downloaded"] == 3
+
+    @responses.activate
+    def test_manifest_identical_with_and_without_orjson(self, tmp_path, monkeypatch):
+        """Test that the orjson fast path writes the same manifest as json."""
+        pytest.importorskip("orjson")
+        from farmore import attachments
+
+        url = "https://user-images.githubusercontent.com/1/shot.png"
+        responses.add(responses.GET, url, body=b"data")
+        issues = [{"number": 1, "body": f"![a]({url})", "comments": []}]
+
+        manifests = []
+        for dest in (tmp_path / "fast", tmp_path / "slow"):
+            with AttachmentDownloader(dest=dest) as downloader:
+                downloader.download_from_issues("owner", "repo", issues)
+            manifest_path = dest / "owner" / "repo" / "attachments" / "issues" / "manifest.json"
+            data = json.loads(manifest_path.read_text())
+            data.pop("created_at")
+            data["attachments"][0].pop("local_path")
+            manifests.append(data)
+            monkeypatch.setattr(attachments, "orjson", None)
+
+        assert manifests[0] == manifests[1]
+
+    @responses.activate
+    def test_checksum_matches_downloaded_content(self, tmp_path):
+        """Test that the recorded checksum is the SHA-256 of the written file."""
+        url = "https://user-images.githubusercontent.com/1/big.bin"
+        body = b"x" * 100_000
+        responses.add(responses.GET, url, body=body)
+
+        with AttachmentDownloader(dest=tmp_path) as downloader:
+            manifest = downloader.download_from_issues(
+                "owner", "repo", [{"number": 1, "body": f"![a]({url})", "comments": []}]
+            )
+
+        assert manifest.attachments[0].checksum == hashlib.sha256(body).hexdigest()
+
+    @responses.activate
+    def test_download_failure_is_recorded(self, tmp_path):
+        """Test that HTTP errors are recorded per attachment."""
+        url = "https://user-images.githubusercontent.com/1/missing.png"
+        responses.add(responses.GET, url, status=404)
+
+        with AttachmentDownloader(dest=tmp_path) as downloader:
+            manifest = downloader.download_from_pull_requests(
+                "owner", "repo", [{"number": 5, "body": f"![x]({url})", "comments": []}]
+            )
+
+        assert manifest.total_failed == 1
+        assert manifest.attachments[0].success is False
+
+    @responses.activate
+    def test_total_urls_found_counts_unique_urls(self, tmp_path):
+        """Test that a URL referenced twice is counted and fetched once."""
+        url = "https://user-images.githubusercontent.com/1/shot.png"
+        responses.add(responses.GET, url, body=b"data")
+
+        issues = [
+            {"number": 1, "body": f"![a]({url})", "comments": []},
+            {"number": 2, "body": f"![a]({url})", "comments": []},
+        ]
+
+        with AttachmentDownloader(dest=tmp_path) as downloader:
+            manifest = downloader.download_from_issues("owner", "repo", issues)
+
+        assert manifest.total_urls_found == 1
+        assert len(responses.calls) == 1
+        assert manifest.attachments[0].source_number == 1
+
+    @responses.activate
+    def test_per_attachment_lines_only_when_verbose(self, tmp_path, capsys):
+        """Test that per-file output is reserved for verbose mode."""
+        url = "https://user-images.githubusercontent.com/1/shot.png"
+        responses.add(responses.GET, url, body=b"data")
+        issues = [{"number": 1, "body": f"![a]({url})", "comments": []}]
+
+        with AttachmentDownloader(dest=tmp_path / "quiet") as downloader:
+            downloader.download_from_issues("owner", "repo", issues)
+        assert "Downloaded: shot.png" not in capsys.readouterr().out
+
+        with AttachmentDownloader(dest=tmp_path / "verbose", verbose=True) as downloader:
+            downloader.download_from_issues("owner", "repo", issues)
+        assert "Downloaded: shot.png" in capsys.readouterr().out
+
+    @responses.activate
+    def test_rerun_revalidates_with_conditional_get(self, tmp_path):
+        """Test that a second run sends the stored ETag and honours a 304."""
+        from responses import matchers
+
+        url = "https://user-images.githubusercontent.com/1/shot.png"
+        issues = [{"number": 1, "body": f"![a]({url})", "comments": []}]
+        responses.add(responses.GET, url, body=b"data", headers={"ETag": '"abc"'})
+
+        with AttachmentDownloader(dest=tmp_path) as downloader:
+            first = downloader.download_from_issues("owner", "repo", issues)
+
+        responses.replace(
+            responses.GET,
+            url,
+            status=304,
+            match=[matchers.header_matcher({"If-None-Match": '"abc"'})],
+        )
+        with AttachmentDownloader(dest=tmp_path) as downloader:
+            second = downloader.download_from_issues("owner", "repo", issues)
+
+        attachment = second.attachments[0]
+        assert second.total_skipped == 1
+        assert attachment.error == "not_modified"
+        assert attachment.local_path == first.attachments[0].local_path
+        assert attachment.checksum == first.attachments[0].checksum
+        assert attachment.etag == '"abc"'
+
+    @responses.activate
+    def test_rerun_without_validators_skips_same_file(self, tmp_path):
+        """Test that a file from the last run is skipped under its own name."""
+        url = "https://user-images.githubusercontent.com/1/shot.png"
+        issues = [{"number": 1, "body": f"![a]({url})", "comments": []}]
+        responses.add(responses.GET, url, body=b"data")
+
+        with AttachmentDownloader(dest=tmp_path) as downloader:
+            downloader.download_from_issues("owner", "repo", issues)
+            second = downloader.download_from_issues("owner", "repo", issues)
+
+        assert len(responses.calls) == 1
+        assert second.attachments[0].error == "skipped"
+        assert second.attachments[0].local_path.name == "shot.png"
+
+    def test_safe_filename_uses_directory_listing(self, tmp_path):
+        """Test that a supplied listing decides collisions without touching disk."""
+        url = "https://user-images.githubusercontent.com/1/shot.png"
+        with AttachmentDownloader(dest=tmp_path) as downloader:
+            assert downloader._generate_safe_filename(url, tmp_path, existing=set()) == "shot.png"
+            renamed = downloader._generate_safe_filename(url, tmp_path, existing={"shot.png"})
+
+        assert renamed.startswith("shot_") and renamed.endswith(".png")
+
+    def test_safe_filename_replaces_unsafe_characters(self, tmp_path):
+        """Test that spaces, punctuation and non-ASCII become underscores."""
+        url = "https://user-images.githubusercontent.com/1/my%20sh%C3%B6t%26(1).png"
+        with AttachmentDownloader(dest=tmp_path) as downloader:
+            name = downloader._generate_safe_filename(url, tmp_path, existing=set())
+
+        assert name == "my_sh_t__1_.png"
+
+    def test_session_pool_sized_for_workers(self, tmp_path):
+        """Test that the connection pool holds a connection per worker."""
+        with AttachmentDownloader(dest=tmp_path, max_workers=24) as downloader:
+            adapter = downloader.session.get_adapter("https://user-images.githubusercontent.com/")
+            assert adapter._pool_maxsize == 24
+            assert adapter.max_retries.total == 5
+            assert 429 in adapter.max_retries.status_forcelist
+
+
+class TestAdaptiveLimiter:
+    """Test the throughput-driven concurrency limiter."""
+
+    def make_limiter(self, initial=4):
+        now = [0.0]
+        limiter = AdaptiveLimiter(
+            initial=initial, minimum=2, maximum=6, window=2.0, clock=lambda: now[0]
+        )
+        return limiter, now
+
+    def test_grows_while_throughput_improves(self):
+        """Test that rising throughput opens more slots, up to the maximum."""
+        limiter, now = self.make_limiter()
+        for step in range(1, 6):
+            now[0] = step * 2.0
+            limiter.record_bytes(step * 1_000_000)
+        assert limiter.limit == 6
+
+    def test_shrinks_on_drop_or_throttle(self):
+        """Test that falling throughput or a 429 closes slots, down to the minimum."""
+        limiter, now = self.make_limiter()
+        now[0] = 2.0
+        limiter.record_bytes(4_000_000)
+        assert limiter.limit == 5
+
+        now[0] = 4.0
+        limiter.record_bytes(1_000_000)
+        assert limiter.limit == 4
+
+        for step in range(3, 6):
+            limiter.record_throttle()
+            now[0] = step * 2.0
+            limiter.record_bytes(10_000_000)
+        assert limiter.limit == 2
+
+    def test_acquire_respects_limit(self):
+        """Test that no more than `limit` slots can be held."""
+        import threading
+
+        limiter, _ = self.make_limiter(initial=2)
+        limiter.acquire()
+        limiter.acquire()
+
+        acquired = threading.Event()
+
+        def third():
+            with limiter:
+                acquired.set()
+
+        worker = threading.Thread(target=third)
+        worker.start()
+        assert not acquired.wait(0.1)
+        limiter.release()
+        assert acquired.wait(1.0)
+        worker.join()
+
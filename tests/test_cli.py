@@ -0,0 +1,489 @@
+"""
+Tests for the CLI export helpers.
+
+"A backup you haven't restored is a rumor. A helper you haven't tested is a guess." — schema.cx
+"""
+
+import json
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+import requests
+import responses
+import yaml
+from responses import matchers
+
+from farmore import cli
+from farmore.github_api import GitHubAPIClient
+from farmore.models import Config, Repository, TargetType
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run each test from tmp_path, since default destinations are relative."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _repo(owner: str, name: str) -> Repository:
+    """Build a minimal repository."""
+    return Repository(
+        name=name,
+        full_name=f"{owner}/{name}",
+        owner=owner,
+        ssh_url=f"git@github.com:{owner}/{name}.git",
+        clone_url=f"https://github.com/{owner}/{name}.git",
+        default_branch="main",
+    )
+
+
+# _open_export / _write_json_export / _write_yaml_export
+
+EXPORT_ITEMS = [[], [{"number": 1, "title": "Bug"}, {"number": 2, "title": "ü"}]]
+
+
+def test_open_export_keeps_previous_file_on_error(tmp_path: Path) -> None:
+    """Test that an interrupted write leaves dest untouched and no temp file."""
+    dest = tmp_path / "issues.json"
+    dest.write_bytes(b"old")
+
+    with pytest.raises(RuntimeError):
+        with cli._open_export(dest) as f:
+            f.write(b"partial")
+            raise RuntimeError("interrupted")
+
+    assert dest.read_bytes() == b"old"
+    assert list(tmp_path.iterdir()) == [dest]
+
+    with cli._open_export(dest) as f:
+        f.write(b"new")
+    assert dest.read_bytes() == b"new"
+
+
+@pytest.mark.parametrize("items", EXPORT_ITEMS)
+def test_write_json_export_matches_whole_document(tmp_path: Path, items: list[dict]) -> None:
+    """Test that streamed JSON parses to the same document as a single dump."""
+    dest = tmp_path / "issues.json"
+    header = {"repository": "o/r", "total_issues": len(items)}
+
+    cli._write_json_export(dest, header, "issues", iter(items))
+
+    assert json.loads(dest.read_bytes()) == {**header, "issues": items}
+
+
+@pytest.mark.parametrize("items", EXPORT_ITEMS)
+def test_write_yaml_export_matches_yaml_dump(tmp_path: Path, items: list[dict]) -> None:
+    """Test that streamed YAML is byte-for-byte what yaml.dump writes."""
+    dest = tmp_path / "issues.yaml"
+    header = {"repository": "o/r", "total_issues": len(items)}
+
+    cli._write_yaml_export(dest, header, "issues", iter(items), allow_unicode=True)
+
+    expected = yaml.dump(
+        {**header, "issues": items},
+        Dumper=cli._YAML_DUMPER,
+        default_flow_style=False,
+        encoding="utf-8",
+        sort_keys=False,
+        allow_unicode=True,
+    )
+    assert dest.read_bytes() == expected
+
+
+# _download_release_asset
+
+ASSET_URL = "https://github.com/o/r/releases/download/v1/tool.tar.gz"
+
+
+@responses.activate
+def test_download_release_asset_writes_via_part_file(tmp_path: Path) -> None:
+    """Test that a fresh download is renamed into place and leaves no sidecars."""
+    responses.add(responses.GET, ASSET_URL, body=b"0123456789", headers={"ETag": '"v1"'})
+    dest = tmp_path / "tool.tar.gz"
+
+    cli._download_release_asset(requests.Session(), ASSET_URL, dest, 10)
+
+    assert dest.read_bytes() == b"0123456789"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["tool.tar.gz"]
+
+
+@responses.activate
+def test_download_release_asset_resumes_with_if_range(tmp_path: Path) -> None:
+    """Test that a partial download continues when the validator still matches."""
+    dest = tmp_path / "tool.tar.gz"
+    (tmp_path / "tool.tar.gz.part").write_bytes(b"01234")
+    (tmp_path / "tool.tar.gz.part.validator").write_text('"v1"')
+    responses.add(
+        responses.GET,
+        ASSET_URL,
+        body=b"56789",
+        status=206,
+        match=[matchers.header_matcher({"Range": "bytes=5-", "If-Range": '"v1"'})],
+    )
+
+    cli._download_release_asset(requests.Session(), ASSET_URL, dest, 10)
+
+    assert dest.read_bytes() == b"0123456789"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["tool.tar.gz"]
+
+
+@responses.activate
+def test_download_release_asset_restarts_when_asset_changed(tmp_path: Path) -> None:
+    """Test that a 200 answer to If-Range replaces the stale partial bytes."""
+    dest = tmp_path / "tool.tar.gz"
+    (tmp_path / "tool.tar.gz.part").write_bytes(b"xxxxx")
+    (tmp_path / "tool.tar.gz.part.validator").write_text('"v1"')
+    responses.add(responses.GET, ASSET_URL, body=b"abcdefghij", headers={"ETag": '"v2"'})
+
+    cli._download_release_asset(requests.Session(), ASSET_URL, dest, 10)
+
+    assert dest.read_bytes() == b"abcdefghij"
+
+
+@responses.activate
+def test_download_release_asset_without_validator_starts_over(tmp_path: Path) -> None:
+    """Test that partial bytes with nothing to check them against are not resumed."""
+    dest = tmp_path / "tool.tar.gz"
+    (tmp_path / "tool.tar.gz.part").write_bytes(b"xxxxx")
+    responses.add(responses.GET, ASSET_URL, body=b"0123456789")
+
+    cli._download_release_asset(requests.Session(), ASSET_URL, dest, 10)
+
+    assert "Range" not in responses.calls[0].request.headers
+    assert dest.read_bytes() == b"0123456789"
+
+
+@responses.activate
+def test_download_release_asset_keeps_short_part_for_later(tmp_path: Path) -> None:
+    """Test that a truncated transfer raises and leaves dest absent."""
+    dest = tmp_path / "tool.tar.gz"
+    responses.add(responses.GET, ASSET_URL, body=b"01234", headers={"ETag": '"v1"'})
+
+    with pytest.raises(OSError, match="5 of 10 bytes"):
+        cli._download_release_asset(requests.Session(), ASSET_URL, dest, 10)
+
+    assert not dest.exists()
+    assert (tmp_path / "tool.tar.gz.part").read_bytes() == b"01234"
+    assert (tmp_path / "tool.tar.gz.part.validator").read_text() == '"v1"'
+
+
+@responses.activate
+def test_download_release_asset_skips_complete_file(tmp_path: Path) -> None:
+    """Test that an asset already on disk at full size is not downloaded."""
+    dest = tmp_path / "tool.tar.gz"
+    dest.write_bytes(b"0123456789")
+
+    cli._download_release_asset(requests.Session(), ASSET_URL, dest, 10)
+
+    assert len(responses.calls) == 0
+
+
+# _sync_wiki
+
+
+@pytest.fixture
+def git_wiki(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    """Force the git subprocess path and record the commands it runs."""
+    monkeypatch.setattr(cli, "pygit2", None)
+    monkeypatch.setattr(cli.time, "sleep", lambda seconds: None)
+    commands: list[list[str]] = []
+    return commands
+
+
+def test_sync_wiki_retries_and_removes_partial_clone(
+    git_wiki: list[list[str]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a failed clone is retried after backoff from a clean directory."""
+    dest = cli.get_default_wiki_dest("o", "r")
+    dest.parent.mkdir(parents=True)
+    sleeps: list[float] = []
+    monkeypatch.setattr(cli.time, "sleep", sleeps.append)
+
+    def fake_git(command: list[str], env: dict[str, str], timeout: int) -> None:
+        git_wiki.append(command)
+        if len(git_wiki) == 1:
+            assert env["GIT_TERMINAL_PROMPT"] == "0"
+            (dest / "partial").mkdir(parents=True)
+            raise subprocess.CalledProcessError(128, command, stderr="fatal: early EOF\n")
+        assert not dest.exists()
+        dest.mkdir()
+
+    monkeypatch.setattr(cli, "_run_wiki_git", fake_git)
+
+    assert cli._sync_wiki("o", "r") is None
+    assert [c[:2] for c in git_wiki] == [["git", "clone"], ["git", "clone"]]
+    assert len(sleeps) == 1
+
+
+def test_sync_wiki_returns_last_error(
+    git_wiki: list[list[str]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that exhausting the attempts reports the last git error line."""
+
+    def fake_git(command: list[str], env: dict[str, str], timeout: int) -> None:
+        git_wiki.append(command)
+        raise subprocess.CalledProcessError(128, command, stderr="remote: busy\nfatal: early EOF\n")
+
+    monkeypatch.setattr(cli, "_run_wiki_git", fake_git)
+
+    assert cli._sync_wiki("o", "r", attempts=2) == "fatal: early EOF"
+    assert len(git_wiki) == 2
+
+
+def test_sync_wiki_without_pages_is_not_an_error(
+    git_wiki: list[list[str]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a wiki with no git repository behind it counts as synced."""
+
+    def fake_git(command: list[str], env: dict[str, str], timeout: int) -> None:
+        git_wiki.append(command)
+        raise subprocess.CalledProcessError(
+            128, command, stderr="remote: Repository not found.\nfatal: repository not found\n"
+        )
+
+    monkeypatch.setattr(cli, "_run_wiki_git", fake_git)
+
+    assert cli._sync_wiki("o", "r") is None
+    assert len(git_wiki) == 1
+
+
+def test_sync_wiki_reports_unexpected_errors(
+    git_wiki: list[list[str]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a missing git binary becomes an error string, not an exception."""
+
+    def fake_git(command: list[str], env: dict[str, str], timeout: int) -> None:
+        raise FileNotFoundError("git")
+
+    monkeypatch.setattr(cli, "_run_wiki_git", fake_git)
+
+    error = cli._sync_wiki("o", "r", attempts=1)
+
+    assert error is not None and error.startswith("FileNotFoundError")
+
+
+def test_sync_wiki_reclones_broken_checkout(
+    git_wiki: list[list[str]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a checkout without a usable HEAD is replaced by a fresh clone."""
+    dest = cli.get_default_wiki_dest("o", "r")
+    dest.mkdir(parents=True)
+    (dest / "leftover").write_text("x")
+    monkeypatch.setattr(cli, "_wiki_checkout_usable", lambda path: False)
+
+    def fake_git(command: list[str], env: dict[str, str], timeout: int) -> None:
+        git_wiki.append(command)
+        assert not dest.exists()
+
+    monkeypatch.setattr(cli, "_run_wiki_git", fake_git)
+
+    assert cli._sync_wiki("o", "r") is None
+    assert [c[:2] for c in git_wiki] == [["git", "clone"]]
+
+
+def test_sync_wiki_falls_back_to_git_on_auth_error(
+    git_wiki: list[list[str]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that libgit2 auth failures retry with git; a remote 404 means no wiki."""
+    monkeypatch.setattr(cli, "pygit2", object())
+    monkeypatch.setattr(cli, "_PYGIT2_ERRORS", (RuntimeError,))
+
+    def fake_in_process(url: str, dest: Path, cloning: bool, token: str | None = None) -> None:
+        raise RuntimeError("too many redirects or authentication replays")
+
+    monkeypatch.setattr(cli, "_sync_wiki_in_process", fake_in_process)
+    monkeypatch.setattr(
+        cli, "_run_wiki_git", lambda command, env, timeout: git_wiki.append(command)
+    )
+
+    assert cli._sync_wiki("o", "r") is None
+    assert [c[:2] for c in git_wiki] == [["git", "clone"]]
+
+    def missing_wiki(url: str, dest: Path, cloning: bool, token: str | None = None) -> None:
+        raise RuntimeError("unexpected http status code: 404")
+
+    monkeypatch.setattr(cli, "_sync_wiki_in_process", missing_wiki)
+    assert cli._sync_wiki("o", "other") is None
+    assert len(git_wiki) == 1
+
+
+# export_repository_data
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> GitHubAPIClient:
+    """Create a REST-only client (no token, so no GraphQL prefetch)."""
+    return GitHubAPIClient(
+        Config(target_type=TargetType.USER, target_name="o", dest=tmp_path / "backups")
+    )
+
+
+ISSUE = {
+    "number": 1,
+    "title": "Bug",
+    "state": "open",
+    "user": {"login": "alice"},
+    "created_at": "2024-01-01T00:00:00Z",
+    "html_url": "https://github.com/o/a/issues/1",
+}
+
+
+def _export(client: GitHubAPIClient, repos: list[Repository], **kwargs: object) -> None:
+    """Run export_repository_data for issues, pulls and wikis with test defaults."""
+    options: dict = {
+        "include_issues": True,
+        "include_pulls": True,
+        "include_workflows": False,
+        "include_releases": False,
+        "include_wikis": True,
+        "token": None,
+        **kwargs,
+    }
+    cli.export_repository_data(client, repos, "o", **options)
+
+
+@responses.activate
+def test_export_repository_data_records_and_clears_failures(
+    client: GitHubAPIClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that failed stages, and the ones they skipped, are recorded until a clean run."""
+    failures_path = cli.get_failed_exports_path(tmp_path / "backups" / "o")
+    responses.add(responses.GET, "https://api.github.com/repos/o/a/issues", json=[ISSUE])
+    responses.add(responses.GET, "https://api.github.com/repos/o/a/pulls", json=[])
+    responses.add(responses.GET, "https://api.github.com/repos/o/b/issues", status=404)
+    responses.add(responses.GET, "https://api.github.com/repos/o/a", json={"has_wiki": True})
+    responses.add(responses.GET, "https://api.github.com/repos/o/b", json={"has_wiki": False})
+    wiki_results = {"a": "fatal: early EOF"}
+    monkeypatch.setattr(cli, "_sync_wiki", lambda owner, name, token=None: wiki_results.get(name))
+
+    _export(client, [_repo("o", "a"), _repo("o", "b")], max_workers=2, failures_path=failures_path)
+
+    exported = json.loads(cli.get_default_issues_dest("o", "a").read_bytes())
+    assert exported["total_issues"] == 1
+    assert exported["issues"][0]["user"] == "alice"
+    failures = json.loads(failures_path.read_bytes())
+    assert sorted((f["repository"], f["stage"]) for f in failures) == [
+        ("o/a", "wiki"),
+        ("o/b", "issues"),
+        ("o/b", "pull_requests"),
+    ]
+
+    # A run over other repositories keeps their entries
+    responses.add(responses.GET, "https://api.github.com/repos/o/c/issues", json=[])
+    responses.add(responses.GET, "https://api.github.com/repos/o/c/pulls", json=[])
+    responses.add(responses.GET, "https://api.github.com/repos/o/c", json={"has_wiki": False})
+    _export(client, [_repo("o", "c")], failures_path=failures_path)
+    assert len(json.loads(failures_path.read_bytes())) == 3
+
+    wiki_results.clear()
+    responses.replace(responses.GET, "https://api.github.com/repos/o/b/issues", json=[])
+    responses.add(responses.GET, "https://api.github.com/repos/o/b/pulls", json=[])
+    _export(client, [_repo("o", "a"), _repo("o", "b")], failures_path=failures_path)
+
+    assert not failures_path.exists()
+
+
+def _repo_json(owner: str, name: str) -> dict:
+    """Build a REST repository payload."""
+    return {
+        "name": name,
+        "full_name": f"{owner}/{name}",
+        "owner": {"login": owner, "type": "User"},
+        "ssh_url": f"git@github.com:{owner}/{name}.git",
+        "clone_url": f"https://github.com/{owner}/{name}.git",
+        "default_branch": "main",
+        "private": False,
+        "fork": False,
+        "archived": False,
+        "has_wiki": True,
+    }
+
+
+@responses.activate
+def test_retry_failed_exports_reruns_only_recorded_steps(
+    client: GitHubAPIClient, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that --retry-failed exports just the failed repository/stage pairs."""
+    dest = tmp_path / "backups" / "o"
+    failures_path = cli.get_failed_exports_path(dest)
+    failures_path.parent.mkdir(parents=True)
+    failures_path.write_text(
+        json.dumps(
+            [
+                {"repository": "o/a", "stage": "issues", "error": "boom"},
+                {"repository": "o/b", "stage": "wiki", "error": "boom"},
+                {"repository": "o/gone", "stage": "issues", "error": "boom"},
+            ]
+        )
+    )
+    responses.add(responses.GET, "https://api.github.com/repos/o/a", json=_repo_json("o", "a"))
+    responses.add(responses.GET, "https://api.github.com/repos/o/b", json=_repo_json("o", "b"))
+    responses.add(responses.GET, "https://api.github.com/repos/o/gone", status=404)
+    responses.add(responses.GET, "https://api.github.com/repos/o/a/issues", json=[ISSUE])
+    synced: list[str] = []
+    monkeypatch.setattr(
+        cli, "_sync_wiki", lambda owner, name, token=None: synced.append(name) or "still down"
+    )
+
+    cli._retry_failed_exports(client, dest, "o", None, max_workers=2, max_concurrent_exports=None)
+
+    requested = {call.request.url.split("?")[0] for call in responses.calls}
+    assert "https://api.github.com/repos/o/b/issues" not in requested
+    assert "https://api.github.com/repos/o/a/pulls" not in requested
+    assert synced == ["b"]
+    assert json.loads(cli.get_default_issues_dest("o", "a").read_bytes())["total_issues"] == 1
+    assert [(f["repository"], f["stage"]) for f in json.loads(failures_path.read_bytes())] == [
+        ("o/b", "wiki")
+    ]
+
+
+@responses.activate
+def test_export_repository_data_overlaps_wiki_with_its_export(
+    client: GitHubAPIClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a repository's wiki sync is already running during its API export."""
+    responses.add(responses.GET, "https://api.github.com/repos/o/a", json={"has_wiki": True})
+    wiki_started = threading.Event()
+    overlapped: list[bool] = []
+
+    def fake_sync_wiki(owner: str, name: str, token: str | None = None) -> None:
+        wiki_started.set()
+
+    def fake_export(*args: object, **kwargs: object) -> None:
+        overlapped.append(wiki_started.wait(timeout=5))
+
+    monkeypatch.setattr(cli, "_sync_wiki", fake_sync_wiki)
+    monkeypatch.setattr(cli, "_export_single_repository_data", fake_export)
+
+    cli.export_repository_data(
+        client,
+        [_repo("o", "a")],
+        "o",
+        include_issues=True,
+        include_pulls=False,
+        include_workflows=False,
+        include_releases=False,
+        include_wikis=True,
+        token=None,
+        max_workers=2,
+    )
+
+    assert overlapped == [True]
+
+
+def test_user_retry_failed_skips_mirroring(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that `farmore user --retry-failed` reads the record under --dest only."""
+    from typer.testing import CliRunner
+
+    calls: list[tuple] = []
+    monkeypatch.setattr(cli, "_retry_failed_exports", lambda *args: calls.append(args))
+    monkeypatch.setattr(cli, "MirrorOrchestrator", None)
+    dest = tmp_path / "mine"
+
+    result = CliRunner().invoke(cli.app, ["user", "o", "--dest", str(dest), "--retry-failed"])
+
+    assert result.exit_code == 0, result.output
+    assert len(calls) == 1
+    assert calls[0][1] == dest
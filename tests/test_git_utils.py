@@ -89,6 +89,18 @@ def test_clone_https_success(mock_run: MagicMock, sample_repo: Repository, tmp_p
     assert sample_repo.clone_url in call_args
 
 
+@patch("subprocess.run")
+def test_clone_shallow_partial(mock_run: MagicMock, sample_repo: Repository, tmp_path: Path) -> None:
+    """Test that depth and filter options reach git clone."""
+    mock_run.return_value = MagicMock(returncode=0, stderr="", stdout="")
+
+    dest = tmp_path / "test-repo"
+    success, _ = GitOperations.clone(sample_repo, dest, depth=1, filter_spec="blob:none")
+
+    assert success is True
+    call_args = mock_run.call_args[0][0]
+    assert call_args[:4] == ["git", "clone", "--depth=1", "--filter=blob:none"]
+
 @patch("subprocess.run")
 def test_clone_ssh_failure(mock_run: MagicMock, sample_repo: Repository, tmp_path: Path) -> None:
     """Test SSH clone failure."""
@@ -184,3 +196,25 @@ def test_is_git_repository_nonexistent(tmp_path: Path) -> None:
     """Test checking non-existent directory."""
     nonexistent = tmp_path / "does-not-exist"
     assert GitOperations.is_git_repository(nonexistent) is False
+
+
+@patch("subprocess.run")
+def test_remote_head_matches(mock_run: MagicMock, tmp_path: Path) -> None:
+    """Test comparing origin's HEAD with the local checkout."""
+    (tmp_path / ".git").mkdir()
+    sha = "a" * 40
+    mock_run.side_effect = [
+        MagicMock(returncode=0, stdout=f"{sha}\tHEAD\n"),
+        MagicMock(returncode=0, stdout=f"{sha}\n"),
+        MagicMock(returncode=0, stdout=f"{'b' * 40}\tHEAD\n"),
+        MagicMock(returncode=0, stdout=f"{sha}\n"),
+    ]
+
+    assert GitOperations.remote_head_matches(tmp_path) is True
+    assert GitOperations.remote_head_matches(tmp_path, env={"PATH": "/usr/bin"}) is False
+    # ls-remote must never stop for a credential prompt
+    assert mock_run.call_args_list[0].kwargs["env"]["GIT_TERMINAL_PROMPT"] == "0"
+    assert mock_run.call_args_list[2].kwargs["env"] == {
+        "PATH": "/usr/bin",
+        "GIT_TERMINAL_PROMPT": "0",
+    }
@@ -4,13 +4,16 @@ Tests for GitHub API client.
 "Mock the API. Trust nothing. Test everything." — schema.cx
 """
 
+import base64
 from pathlib import Path
 
 import pytest
+import requests
 import responses
+from responses import matchers
 
-from farmore.github_api import GitHubAPIClient, GitHubAPIError
-from farmore.models import Config, TargetType, Visibility
+from farmore.github_api import GitHubAPIClient, GitHubAPIError, RequestThrottle
+from farmore.models import Config, Repository, TargetType, Visibility
 
 
 @pytest.fixture
@@ -264,6 +267,110 @@ def test_api_error_rate_limit(user_config: Config) -> None:
         client.get_repositories()
 
 
+@responses.activate
+def test_iter_pages_fetches_remaining_pages_from_last_link(user_config: Config) -> None:
+    """Test that pages after the first are requested by number and kept in order."""
+    url = "https://api.github.com/repos/testuser/a/releases"
+    responses.add(
+        responses.GET,
+        url,
+        json=[{"page": 1}],
+        headers={
+            "Link": f'<{url}?per_page=100&page=2>; rel="next", '
+            f'<{url}?per_page=100&page=3>; rel="last"'
+        },
+        match=[matchers.query_param_matcher({"per_page": "100", "page": "1"})],
+    )
+    for page in (2, 3):
+        responses.add(
+            responses.GET,
+            url,
+            json=[{"page": page}],
+            match=[matchers.query_param_matcher({"per_page": "100", "page": str(page)})],
+        )
+
+    client = GitHubAPIClient(user_config)
+    pages = list(client._iter_pages(url, {"per_page": 100}))
+
+    assert pages == [[{"page": 1}], [{"page": 2}], [{"page": 3}]]
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_issue_comments_follow_every_page(user_config: Config) -> None:
+    """Test that comments are requested 100 at a time and not cut off at one page."""
+    url = "https://api.github.com/repos/testuser/a/issues/7/comments"
+    comment = {"user": {"login": "bob"}, "body": "hi", "created_at": "t", "updated_at": "t"}
+    responses.add(
+        responses.GET,
+        url,
+        json=[comment],
+        headers={"Link": f'<{url}?per_page=100&page=2>; rel="next"'},
+        match=[matchers.query_param_matcher({"per_page": "100", "page": "1"})],
+    )
+    responses.add(
+        responses.GET,
+        url,
+        json=[comment],
+        match=[matchers.query_param_matcher({"per_page": "100", "page": "2"})],
+    )
+
+    client = GitHubAPIClient(user_config)
+
+    assert len(client._get_issue_comments("testuser", "a", 7)) == 2
+
+
+@responses.activate
+def test_get_workflows_keeps_file_order(user_config: Config) -> None:
+    """Test that concurrently fetched workflow files come back in listing order."""
+    base = "https://api.github.com/repos/testuser/a"
+    names = ["ci", "release", "docs"]
+    responses.add(
+        responses.GET,
+        f"{base}/actions/workflows",
+        json={
+            "workflows": [
+                {
+                    "name": name,
+                    "path": f".github/workflows/{name}.yml",
+                    "state": "active",
+                    "created_at": "t",
+                    "updated_at": "t",
+                    "html_url": "u",
+                    "badge_url": "b",
+                }
+                for name in names
+            ]
+        },
+    )
+    for name in names:
+        responses.add(
+            responses.GET,
+            f"{base}/contents/.github/workflows/{name}.yml",
+            json={"content": base64.b64encode(f"name: {name}\n".encode()).decode()},
+        )
+
+    client = GitHubAPIClient(user_config)
+    workflows, files = client.get_workflows("testuser", "a")
+
+    assert [wf.name for wf in workflows] == names
+    assert [f["content"] for f in files] == [f"name: {name}\n" for name in names]
+
+
+@responses.activate
+def test_transient_server_error_is_retried(user_config: Config, monkeypatch) -> None:
+    """Test that a 502 is retried before the response is used."""
+    monkeypatch.setattr("farmore.github_api.time.sleep", lambda seconds: None)
+    url = "https://api.github.com/repos/testuser/a/releases"
+    responses.add(responses.GET, url, status=502)
+    responses.add(responses.GET, url, json=[])
+
+    client = GitHubAPIClient(user_config)
+
+    assert list(client.iter_export_items("testuser", "a", "releases")) == []
+    assert [call.response.status_code for call in responses.calls] == [502, 200]
+
+
 # ============================================================================
 # Search Repositories Tests
 # ============================================================================
@@ -482,3 +589,269 @@ def test_search_repositories_api_error(user_config: Config) -> None:
 
     with pytest.raises(GitHubAPIError, match="Search failed"):
         client.search_repositories(query="test", limit=10)
+
+
+def _repo(owner: str, name: str) -> Repository:
+    """Build a minimal Repository for export tests."""
+    return Repository(
+        name=name,
+        full_name=f"{owner}/{name}",
+        owner=owner,
+        ssh_url=f"git@github.com:{owner}/{name}.git",
+        clone_url=f"https://github.com/{owner}/{name}.git",
+        default_branch="main",
+    )
+
+
+def _page(nodes: list, cursor: str | None = None) -> dict:
+    """Build a GraphQL connection page."""
+    return {"pageInfo": {"hasNextPage": cursor is not None, "endCursor": cursor}, "nodes": nodes}
+
+
+@responses.activate
+def test_graphql_bulk_export_batches_and_paginates(user_config: Config) -> None:
+    """Test that repositories share one aliased query and long connections page."""
+    issue = {
+        "number": 1,
+        "title": "Bug",
+        "state": "OPEN",
+        "user": {"login": "alice"},
+        "created_at": "2024-01-01T00:00:00Z",
+        "html_url": "https://github.com/testuser/a/issues/1",
+    }
+    pull = {
+        "number": 2,
+        "title": "Fix",
+        "state": "MERGED",
+        "user": {"__typename": "Bot", "login": "dependabot"},
+        "merged": True,
+        "created_at": "2024-01-02T00:00:00Z",
+        "html_url": "https://github.com/testuser/a/pull/2",
+    }
+    responses.add(
+        responses.POST,
+        "https://api.github.com/graphql",
+        json={
+            "data": {
+                "r0": {"issues": _page([issue], cursor="c1"), "pullRequests": _page([pull])},
+                "r1": None,
+            },
+            "errors": [{"type": "NOT_FOUND", "message": "Could not resolve to a Repository"}],
+        },
+    )
+    responses.add(
+        responses.POST,
+        "https://api.github.com/graphql",
+        json={
+            "data": {
+                "repository": {
+                    "issues": _page([{**issue, "number": 3, "state": "CLOSED", "user": None}])
+                }
+            }
+        },
+    )
+
+    client = GitHubAPIClient(user_config)
+    results = client.graphql_bulk_export(
+        [_repo("testuser", "a"), _repo("testuser", "gone")], include_releases=False
+    )
+
+    assert len(responses.calls) == 2
+    assert list(results) == ["testuser/a"]
+    assert [i["number"] for i in results["testuser/a"]["issues"]] == [1, 3]
+    assert results["testuser/a"]["issues"][1]["state"] == "closed"
+    assert [i["user"] for i in results["testuser/a"]["issues"]] == ["alice", "ghost"]
+    # Aliased fields arrive in the order the REST export writes them
+    assert list(results["testuser/a"]["pull_requests"][0]) == [
+        "number", "title", "state", "user", "merged", "created_at", "html_url"
+    ]
+    assert results["testuser/a"]["pull_requests"] == [
+        {
+            "number": 2,
+            "title": "Fix",
+            "state": "closed",
+            "user": "dependabot[bot]",
+            "merged": True,
+            "created_at": "2024-01-02T00:00:00Z",
+            "html_url": "https://github.com/testuser/a/pull/2",
+        }
+    ]
+
+
+@responses.activate
+def test_graphql_bulk_export_raises_on_errors(user_config: Config) -> None:
+    """Test that non-NOT_FOUND GraphQL errors surface as GitHubAPIError."""
+    responses.add(
+        responses.POST,
+        "https://api.github.com/graphql",
+        json={"errors": [{"type": "RATE_LIMITED", "message": "API rate limit exceeded"}]},
+    )
+
+    client = GitHubAPIClient(user_config)
+
+    with pytest.raises(GitHubAPIError, match="rate limit"):
+        client.graphql_bulk_export([_repo("testuser", "a")])
+
+
+@responses.activate
+def test_graphql_bulk_export_wraps_malformed_responses(user_config: Config) -> None:
+    """Test that bad JSON and repositories vanishing mid-pagination raise GitHubAPIError."""
+    responses.add(responses.POST, "https://api.github.com/graphql", body="<html>oops</html>")
+    client = GitHubAPIClient(user_config)
+    repos = [_repo("testuser", "a")]
+
+    with pytest.raises(GitHubAPIError, match="GraphQL request failed"):
+        client.graphql_bulk_export(repos, include_pulls=False, include_releases=False)
+
+    responses.replace(
+        responses.POST,
+        "https://api.github.com/graphql",
+        json={"data": {"r0": {"issues": _page([], cursor="c1")}}},
+    )
+    responses.add(
+        responses.POST, "https://api.github.com/graphql", json={"data": {"repository": None}}
+    )
+
+    with pytest.raises(GitHubAPIError, match="disappeared"):
+        client.graphql_bulk_export(repos, include_pulls=False, include_releases=False)
+
+
+@responses.activate
+def test_iter_export_items_projects_rest_pages(user_config: Config) -> None:
+    """Test that REST pages are projected to export dicts, skipping PRs in issues."""
+    issue = {
+        "number": 1,
+        "title": "Bug",
+        "state": "open",
+        "user": {"login": "alice"},
+        "body": "long body that is not exported",
+        "created_at": "2024-01-01T00:00:00Z",
+        "html_url": "https://github.com/testuser/a/issues/1",
+    }
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/testuser/a/issues",
+        json=[issue, {**issue, "number": 2, "pull_request": {}}],
+        headers={"Link": '<https://api.github.com/repos/testuser/a/issues?page=2>; rel="next"'},
+    )
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/testuser/a/issues",
+        json=[{**issue, "number": 3, "user": None}],
+    )
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/testuser/a/pulls",
+        json=[{**issue, "number": 2, "merged_at": "2024-01-02T00:00:00Z"}],
+    )
+    responses.add(
+        responses.GET,
+        "https://api.github.com/repos/testuser/a/releases",
+        json={"message": "Not Found"},
+        status=404,
+    )
+
+    client = GitHubAPIClient(user_config)
+    issues = list(client.iter_export_items("testuser", "a", "issues"))
+    pulls = list(client.iter_export_items("testuser", "a", "pull_requests"))
+
+    assert issues == [
+        {
+            "number": 1,
+            "title": "Bug",
+            "state": "open",
+            "user": "alice",
+            "created_at": "2024-01-01T00:00:00Z",
+            "html_url": "https://github.com/testuser/a/issues/1",
+        },
+        {
+            "number": 3,
+            "title": "Bug",
+            "state": "open",
+            "user": "ghost",
+            "created_at": "2024-01-01T00:00:00Z",
+            "html_url": "https://github.com/testuser/a/issues/1",
+        },
+    ]
+    assert pulls[0]["merged"] is True
+    assert list(client.iter_export_items("testuser", "a", "releases")) == []
+
+
+class _FakeClock:
+    """Manually advanced clock whose sleep() moves time forward."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _rate_limited_response(headers: dict[str, str]) -> requests.Response:
+    """Build a bare response carrying the given headers."""
+    response = requests.Response()
+    response.headers.update(headers)
+    return response
+
+
+def test_request_throttle_spaces_requests_at_rate() -> None:
+    """Test that a fixed rate spaces consecutive requests."""
+    clock = _FakeClock()
+    throttle = RequestThrottle(rate=4, clock=clock, sleep=clock.sleep)
+
+    for _ in range(3):
+        throttle.wait()
+
+    assert clock.slept == [0.25, 0.25]
+
+
+def test_request_throttle_spreads_low_budget_until_reset() -> None:
+    """Test that a nearly spent budget is spread over the reset window."""
+    clock = _FakeClock()
+    throttle = RequestThrottle(clock=clock, sleep=clock.sleep)
+
+    throttle.observe(
+        _rate_limited_response(
+            {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "100", "X-RateLimit-Reset": "1200"}
+        )
+    )
+    throttle.wait()
+    throttle.wait()
+
+    assert clock.slept == [2.0]
+
+
+def test_request_throttle_honours_retry_after() -> None:
+    """Test that Retry-After pauses the next request."""
+    clock = _FakeClock()
+    throttle = RequestThrottle(clock=clock, sleep=clock.sleep)
+
+    throttle.observe(_rate_limited_response({"Retry-After": "3"}))
+    throttle.wait()
+
+    assert clock.slept == [3.0]
+
+
+@responses.activate
+def test_rate_limit_retry_after_http_date_backs_off(
+    user_config: Config, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a Retry-After date the throttle cannot parse falls back to backoff."""
+    sleeps: list[float] = []
+    monkeypatch.setattr("farmore.github_api.time.sleep", sleeps.append)
+    url = "https://api.github.com/repos/testuser/a"
+    responses.add(
+        responses.GET, url, status=429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    )
+    responses.add(responses.GET, url, json={"name": "a"})
+
+    client = GitHubAPIClient(user_config)
+    response = client._make_request(url)
+
+    assert response.json() == {"name": "a"}
+    assert sleeps == [1]
@@ -0,0 +1,144 @@
+"""
+Tests for the conditional-request response cache.
+
+"A cache you can't trust is just a second source of bugs." — schema.cx
+"""
+
+from pathlib import Path
+
+import requests
+import responses
+from responses import matchers
+
+from farmore.github_api import GitHubAPIClient
+from farmore.models import Config, TargetType
+from farmore.response_cache import ResponseCache
+
+REPOS_URL = "https://api.github.com/users/testuser/repos"
+
+
+def _repo_json(name: str) -> dict:
+    """Minimal repository payload."""
+    return {
+        "name": name,
+        "full_name": f"testuser/{name}",
+        "owner": {"login": "testuser", "type": "User"},
+        "ssh_url": f"git@github.com:testuser/{name}.git",
+        "clone_url": f"https://github.com/testuser/{name}.git",
+        "default_branch": "main",
+        "private": False,
+        "fork": False,
+        "archived": False,
+    }
+
+
+def _config(tmp_path: Path, token: str | None = None) -> Config:
+    """Config with the response cache pointed into tmp_path."""
+    return Config(
+        target_type=TargetType.USER,
+        target_name="testuser",
+        dest=tmp_path / "backups",
+        token=token,
+        response_cache_path=tmp_path / "etags.db",
+    )
+
+
+class TestResponseCache:
+    """Test the SQLite-backed cache directly."""
+
+    def test_no_headers_for_unknown_url(self, tmp_path):
+        """Test that an uncached URL sends no validators."""
+        cache = ResponseCache(tmp_path / "etags.db")
+        assert cache.conditional_headers("https://api.github.com/x") == {}
+        cache.close()
+
+    @responses.activate
+    def test_store_and_load_round_trip(self, tmp_path):
+        """Test that a stored response is replayed with its Link header."""
+        link = '<https://api.github.com/x?page=2>; rel="next"'
+        responses.add(
+            responses.GET,
+            "https://api.github.com/x",
+            json=[1, 2],
+            headers={"ETag": '"v1"', "Link": link},
+        )
+        responses.add(responses.GET, "https://api.github.com/x", status=304)
+
+        cache = ResponseCache(tmp_path / "etags.db")
+        cache.store("https://api.github.com/x", requests.get("https://api.github.com/x"))
+
+        assert cache.conditional_headers("https://api.github.com/x") == {"If-None-Match": '"v1"'}
+        replayed = cache.load("https://api.github.com/x", requests.get("https://api.github.com/x"))
+        assert replayed.status_code == 200
+        assert replayed.json() == [1, 2]
+        assert replayed.links["next"]["url"] == "https://api.github.com/x?page=2"
+        cache.close()
+
+    @responses.activate
+    def test_responses_without_validators_are_not_stored(self, tmp_path):
+        """Test that responses lacking ETag and Last-Modified are skipped."""
+        responses.add(responses.GET, "https://api.github.com/x", json=[])
+
+        cache = ResponseCache(tmp_path / "etags.db")
+        cache.store("https://api.github.com/x", requests.get("https://api.github.com/x"))
+
+        assert cache.conditional_headers("https://api.github.com/x") == {}
+        cache.close()
+
+
+class TestClientRevalidation:
+    """Test GitHubAPIClient with the cache enabled."""
+
+    @responses.activate
+    def test_second_run_revalidates_and_reuses_body(self, tmp_path):
+        """Test that a 304 on the second run yields the first run's data."""
+        responses.add(
+            responses.GET, REPOS_URL, json=[_repo_json("alpha")], headers={"ETag": '"abc"'}
+        )
+        with GitHubAPIClient(_config(tmp_path)) as client:
+            first = client.get_repositories()
+
+        responses.replace(
+            responses.GET,
+            REPOS_URL,
+            status=304,
+            match=[matchers.header_matcher({"If-None-Match": '"abc"'})],
+        )
+        with GitHubAPIClient(_config(tmp_path)) as client:
+            second = client.get_repositories()
+
+        assert [r.name for r in second] == [r.name for r in first] == ["alpha"]
+
+    @responses.activate
+    def test_entries_are_scoped_to_the_token(self, tmp_path):
+        """Test that one token's validators are never sent with another token."""
+        responses.add(
+            responses.GET, REPOS_URL, json=[_repo_json("alpha")], headers={"ETag": '"abc"'}
+        )
+        with GitHubAPIClient(_config(tmp_path, token="token-a")) as client:
+            client.get_repositories()
+
+        with GitHubAPIClient(_config(tmp_path, token="token-b")) as client:
+            client.get_repositories()
+
+        repo_calls = [call for call in responses.calls if "/users/testuser/repos" in call.request.url]
+        assert "If-None-Match" not in repo_calls[-1].request.headers
+
+    @responses.activate
+    def test_export_is_current_after_all_not_modified(self, tmp_path):
+        """Test that an export is current only on a full 304 run with the same options."""
+        dest = tmp_path / "repos.json"
+        responses.add(
+            responses.GET, REPOS_URL, json=[_repo_json("alpha")], headers={"ETag": '"abc"'}
+        )
+        with GitHubAPIClient(_config(tmp_path)) as client:
+            client.get_repositories()
+            assert not client.export_is_current(dest, {"state": "all"})
+            dest.write_text("[]")
+            client.record_export(dest, {"state": "all"})
+
+        responses.replace(responses.GET, REPOS_URL, status=304)
+        with GitHubAPIClient(_config(tmp_path)) as client:
+            client.get_repositories()
+            assert client.export_is_current(dest, {"state": "all"})
+            assert not client.export_is_current(dest, {"state": "open"})